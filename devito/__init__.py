@@ -15,7 +15,7 @@ from devito.types.relational import *  # noqa
 from devito.types.sparse import *  # noqa
 from devito.types.tensor import *  # noqa
 from devito.finite_differences import *  # noqa
-from devito.operator import Operator  # noqa
+from devito.operator import Operator, Checkpointer, compile_all  # noqa
 
 # Other stuff exposed to the user
 from devito.builtins import *  # noqa
@@ -58,8 +58,21 @@ preprocessor = lambda i: bool(i) if isinstance(i, int) else i
 configuration.add('mpi', 0, [0, 1] + list(mpi_registry),
                   preprocessor=preprocessor, callback=reinit_compiler)
 
-# Should Devito run a first-touch Operator upon data allocation?
-configuration.add('first-touch', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+# With MPI, should the sparse data values scattered to the MPI ranks be retained
+# across Operator applications? If so, the data exchange is skipped whenever the
+# sparse data values haven't changed since the last scatter/gather
+configuration.add('sparse-resident', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+
+# Should the interpolation geometry of the SparseFunctions (i.e., the reference
+# grid points and the interpolation coefficients) be precomputed once per Operator
+# application, rather than at every iteration of the time loop?
+configuration.add('sparse-precompute', 0, [0, 1], preprocessor=bool)
+
+# Should Devito run a first-touch Operator upon data allocation? With 'numa', the
+# whole allocated data (i.e., including halo and padding) is first-touched by an
+# Operator with the same parallel loop decomposition as the computational Operators
+configuration.add('first-touch', 0, [0, 1, 'numa'], preprocessor=preprocessor,
+                  impacts_jit=False)
 
 # Should Devito ignore any unknown runtime arguments supplied to Operator.apply(),
 # or rather raise an exception (the default behaviour)?
@@ -77,6 +90,32 @@ configuration.add('log-level', 'INFO', list(logger_registry),
 # and will instead use the custom kernel
 configuration.add('jit-backdoor', 0, [0, 1], preprocessor=bool, impacts_jit=False)
 
+# Setting this to True compiles each efunc into a separate, cached, object file
+configuration.add('jit-split', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+
+# The JIT cache. With 'broadcast', in an MPI run, only rank 0 JIT-compiles the
+# Operators, and the shared objects are then broadcast to all other ranks. Further,
+# shared objects are looked up in (and, if writable, published to) the optional
+# content-addressed `jit-cache-dir`, which may thus be prepopulated and shipped
+configuration.add('jit-cache', 'local', ['local', 'broadcast'], impacts_jit=False)
+configuration.add('jit-cache-dir', None, impacts_jit=False)
+
+# Setting this to True caches the lowered Operators on disk, in `lowering-cache-dir`
+# (by default, a temporary directory), so that constructing an Operator identical
+# to one built by a previous run entirely bypasses lowering
+configuration.add('lowering-cache', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+configuration.add('lowering-cache-dir', None, impacts_jit=False)
+
+# The directory of the files backing the out-of-core Functions, that is those
+# allocated through an MmapAllocator. By default, a directory in /var/tmp, which,
+# unlike the default temporary directory, is normally disk-backed
+configuration.add('ooc-dir', None, impacts_jit=False)
+
+# A memory budget, in bytes, for the data held by the objects in the symbol cache.
+# Upon data allocation, if the budget would be exceeded, the unreferenced objects
+# are evicted. With 0, the budget is unbounded and eviction is heuristic
+configuration.add('cache-budget', 0, preprocessor=int, impacts_jit=False)
+
 # By default unsafe math is allowed as most applications are insensitive to
 # floating-point roundoff errors. Enabling this disables unsafe math
 # optimisations.
@@ -97,12 +136,17 @@ def autotune_callback(val):  # noqa
 
 
 # Setup autotuning
-levels = ['off', 'basic', 'aggressive', 'max']
+levels = ['off', 'basic', 'model', 'aggressive', 'max']
 modes = ['preemptive', 'destructive', 'runtime']
 accepted = levels + [list(i) for i in product(levels, modes)]
 configuration.add('autotuning', 'off', accepted, callback=autotune_callback,
                   impacts_jit=False)
 
+# Should the autotuner reuse the tuned values found in previous sessions, which
+# are stored in an on-disk database? With 'refine', the stored values are only
+# used as the starting point of a new autotuning sweep
+configuration.add('autotuning-db', 'off', ['off', 'on', 'refine'], impacts_jit=False)
+
 # In develop-mode:
 # - Some optimizations may not be applied to the generated code.
 # - The compiler performs more type and value checking
@@ -115,6 +159,16 @@ configuration.add('opt-options', {}, deprecate='dle-options')
 # Setup Operator profiling
 configuration.add('profiling', 'basic', list(profiler_registry), impacts_jit=False)
 
+# The number of events stored by the `trace` profiler. Once exceeded, the oldest
+# events are overwritten
+configuration.add('profiling-trace-size', 2**16, preprocessor=int, impacts_jit=False)
+
+# The events measured by the `counters` profiler through the hardware
+# performance counters, e.g. `cycles,instructions,llc_misses`
+preprocessor = lambda i: tuple(i.split(',')) if isinstance(i, str) else tuple(i)
+configuration.add('profiling-counters', 'cycles,instructions,llc_misses',
+                  preprocessor=preprocessor, impacts_jit=False)
+
 # Initialize `configuration`
 init_configuration()
 
@@ -6,6 +6,7 @@ from cached_property import cached_property
 import cpuinfo
 import numpy as np
 import psutil
+import os
 import re
 
 from devito.logger import warning
@@ -129,9 +130,72 @@ def get_cpu_info():
                 warning("Physical core count autodetection failed")
                 physical = 1
     cpu_info['physical'] = physical
+
+    # Detect the data caches
+    cpu_info['caches'] = get_cpu_caches()
+
     return cpu_info
 
 
+def get_cpu_caches():
+    """
+    Attempt data cache autodetection. Return a dict mapping each cache level
+    to a 2-tuple `(size, nsharing)`, where `size` is the cache size in bytes
+    and `nsharing` is the number of logical cores sharing the cache.
+    """
+    caches = {}
+
+    # Linux exposes the cache hierarchy through sysfs
+    root = '/sys/devices/system/cpu/cpu0/cache'
+    try:
+        indices = [i for i in os.listdir(root) if i.startswith('index')]
+    except OSError:
+        indices = []
+    for i in sorted(indices):
+        try:
+            with open(os.path.join(root, i, 'type'), 'r') as f:
+                if f.read().strip() not in ('Data', 'Unified'):
+                    continue
+            with open(os.path.join(root, i, 'level'), 'r') as f:
+                level = int(f.read())
+            with open(os.path.join(root, i, 'size'), 'r') as f:
+                size = parse_size(f.read())
+            with open(os.path.join(root, i, 'shared_cpu_list'), 'r') as f:
+                nsharing = parse_cpu_list(f.read())
+        except (OSError, ValueError):
+            continue
+        caches[level] = (size, nsharing)
+
+    if not caches:
+        # Fallback: `lscpu`, which doesn't tell how the caches are shared
+        for level, k in [(1, 'L1d cache'), (2, 'L2 cache'), (3, 'L3 cache')]:
+            try:
+                caches[level] = (parse_size(lscpu()[k]), 1)
+            except (KeyError, ValueError):
+                pass
+
+    return caches
+
+
+def parse_size(v):
+    """Convert a string such as '48K' or '1 MiB' into a number of bytes."""
+    v = str(v).strip()
+    match = re.match(r'^(\d+)\s*([KMG]?)(i?B)?', v, re.IGNORECASE)
+    if match is None:
+        raise ValueError("Cannot parse size `%s`" % v)
+    value, unit = int(match.group(1)), match.group(2).upper()
+    return value * {'': 1, 'K': 2**10, 'M': 2**20, 'G': 2**30}[unit]
+
+
+def parse_cpu_list(v):
+    """Count the logical cores in a string such as '0-3,8-11'."""
+    n = 0
+    for i in v.strip().split(','):
+        bounds = i.split('-')
+        n += int(bounds[-1]) - int(bounds[0]) + 1
+    return n
+
+
 @memoized_func
 def get_gpu_info():
     """Attempt GPU info autodetection."""
@@ -378,6 +442,7 @@ class Platform(object):
         self.cores_logical = kwargs.get('cores_logical', cpu_info['logical'])
         self.cores_physical = kwargs.get('cores_physical', cpu_info['physical'])
         self.isa = kwargs.get('isa', self._detect_isa())
+        self.caches = kwargs.get('caches', cpu_info['caches'])
 
     @classmethod
     def _mro(cls):
@@ -409,6 +474,20 @@ class Platform(object):
         assert self.simd_reg_size % np.dtype(dtype).itemsize == 0
         return int(self.simd_reg_size / np.dtype(dtype).itemsize)
 
+    def cache_size(self, level, per_core=True):
+        """
+        Size in bytes of the level-``level`` data cache, or None if unknown.
+        If ``per_core=True``, the size of a shared cache is split evenly among
+        the physical cores sharing it.
+        """
+        try:
+            size, nsharing = self.caches[level]
+        except KeyError:
+            return None
+        if per_core:
+            size //= max(1, nsharing // self.threads_per_core)
+        return size
+
 
 class Cpu64(Platform):
 
@@ -464,6 +543,7 @@ class Device(Platform):
         self.cores_logical = cores_logical
         self.cores_physical = cores_physical
         self.isa = isa
+        self.caches = {}
 
     @classmethod
     def _mro(cls):
@@ -522,7 +602,8 @@ class AmdDevice(Device):
 
 # CPUs
 CPU64 = Cpu64('cpu64')
-CPU64_DUMMY = Intel64('cpu64-dummy', cores_logical=2, cores_physical=1, isa='sse')
+CPU64_DUMMY = Intel64('cpu64-dummy', cores_logical=2, cores_physical=1, isa='sse',
+                      caches={1: (32*2**10, 2), 2: (2**20, 2), 3: (8*2**20, 2)})
 INTEL64 = Intel64('intel64')
 SNB = Intel64('snb')
 IVB = Intel64('ivb')
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from hashlib import sha1
-from os import environ, path
+from os import environ, getpid, path, replace
 from distutils import version
 from subprocess import DEVNULL, PIPE, CalledProcessError, check_output, check_call, run
+from pathlib import Path
+from tempfile import NamedTemporaryFile
 import platform
 import warnings
 import sys
@@ -234,8 +237,11 @@ class Compiler(GCCToolchain):
             debug("%s: `%s` was not saved in `%s` as it already exists"
                   % (self, sofile.name, self.get_jit_dir()))
         else:
-            with open(str(sofile), 'wb') as f:
+            # Written atomically, as other processes (e.g., MPI ranks on the
+            # same node) might be saving or loading the same binary
+            with NamedTemporaryFile('wb', dir=str(sofile.parent), delete=False) as f:
                 f.write(binary)
+            replace(f.name, str(sofile))
             debug("%s: `%s` successfully saved in `%s`"
                   % (self, sofile.name, self.get_jit_dir()))
 
@@ -321,6 +327,196 @@ class Compiler(GCCToolchain):
 
         return recompiled, src_file
 
+    def jit_compile_split(self, soname, units):
+        """
+        JIT compile multiple translation units into a single shared object.
+
+        Each translation unit is compiled into an object file, which is cached
+        based on a hash of its source code and of the compilation command. So,
+        upon changes to a subset of the translation units, only the affected
+        object files are rebuilt. The object files are built in parallel and
+        eventually linked together.
+
+        Parameters
+        ----------
+        soname : str
+            Name of the .so file (w/o the suffix).
+        units : dict
+            Mapper from translation unit names to their source code.
+        """
+        sofile = self.get_jit_dir().joinpath(soname).with_suffix(self.so_ext)
+        if sofile.is_file():
+            return False, str(sofile)
+
+        objdir = self.get_jit_dir().joinpath('objects')
+        objdir.mkdir(parents=True, exist_ok=True)
+
+        cmd = self._cmdline([], object=True)
+
+        def build(code):
+            key = sha1(''.join([code] + cmd).encode()).hexdigest()
+            objfile = objdir.joinpath(key).with_suffix('.o')
+            if objfile.is_file():
+                return objfile
+
+            src_file = objdir.joinpath(key).with_suffix('.%s' % self.src_ext)
+            with NamedTemporaryFile('w', dir=str(objdir), delete=False) as f:
+                f.write(code)
+            replace(f.name, str(src_file))
+
+            # Concurrent builds of the same object file are harmless, as the
+            # object file is written atomically
+            tmp_objfile = '%s.%d.tmp' % (objfile, getpid())
+            self._run(self._cmdline([str(src_file)], object=True) +
+                      ['-o', tmp_objfile])
+            replace(tmp_objfile, str(objfile))
+
+            return objfile
+
+        nworkers = max(1, min(len(units), configuration['platform'].cores_logical))
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            objfiles = list(executor.map(build, units.values()))
+
+        tmp_sofile = '%s.%d.tmp' % (sofile, getpid())
+        self._run(self._cmdline([str(i) for i in objfiles]) + ['-o', tmp_sofile])
+        replace(tmp_sofile, str(sofile))
+
+        return True, str(sofile)
+
+    def jit_build(self, soname, code, comm=None):
+        """
+        Produce the shared object `soname`, going through the JIT cache.
+
+        The shared object is first looked up in the content-addressed cache
+        directory (`jit-cache-dir`), if any. If not found, `code` is JIT compiled
+        and the resulting shared object is published in the cache directory,
+        unless the latter is read-only.
+
+        With the `broadcast` JIT cache, only the root rank in `comm` compiles (or
+        fetches) the shared object, which is then broadcast to all other ranks.
+
+        Parameters
+        ----------
+        soname : str
+            Name of the .so file (w/o the suffix).
+        code : str or dict
+            The source code to be JIT compiled. If a dict, a mapper from
+            translation unit names to source code, compiled via `jit_compile_split`.
+        comm : MPI communicator, optional
+            The communicator used by the `broadcast` JIT cache.
+
+        Returns
+        -------
+        recompiled : bool
+            True if this process JIT compiled `code`, False otherwise.
+        src_file : str
+            The source file, or the shared object if not compiled.
+        """
+        sofile = self.get_jit_dir().joinpath(soname).with_suffix(self.so_ext)
+
+        if comm is not None and comm.size > 1 and \
+           configuration['jit-cache'] == 'broadcast' and \
+           configuration['jit-backdoor'] is False:
+            # Nothing to do if all ranks already own the shared object, e.g.
+            # because it was produced by a previous session
+            if comm.allreduce(int(not sofile.is_file())) == 0:
+                return False, str(sofile)
+
+            if comm.rank == 0:
+                try:
+                    retval = self.jit_build(soname, code)
+                    with open(str(sofile), 'rb') as f:
+                        binary = f.read()
+                except Exception:
+                    # Avoid deadlocking the other ranks
+                    comm.bcast(None, root=0)
+                    raise
+                comm.bcast(binary, root=0)
+                return retval
+            else:
+                binary = comm.bcast(None, root=0)
+                if binary is None:
+                    raise CompilationError("JIT compilation of `%s` failed on "
+                                           "rank 0" % soname)
+                self.save(soname, binary)
+                return False, str(sofile)
+
+        if not sofile.is_file() and self.jit_fetch(soname):
+            return False, str(sofile)
+
+        if isinstance(code, dict):
+            retval = self.jit_compile_split(soname, code)
+        else:
+            retval = self.jit_compile(soname, code)
+
+        self.jit_publish(soname)
+
+        return retval
+
+    def _jit_cache_file(self, soname):
+        """
+        The path of the shared object `soname` within the content-addressed JIT
+        cache directory. Since `soname` is a hash of the generated code and of
+        the code-generation-impacting configuration, the key also accounts for
+        the compiler used to build the shared object.
+        """
+        cache_dir = configuration['jit-cache-dir']
+        if not cache_dir:
+            return None
+        items = [soname, self.__class__.__name__, self.cc, str(self.version)]
+        key = sha1(''.join(items + list(self.cflags)).encode()).hexdigest()
+        return Path(cache_dir).joinpath(key[:2], key).with_suffix(self.so_ext)
+
+    def jit_fetch(self, soname):
+        """
+        Fetch the shared object `soname` from the JIT cache directory, if any.
+
+        Returns
+        -------
+        bool
+            True if the shared object was found, False otherwise.
+        """
+        cachefile = self._jit_cache_file(soname)
+        if cachefile is None or configuration['jit-backdoor'] is not False:
+            return False
+        try:
+            with open(str(cachefile), 'rb') as f:
+                binary = f.read()
+        except OSError:
+            return False
+        self.save(soname, binary)
+        debug("%s: `%s` fetched from `%s`" % (self, soname, cachefile))
+        return True
+
+    def jit_publish(self, soname):
+        """
+        Publish the shared object `soname` in the JIT cache directory, if any.
+        This is a no-op if the cache directory is read-only.
+        """
+        cachefile = self._jit_cache_file(soname)
+        if cachefile is None or configuration['jit-backdoor'] is not False:
+            return
+        sofile = self.get_jit_dir().joinpath(soname).with_suffix(self.so_ext)
+        try:
+            cachefile.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile('wb', dir=str(cachefile.parent), delete=False) as f:
+                with open(str(sofile), 'rb') as so:
+                    f.write(so.read())
+            replace(f.name, str(cachefile))
+        except OSError:
+            debug("%s: couldn't publish `%s` in `%s`" % (self, soname, cachefile))
+
+    def _run(self, command):
+        if configuration['log-level'] == 'DEBUG':
+            debug(" ".join(command))
+        try:
+            run(command, stdout=PIPE, stderr=PIPE, check=True)
+        except CalledProcessError as e:
+            raise CompilationError('Command "%s" return error status %d. '
+                                   'Unable to compile code.\n%s' %
+                                   (" ".join(e.cmd), e.returncode,
+                                    e.stderr.decode('utf-8', 'replace')))
+
     def __lookup_cmds__(self):
         self.CC = 'unknown'
         self.CXX = 'unknown'
@@ -1,11 +1,12 @@
 import numpy as np
-from sympy import Abs, Pow
+from sympy import Abs, Pow, Tuple, sqrt
 
 import devito as dv
-from devito.builtins.utils import MPIReduction
+from devito.builtins.utils import (MPIReduction, is_serial_reduction, reductions,
+                                   sum_of_products)
 
 
-__all__ = ['norm', 'sumall', 'inner', 'mmin', 'mmax']
+__all__ = ['norm', 'sumall', 'inner', 'mmin', 'mmax', 'stats']
 
 
 @dv.switchconfig(log_level='ERROR')
@@ -20,24 +21,34 @@ def norm(f, order=2):
     order : int, optional
         The order of the norm. Defaults to 2.
     """
+    if is_serial_reduction(f):
+        data = f.data_ro_domain
+        if order == 2:
+            v = sum_of_products(data, data)
+        else:
+            v = np.sum(np.abs(data)**order)
+        return f.dtype(Pow(v, 1/order))
+
     kwargs = {}
     if f.is_TimeFunction and f._time_buffering:
         kwargs[f.time_dim.max_name] = f._time_size - 1
 
-    # Protect SparseFunctions from accessing duplicated (out-of-domain) data,
-    # otherwise we would eventually be summing more than expected
-    p, eqns = f.guard() if f.is_SparseFunction else (f, [])
+    def make_eqns(functions, n):
+        f, = functions
+
+        # Protect SparseFunctions from accessing duplicated (out-of-domain) data,
+        # otherwise we would eventually be summing more than expected
+        p, eqns = f.guard() if f.is_SparseFunction else (f, [])
+
+        s = dv.types.Scalar(name='sum', dtype=f.dtype)
 
-    s = dv.types.Scalar(name='sum', dtype=f.dtype)
+        return ([dv.Eq(s, 0.0)] +
+                eqns +
+                [dv.Inc(s, Abs(Pow(p, order))), dv.Eq(n[0], s)])
 
-    with MPIReduction(f) as mr:
-        op = dv.Operator([dv.Eq(s, 0.0)] +
-                         eqns +
-                         [dv.Inc(s, Abs(Pow(p, order))), dv.Eq(mr.n[0], s)],
-                         name='norm%d' % order)
-        op.apply(**kwargs)
+    v = reductions.apply('norm%d' % order, [f], make_eqns, **kwargs)
 
-    v = Pow(mr.v, 1/order)
+    v = Pow(v, 1/order)
 
     return f.dtype(v)
 
@@ -51,24 +62,27 @@ def sumall(f):
     f : Function
         Input Function.
     """
+    if is_serial_reduction(f):
+        return f.dtype(np.sum(f.data_ro_domain))
+
     kwargs = {}
     if f.is_TimeFunction and f._time_buffering:
         kwargs[f.time_dim.max_name] = f._time_size - 1
 
-    # Protect SparseFunctions from accessing duplicated (out-of-domain) data,
-    # otherwise we would eventually be summing more than expected
-    p, eqns = f.guard() if f.is_SparseFunction else (f, [])
+    def make_eqns(functions, n):
+        f, = functions
+
+        # Protect SparseFunctions from accessing duplicated (out-of-domain) data,
+        # otherwise we would eventually be summing more than expected
+        p, eqns = f.guard() if f.is_SparseFunction else (f, [])
 
-    s = dv.types.Scalar(name='sum', dtype=f.dtype)
+        s = dv.types.Scalar(name='sum', dtype=f.dtype)
 
-    with MPIReduction(f) as mr:
-        op = dv.Operator([dv.Eq(s, 0.0)] +
-                         eqns +
-                         [dv.Inc(s, p), dv.Eq(mr.n[0], s)],
-                         name='sum')
-        op.apply(**kwargs)
+        return [dv.Eq(s, 0.0)] + eqns + [dv.Inc(s, p), dv.Eq(n[0], s)]
 
-    return f.dtype(mr.v)
+    v = reductions.apply('sum', [f], make_eqns, **kwargs)
+
+    return f.dtype(v)
 
 
 def inner(f, g):
@@ -105,24 +119,27 @@ def inner(f, g):
     if f.is_SparseFunction and not np.all(f.coordinates_data == g.coordinates_data):
         raise ValueError("Non-matching coordinates")
 
+    if is_serial_reduction(f, g):
+        return f.dtype(sum_of_products(f.data_ro_domain, g.data_ro_domain))
+
     kwargs = {}
     if f.is_TimeFunction and f._time_buffering:
         kwargs[f.time_dim.max_name] = f._time_size - 1
 
-    # Protect SparseFunctions from accessing duplicated (out-of-domain) data,
-    # otherwise we would eventually be summing more than expected
-    rhs, eqns = f.guard(f*g) if f.is_SparseFunction else (f*g, [])
+    def make_eqns(functions, n):
+        f, g = functions
 
-    s = dv.types.Scalar(name='sum', dtype=f.dtype)
+        # Protect SparseFunctions from accessing duplicated (out-of-domain) data,
+        # otherwise we would eventually be summing more than expected
+        rhs, eqns = f.guard(f*g) if f.is_SparseFunction else (f*g, [])
 
-    with MPIReduction(f, g) as mr:
-        op = dv.Operator([dv.Eq(s, 0.0)] +
-                         eqns +
-                         [dv.Inc(s, rhs), dv.Eq(mr.n[0], s)],
-                         name='inner')
-        op.apply(**kwargs)
+        s = dv.types.Scalar(name='sum', dtype=f.dtype)
 
-    return f.dtype(mr.v)
+        return [dv.Eq(s, 0.0)] + eqns + [dv.Inc(s, rhs), dv.Eq(n[0], s)]
+
+    v = reductions.apply('inner', [f, g], make_eqns, **kwargs)
+
+    return f.dtype(v)
 
 
 def mmin(f):
@@ -136,6 +153,8 @@ def mmin(f):
     """
     if isinstance(f, dv.Constant):
         return f.data
+    elif is_serial_reduction(f):
+        return np.min(f.data_ro_domain).item()
     elif isinstance(f, dv.types.dense.DiscreteFunction):
         with MPIReduction(f, op=dv.mpi.MPI.MIN) as mr:
             mr.n.data[0] = np.min(f.data_ro_domain).item()
@@ -155,9 +174,103 @@ def mmax(f):
     """
     if isinstance(f, dv.Constant):
         return f.data
+    elif is_serial_reduction(f):
+        return np.max(f.data_ro_domain).item()
     elif isinstance(f, dv.types.dense.DiscreteFunction):
         with MPIReduction(f, op=dv.mpi.MPI.MAX) as mr:
             mr.n.data[0] = np.max(f.data_ro_domain).item()
         return mr.v.item()
     else:
         raise ValueError("Expected Function, not `%s`" % type(f))
+
+
+@dv.switchconfig(log_level='ERROR')
+def stats(f, *functions):
+    """
+    Compute several statistics of a Function at once.
+
+    Unlike calling ``norm``, ``sumall``, ``mmin``, ``mmax`` and ``inner`` one
+    after the other, the data is streamed through memory only once, in a single
+    loop nest, and all statistics are reduced across MPI ranks through a single
+    collective communication.
+
+    Parameters
+    ----------
+    f : Function
+        Input Function.
+    *functions : Function, optional
+        Functions to compute the inner product of ``f`` with.
+
+    Returns
+    -------
+    dict
+        The L1, L2 and Linf norms, the sum, the minimum and the maximum of ``f``,
+        under the keys 'l1', 'l2', 'linf', 'sum', 'min' and 'max'. If any
+        ``functions`` are provided, the key 'inner' gives the tuple of the inner
+        products of ``f`` with each of them.
+
+    Examples
+    --------
+    >>> from devito import Grid, Function, stats
+    >>> grid = Grid(shape=(4, 4))
+    >>> f = Function(name='f', grid=grid)
+    >>> g = Function(name='g', grid=grid)
+    >>> f.data[:] = -1.
+    >>> g.data[:] = 2.
+    >>> v = stats(f, g)
+    >>> v['l1'], v['max'], v['inner']
+    (16.0, -1.0, (-32.0,))
+    """
+    for g in functions:
+        if f.is_TimeFunction and f._time_buffering != g._time_buffering:
+            raise ValueError("Cannot compute `stats` between save/nosave "
+                             "TimeFunctions")
+        if f.shape != g.shape:
+            raise ValueError("`f` and `g` must have same shape")
+        if f.is_SparseFunction and not np.all(f.coordinates_data == g.coordinates_data):
+            raise ValueError("Non-matching coordinates")
+
+    kwargs = {}
+    if f.is_TimeFunction and f._time_buffering:
+        kwargs[f.time_dim.max_name] = f._time_size - 1
+
+    def make_eqns(functions, n):
+        f = functions[0]
+
+        exprs = Tuple(f, *[f*g for g in functions[1:]])
+
+        # Protect SparseFunctions from accessing duplicated (out-of-domain) data,
+        # otherwise we would eventually be summing more than expected
+        exprs, eqns = f.guard(exprs) if f.is_SparseFunction else (exprs, [])
+
+        p = exprs[0]
+        if np.issubdtype(f.dtype, np.integer):
+            info = np.iinfo(f.dtype)
+        else:
+            info = np.finfo(f.dtype)
+
+        reducers = [(dv.Inc, Abs(p), 0),
+                    (dv.Inc, p*p, 0),
+                    (dv.Inc, p, 0),
+                    (dv.ReduceMin, p, info.max),
+                    (dv.ReduceMax, p, info.min)]
+        reducers.extend([(dv.Inc, i, 0) for i in exprs[1:]])
+
+        for i, (cls, rhs, v) in enumerate(reducers):
+            s = dv.types.Scalar(name='s%d' % i, dtype=f.dtype)
+            eqns = [dv.Eq(s, v)] + eqns + [cls(s, rhs), dv.Eq(n[i], s)]
+
+        return eqns
+
+    ops = [dv.mpi.MPI.SUM]*3 + [dv.mpi.MPI.MIN, dv.mpi.MPI.MAX]
+    ops.extend([dv.mpi.MPI.SUM]*len(functions))
+
+    v = reductions.apply('stats', [f] + list(functions), make_eqns, op=ops, **kwargs)
+    v = [f.dtype(i) for i in v]
+
+    ret = {'l1': v[0], 'l2': f.dtype(sqrt(v[1])), 'linf': max(abs(v[3]), abs(v[4])),
+           'sum': v[2], 'min': v[3], 'max': v[4]}
+    if functions:
+        ret['inner'] = tuple(v[5:])
+
+    return ret
@@ -1,10 +1,11 @@
 import numpy as np
 
 import devito as dv
+from devito.data.allocators import ExternalAllocator
 from devito.tools import as_tuple, as_list
 from devito.builtins.utils import nbl_to_padsize, pad_outhalo
 
-__all__ = ['assign', 'smooth', 'gaussian_smooth', 'initialize_function']
+__all__ = ['assign', 'first_touch', 'smooth', 'gaussian_smooth', 'initialize_function']
 
 
 def assign(f, rhs=0, options=None, name='assign', **kwargs):
@@ -64,6 +65,48 @@ def assign(f, rhs=0, options=None, name='assign', **kwargs):
     dv.Operator(eqs, name=name, **kwargs)()
 
 
+def first_touch(f):
+    """
+    Zero-initialize all of the allocated data of a Function, including the halo
+    and the padding regions, through a multi-threaded Operator.
+
+    The Operator is produced by the same compilation pipeline as any other, so
+    its outermost parallel loop has the same decomposition (loop blocking, OpenMP
+    chunking) as those of the Operators subsequently using ``f``. Thus, with
+    threads pinned to cores (e.g., via ``OMP_PROC_BIND``), each page of ``f``
+    is placed, by the first-touch policy, on the NUMA node of the thread that
+    will later access it.
+
+    Parameters
+    ----------
+    f : Function
+        The Function whose data is initialized.
+
+    Notes
+    -----
+    The Operator uses static scheduling, since it is the only one yielding a
+    deterministic mapping from iterations to threads. The match is therefore
+    exact with Operators using static scheduling too (see the ``par-dynamic-work``
+    option), while only approximate otherwise.
+    """
+    # An alias of `f`, without halo and padding, over the whole allocated data.
+    # Derived Dimensions (e.g., a ConditionalDimension for a subsampled
+    # TimeFunction) are replaced by their roots, which are iterated over directly
+    data = np.asarray(f._data)
+    dimensions = [d.root for d in f.dimensions]
+    alias = dv.Function(name='%s_ft' % f.name, shape=data.shape,
+                        dimensions=dimensions, dtype=f.dtype, space_order=0,
+                        allocator=ExternalAllocator(data), first_touch=False,
+                        initializer=lambda x: None)
+
+    op = dv.Operator(dv.Eq(alias, 0), name='first_touch',
+                     opt=('advanced', {'par-dynamic-work': np.inf}))
+
+    # The time bounds aren't inferred from the data shape
+    op.apply(**{d.max_name: n - 1 for d, n in zip(alias.dimensions, data.shape)
+                if d.is_Time})
+
+
 def smooth(f, g, axis=None):
     """
     Smooth a Function through simple moving average.
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import numpy as np
 
 import devito as dv
@@ -7,6 +9,14 @@ from devito.tools import as_tuple
 class MPIReduction(object):
     """
     A context manager to build MPI-aware reduction Operators.
+
+    The same MPIReduction may be entered multiple times, e.g. to reuse an
+    Operator built in a previous context; the reduction buffer is reset upon
+    entering.
+
+    If ``op`` is a list of MPI operations, the reduction buffer ``n`` has one
+    entry per operation, and all entries are reduced through a single collective
+    communication; ``v`` is then an array with one reduced value per entry.
     """
 
     def __init__(self, *functions, op=dv.mpi.MPI.SUM):
@@ -22,18 +32,33 @@ class MPIReduction(object):
             self.dtype = dtype.pop()
         else:
             raise ValueError("Illegal mixed data types")
+        self.n = None
         self.v = None
         self.op = op
 
     def __enter__(self):
-        i = dv.Dimension(name='i',)
-        self.n = dv.Function(name='n', shape=(1,), dimensions=(i,),
-                             grid=self.grid, dtype=self.dtype)
-        self.n.data[0] = 0
+        if self.n is None:
+            i = dv.Dimension(name='i',)
+            size = len(self.op) if isinstance(self.op, (list, tuple)) else 1
+            self.n = dv.Function(name='n', shape=(size,), dimensions=(i,),
+                                 grid=self.grid, dtype=self.dtype)
+        self.n.data[:] = 0
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        if self.grid is None or not dv.configuration['mpi']:
+        if isinstance(self.op, list):
+            if self.grid is None or not dv.configuration['mpi']:
+                self.v = np.array(self.n.data)
+            else:
+                comm = self.grid.distributor.comm
+                sendbuf = np.ascontiguousarray(self.n.data, dtype=self.dtype)
+                self.v = np.empty_like(sendbuf)
+                op = packed_op(self.op, self.dtype)
+                try:
+                    comm.Allreduce(sendbuf, self.v, op=op)
+                finally:
+                    op.Free()
+        elif self.grid is None or not dv.configuration['mpi']:
             assert self.n.data.size == 1
             self.v = self.n.data[0]
         else:
@@ -41,6 +66,139 @@ class MPIReduction(object):
             self.v = comm.allreduce(np.asarray(self.n.data), self.op)[0]
 
 
+def mpi_to_numpy(op):
+    """The NumPy ufunc equivalent to the MPI operation ``op``."""
+    for k, v in [(dv.mpi.MPI.SUM, np.add), (dv.mpi.MPI.MAX, np.maximum),
+                 (dv.mpi.MPI.MIN, np.minimum), (dv.mpi.MPI.PROD, np.multiply)]:
+        if op == k:
+            return v
+    raise ValueError("Unsupported MPI operation `%s`" % op)
+
+
+def packed_op(ops, dtype):
+    """
+    A user-defined MPI operation applying, entry by entry, the MPI operations
+    ``ops`` to a packed buffer of type ``dtype``, so that values requiring
+    different reductions may be reduced through a single collective. The caller
+    is responsible for freeing the returned operation.
+    """
+    ufuncs = [mpi_to_numpy(op) for op in ops]
+
+    def reduce(inbuf, inoutbuf, datatype):
+        invalues = np.frombuffer(inbuf, dtype=dtype)
+        inoutvalues = np.frombuffer(inoutbuf, dtype=dtype)
+        for i, ufunc in enumerate(ufuncs):
+            inoutvalues[i] = ufunc(invalues[i], inoutvalues[i])
+
+    return dv.mpi.MPI.Op.Create(reduce, commute=True)
+
+
+class ReductionCache(object):
+
+    """
+    A cache of reusable reduction Operators.
+
+    The Operators are built over placeholder Functions, which carry no data,
+    and are then applied to any Function with the same type, shape, dtype, halo
+    and Distributor by passing it as an argument override. Thus, for example,
+    taking the norm of several wavefields over the same Grid only requires
+    lowering and JIT-compiling a single Operator.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._mapper = OrderedDict()
+
+    @classmethod
+    def _key(cls, f):
+        try:
+            distributor = f.grid.distributor
+        except AttributeError:
+            distributor = None
+        # The sparse Dimension is specific to each SparseFunction, hence dropped
+        dimensions = tuple(d for d in f.dimensions
+                           if d is not getattr(f, '_sparse_dim', None))
+        return (f._pickle_reconstruct, f.shape, f.dtype, f.halo, dimensions,
+                f.staggered, getattr(f, 'save', None), distributor)
+
+    @classmethod
+    def _placeholder(cls, f, name):
+        """A data-less Function with the same type and layout as ``f``."""
+        args, kwargs = f.__getnewargs_ex__()
+        kwargs.pop('initializer', None)
+        kwargs['name'] = name
+        return f._pickle_reconstruct(*args, **kwargs)
+
+    def apply(self, name, functions, make_eqns, op=dv.mpi.MPI.SUM, **kwargs):
+        """
+        Run the reduction ``name`` over ``functions`` and return the reduced value.
+
+        Parameters
+        ----------
+        name : str
+            The name of the reduction, which is also the name of the Operator.
+        functions : list of Function
+            The input Functions.
+        make_eqns : callable
+            Invoked as ``make_eqns(placeholders, n)`` upon the first reduction
+            for a given key, it must return the equations reducing the
+            placeholder Functions into ``n[0]``.
+        op : MPI.Op or list of MPI.Op, optional
+            The MPI reduction operation(s). Defaults to ``MPI.SUM``. See
+            ``MPIReduction`` for the semantics of a list of operations.
+        **kwargs
+            Additional arguments passed to the Operator.
+        """
+        key = (name,) + tuple(self._key(f) for f in functions)
+        try:
+            operator, placeholders, mr = self._mapper.pop(key)
+        except KeyError:
+            placeholders = [self._placeholder(f, 'f%d' % n)
+                            for n, f in enumerate(functions)]
+            mr = MPIReduction(*placeholders, op=op)
+            with mr:
+                operator = dv.Operator(make_eqns(placeholders, mr.n), name=name)
+        self._mapper[key] = (operator, placeholders, mr)
+        while len(self._mapper) > self.maxsize:
+            self._mapper.popitem(last=False)
+
+        kwargs.update({p.name: f for p, f in zip(placeholders, functions)})
+        with mr:
+            operator.apply(**kwargs)
+
+        return mr.v
+
+    def clear(self):
+        self._mapper.clear()
+
+
+reductions = ReductionCache()
+
+
+def is_serial_reduction(*functions):
+    """
+    True if a reduction over ``functions`` may be carried out directly over
+    their data with NumPy, that is if no halo or MPI handling is needed.
+    """
+    for f in functions:
+        if not isinstance(f, dv.types.dense.DiscreteFunction) or f.is_SparseFunction:
+            return False
+        if f.grid is not None and f.grid.distributor.nprocs > 1:
+            return False
+    return True
+
+
+def sum_of_products(*arrays):
+    """
+    Sum of all element-wise products of ``arrays`` without any intermediate
+    array, even in the case of non-contiguous views.
+    """
+    ndim = {a.ndim for a in arrays}
+    assert len(ndim) == 1
+    indices = ''.join(chr(ord('a') + i) for i in range(ndim.pop()))
+    return np.einsum('%s->' % ','.join([indices]*len(arrays)), *arrays)
+
+
 def nbl_to_padsize(nbl, ndim):
     """
     Creates the pad sizes from `nbl`. The output is a tuple of tuple
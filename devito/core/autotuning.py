@@ -1,17 +1,33 @@
 from collections import OrderedDict
+from contextlib import contextmanager
 from itertools import combinations, product
 from functools import total_ordering
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+import json
+import os
+import time
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on all platforms
+    fcntl = None
 
 from devito.arch import KNL, KNL7210
-from devito.ir import Backward, retrieve_iteration_tree
+from devito.ir import (Backward, Call, FindNodes, FindSymbols, Iteration, Section,
+                       retrieve_iteration_tree)
 from devito.logger import perf, warning as _warning
 from devito.mpi.distributed import MPI, MPINeighborhood
 from devito.mpi.routines import MPIMsgEnriched
 from devito.parameters import configuration
+from devito.symbolics import subs_op_args
 from devito.tools import filter_ordered, flatten, is_integer, prod
 from devito.types import Timer
 
-__all__ = ['autotune']
+__all__ = ['autotune', 'autotune_cire', 'AutotuningDB']
 
 
 def autotune(operator, args, level, mode):
@@ -25,9 +41,11 @@ def autotune(operator, args, level, mode):
     args : dict_like
         The runtime arguments with which `operator` is run.
     level : str
-        The autotuning aggressiveness (basic, aggressive, max). A more
+        The autotuning aggressiveness (basic, model, aggressive, max). A more
         aggressive autotuning might eventually result in higher runtime
-        performance, but the autotuning phase will take longer.
+        performance, but the autotuning phase will take longer. With `model`,
+        the `aggressive` search space is pruned through a performance model,
+        and only the most promising candidates are run.
     mode : str
         The autotuning mode (preemptive, runtime). In preemptive mode, the
         output runtime values supplied by the user to `operator.apply` are
@@ -39,6 +57,25 @@ def autotune(operator, args, level, mode):
         raise ValueError("The accepted `(level, mode)` combinations are `%s`; "
                          "provided `%s` instead" % (accepted, key))
 
+    # Maybe the Operator has already been tuned in a previous session. With MPI,
+    # the database is accessed collectively, as the ranks must agree on whether
+    # to perform the autotuning sweep
+    grids = filter_ordered(i.grid for i in operator.input
+                           if getattr(i, 'grid', None) is not None)
+    comm = grids[0].comm if grids else None
+    db = configuration['autotuning-db']
+    if db != 'off':
+        dbkey = AutotuningDB.make_key(operator, args)
+        entry = AutotuningDB().lookup(dbkey, level if db == 'on' else None, args,
+                                      comm=comm)
+        if entry is not None and db == 'on':
+            args.update(entry['tuned'])
+            log("selected <%s> from the autotuning database" %
+                (','.join('%s=%s' % i for i in entry['tuned'].items())))
+            return args, {'runs': 0, 'tpr': 0, 'tuned': dict(entry['tuned'])}
+    else:
+        entry = None
+
     # We get passed all the arguments, but the cfunction only requires a subset
     at_args = OrderedDict([(p.name, args[p.name]) for p in operator.parameters])
 
@@ -69,14 +106,16 @@ def autotune(operator, args, level, mode):
     trees = filter_ordered(retrieve_iteration_tree(roots), key=lambda i: i.root)
 
     # Detect the time-stepping Iteration; shrink its iteration range so that
-    # each autotuning run only takes a few iterations
-    steppers = {i for i in flatten(trees) if i.dim.is_Time}
+    # each autotuning run only takes a few iterations. With time tiling, the
+    # Iteration over the time tiles is not a time-stepping Iteration
+    steppers = {i for i in flatten(trees) if i.dim.is_Time and not i.dim.is_Incr}
+    timetiled = any(i.dim.is_Incr and i.dim.root.is_Time for i in flatten(trees))
     if len(steppers) == 0:
         stepper = None
         timesteps = 1
     elif len(steppers) == 1:
         stepper = steppers.pop()
-        timesteps = init_time_bounds(stepper, at_args, args)
+        timesteps = init_time_bounds(stepper, at_args, args, timetiled)
         if timesteps is None:
             return args, {}
     else:
@@ -88,6 +127,7 @@ def autotune(operator, args, level, mode):
     at_args.update(timer._arg_values())
 
     # Perform autotuning
+    runs = 0
     timings = {}
     for n, tree in enumerate(trees):
         blockable = [i.dim for i in tree if not is_integer(i.step)]
@@ -102,10 +142,32 @@ def autotune(operator, args, level, mode):
             # Some arguments are compulsory, otherwise autotuning is skipped
             continue
 
-        # Symbolic number of loop-blocking blocks per thread
-        nblocks_per_thread = calculate_nblocks(tree, blockable) / operator.nthreads
-
-        for bs, nt in tunable:
+        # Symbolic number of loop-blocking blocks per thread. Time tiles are
+        # traversed sequentially, with parallelism within each tile, so then
+        # there's no such constraint
+        if any(d.root.is_Time for d in blockable):
+            nblocks_per_thread = None
+        else:
+            nblocks_per_thread = calculate_nblocks(tree, blockable) / operator.nthreads
+
+        # Only the most promising candidates, according to a performance model,
+        # are actually run
+        if level == 'model':
+            if not configuration['develop-mode'] and nblocks_per_thread is not None:
+                tunable = [(bs, nt) for bs, nt in tunable
+                           if nblocks_per_thread.subs(dict(bs + nt)).subs(args) >= 1]
+            tunable = rank_candidates(operator, tree, blockable, tunable, args)
+            tunable = tunable[:options['model-topk']]
+
+        # When refining, the previously tuned values are always attempted
+        if entry is not None and tunable:
+            seed = tuple(tuple((k, entry['tuned'].get(k, v)) for k, v in i)
+                         for i in tunable[0])
+            if seed not in tunable:
+                tunable.insert(0, seed)
+
+        elapsed_map = {}
+        for bs, nt in schedule(tunable, elapsed_map, level):
             # Can we safely autotune over the given time range?
             if not check_time_bounds(stepper, at_args, args, mode):
                 break
@@ -115,15 +177,19 @@ def autotune(operator, args, level, mode):
             at_args.update(dict(run))
 
             # Drop run if not at least one block per thread
-            if not configuration['develop-mode'] and nblocks_per_thread.subs(at_args) < 1:
+            if not configuration['develop-mode'] and \
+                    nblocks_per_thread is not None and \
+                    nblocks_per_thread.subs(at_args) < 1:
                 continue
 
             # Run the Operator
             operator.cfunction(*list(at_args.values()))
 
             # Record timing
-            elapsed = timer.total
+            elapsed = min(timer.total, elapsed_map.get((bs, nt), timer.total))
+            elapsed_map[(bs, nt)] = elapsed
             timings.setdefault(nt, OrderedDict()).setdefault(n, {})[bs] = elapsed
+            runs += 1
             log("run <%s> took %f (s) in %d timesteps" %
                 (','.join('%s=%s' % i for i in run), elapsed, timesteps))
 
@@ -134,14 +200,13 @@ def autotune(operator, args, level, mode):
     # The best variant is the one that for a given number of threads had the minium
     # turnaround time
     try:
-        runs = 0
         mapper = {}
         for k, v in timings.items():
             for i in v.values():
-                runs += len(i)
                 record = mapper.setdefault(k, Record())
                 record.add(min(i, key=i.get), min(i.values()))
         best = min(mapper, key=mapper.get)
+        elapsed = mapper[best].time
         best = OrderedDict(best + tuple(mapper[best].args))
         best.pop(None, None)
         log("selected <%s>" % (','.join('%s=%s' % i for i in best.items())))
@@ -152,6 +217,13 @@ def autotune(operator, args, level, mode):
     # Update the argument list with the tuned arguments
     args.update(best)
 
+    # Make the tuned arguments available to future sessions. When refining, the
+    # previously tuned values were attempted too, so the entry's level is kept
+    if db != 'off':
+        if entry is not None:
+            level = max(level, entry['level'], key=levels.index)
+        AutotuningDB().store(dbkey, level, best, elapsed, comm=comm)
+
     # In `runtime` mode, some timesteps have been executed already, so we must
     # adjust the time range
     finalize_time_bounds(stepper, at_args, args, mode)
@@ -165,6 +237,316 @@ def autotune(operator, args, level, mode):
     return args, summary
 
 
+def autotune_cire(operator, build):
+    """
+    Empirical selection of the CIRE variant of an Operator.
+
+    Several variants of `operator`, differing in the CIRE schedule as well
+    as in the `cire-rotate` and `min-storage` options, are lowered, jit-compiled
+    and run for a few timesteps over the default runtime arguments. The fastest
+    variant is returned. The choice is remembered for the rest of the session
+    and, if the autotuning database is enabled, for future sessions too.
+
+    Parameters
+    ----------
+    operator : Operator
+        The Operator obtained through the default, heuristic CIRE selection.
+    build : callable
+        Lower a variant of `operator`, given a dict of optimization options
+        overriding the original ones.
+    """
+    args = operator._prepare_arguments(autotune=False)
+
+    # Maybe a variant has already been selected, in this or a previous session.
+    # With MPI, the ranks may have different keys (the local shapes may differ),
+    # so rank 0 makes the decision on behalf of all ranks
+    key = 'cire-%s' % AutotuningDB.make_key(operator, args)
+    db = configuration['autotuning-db']
+    tuned = None
+    if not is_collective(args.comm) or args.comm.rank == 0:
+        tuned = cire_selections.get(key)
+        if tuned is None and db != 'off':
+            entry = AutotuningDB().lookup(key)
+            if entry is not None:
+                tuned = entry['tuned']
+    if is_collective(args.comm):
+        tuned = args.comm.bcast(tuned, root=0)
+    if tuned is not None:
+        log("selected CIRE variant <%s> from a previous run" %
+            (','.join('%s=%s' % i for i in tuned.items()) or 'heuristic'))
+        cire_selections[key] = tuned
+        if tuned:
+            operator = build(tuned)
+        operator._state['cire-select'] = {'runs': 0, 'tuned': dict(tuned)}
+        return operator
+
+    # Lower all variants, dropping those leading to identical code
+    variants = OrderedDict([(operator._soname, ({}, operator))])
+    for v in generate_cire_variants():
+        op = build(v)
+        variants.setdefault(op._soname, (v, op))
+
+    timings = OrderedDict()
+    for v, op in variants.values():
+        elapsed = time_variant(op)
+        if elapsed is None:
+            return operator
+        timings[op._soname] = elapsed
+        log("CIRE variant <%s> took %f (s)" %
+            (','.join('%s=%s' % i for i in v.items()) or 'heuristic', elapsed))
+
+    soname = min(timings, key=timings.get)
+    tuned, operator = variants[soname]
+    log("selected CIRE variant <%s>" %
+        (','.join('%s=%s' % i for i in tuned.items()) or 'heuristic'))
+
+    cire_selections[key] = tuned
+    if db != 'off':
+        AutotuningDB().store(key, 'cire', tuned, timings[soname], comm=args.comm)
+
+    operator._state['cire-select'] = {'runs': len(timings), 'tuned': dict(tuned)}
+
+    return operator
+
+
+def generate_cire_variants():
+    """
+    The optimization options of the CIRE variants explored by `autotune_cire`.
+    """
+    ret = []
+    for variant, rotate, minstorage in product(options['cire-variants'],
+                                               (False, True), (False, True)):
+        ret.append({'cire-variant': variant, 'cire-rotate': rotate,
+                    'min-storage': minstorage})
+    return ret
+
+
+def time_variant(operator):
+    """
+    Run `operator` for a few timesteps, over shadow copies of its output
+    Functions. Return the minimum time out of `options['cire-runs']` runs,
+    or None if there are too few timesteps to run.
+    """
+    args = operator._prepare_arguments(autotune=False)
+
+    # Shrink the iteration range along time, if any
+    kwargs = {'autotune': False}
+    for d in operator.dimensions:
+        if d.is_Time and not d.is_Derived:
+            m = args[d.min_name]
+            M = args.get(d.max_name)
+            if m is None:
+                warning("cannot run the CIRE variants without `%s`; skipping"
+                        % d.min_name)
+                return None
+            kwargs[d.min_name] = m
+            kwargs[d.max_name] = m + options['squeezer'] if M is None else \
+                min(M, m + options['squeezer'])
+    args = operator.arguments(**kwargs)
+
+    # We get passed all the arguments, but the cfunction only requires a subset
+    at_args = OrderedDict([(p.name, args[p.name]) for p in operator.parameters])
+
+    # User-provided output data must not be altered
+    output = {i.name: i for i in operator.output}
+    copies = {k: output[k]._C_as_ndarray(v).copy()
+              for k, v in args.items() if k in output}
+    at_args.update({k: output[k]._C_make_dataobj(v) for k, v in copies.items()})
+
+    # Use a fresh Timer
+    timer = Timer('timers', list(operator._profiler.all_sections))
+    at_args.update(timer._arg_values())
+
+    elapsed = np.inf
+    for _ in range(options['cire-runs']):
+        operator.cfunction(*list(at_args.values()))
+        elapsed = min(elapsed, timer.total)
+        timer.reset()
+
+    # Release any resource (e.g., MPI buffers) allocated for the runs
+    operator._postprocess_arguments(args)
+
+    # All ranks must select the same variant
+    if args.comm is not MPI.COMM_NULL:
+        elapsed = args.comm.allreduce(elapsed, op=MPI.MAX)
+
+    return elapsed
+
+
+cire_selections = {}
+"""The CIRE variants selected so far in this session."""
+
+
+class AutotuningDB(object):
+
+    """
+    A persistent, on-disk database of autotuning results.
+
+    Each entry is keyed on the Operator signature (i.e., its `_soname`), the
+    target platform, the number of threads and the local grid shape, and stores
+    the tuned arguments alongside the autotuning level with which they were
+    found. By default, the database lives next to the jit-compiled objects.
+
+    Parameters
+    ----------
+    path : str, optional
+        The database file. Defaults to `options['db-path']` or, if unset, to a
+        file within the jit cache directory.
+
+    Notes
+    -----
+    Under MPI, the lookups and the updates are performed by rank 0 only, on
+    behalf of all ranks; thus, all ranks agree on whether a valid entry exists,
+    and they all use the same tuned arguments.
+
+    An entry is invalidated, and therefore ignored upon lookup, if it was
+    produced by a different Devito version, if it was produced by a less
+    aggressive autotuning level than the one requested, if any of its tuned
+    arguments isn't an Operator argument anymore, or if it's older than
+    `options['db-maxage']` seconds (if set).
+    """
+
+    _filename = 'autotuning.json'
+
+    def __init__(self, path=None):
+        path = path or options['db-path']
+        if path is None:
+            path = Path(configuration['compiler'].get_jit_dir()).joinpath(self._filename)
+        self.path = Path(path)
+
+    def __repr__(self):
+        return "AutotuningDB[%s]" % self.path
+
+    @classmethod
+    def make_key(cls, operator, args):
+        """
+        The database key of an Operator about to run with the runtime
+        arguments `args`.
+        """
+        nthreads = operator.nthreads
+        if nthreads != 1:
+            nthreads = args[nthreads.name]
+
+        grids = filter_ordered(i.grid for i in operator.input
+                               if getattr(i, 'grid', None) is not None)
+        shape = []
+        for grid in grids:
+            try:
+                shape.append(tuple(args[d.max_name] - args[d.min_name] + 1
+                                   for d in grid.dimensions))
+            except KeyError:
+                shape.append(grid.shape_local)
+
+        return '%s-%s-%d-%s' % (operator._soname, configuration['platform'],
+                                nthreads, 'x'.join(str(i) for i in flatten(shape)))
+
+    def _load(self):
+        try:
+            with open(str(self.path), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            warning("ignoring corrupted autotuning database `%s`" % self.path)
+            return {}
+
+    @contextmanager
+    def _lock(self):
+        # Serialize the read-modify-write updates, as concurrent processes
+        # (e.g., independent runs) may be updating the same database
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open('%s.lock' % self.path, 'w') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _dump(self, data):
+        # Atomic update, so that concurrent readers only ever see complete files
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile('w', dir=str(self.path.parent), delete=False) as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(f.name, str(self.path))
+
+    def _is_valid(self, entry, level=None, args=None):
+        if entry.get('version') != version():
+            return False
+        if level is not None and levels.index(entry['level']) < levels.index(level):
+            return False
+        if args is not None and not all(k in args for k in entry['tuned']):
+            return False
+        maxage = options['db-maxage']
+        if maxage is not None and time.time() - entry['timestamp'] > maxage:
+            return False
+        return True
+
+    @property
+    def entries(self):
+        """All database entries, valid or not."""
+        return self._load()
+
+    def lookup(self, key, level=None, args=None, comm=None):
+        """
+        Retrieve the database entry for `key`, or None if there's no valid
+        entry for `key`. If `comm` is provided, the lookup is collective: the
+        entry retrieved by rank 0 is broadcast to all ranks.
+        """
+        entry = None
+        if not is_collective(comm) or comm.rank == 0:
+            entry = self._load().get(key)
+            if entry is not None and not self._is_valid(entry, level, args):
+                entry = None
+        if is_collective(comm):
+            entry = comm.bcast(entry, root=0)
+        return entry
+
+    def store(self, key, level, tuned, elapsed, comm=None):
+        """
+        Add or replace the database entry for `key`. If `comm` is provided,
+        only rank 0 writes to the database.
+        """
+        if is_collective(comm) and comm.rank != 0:
+            return
+        with self._lock():
+            data = self._load()
+            data[key] = {'level': level,
+                         'tuned': dict(tuned),
+                         'time': elapsed,
+                         'timestamp': time.time(),
+                         'version': version()}
+            self._dump(data)
+
+    def invalidate(self, key=None):
+        """
+        Drop the database entry for `key` as well as all invalid entries. If
+        `key` is None, all entries are dropped.
+        """
+        with self._lock():
+            data = self._load()
+            if key is None:
+                data = {}
+            else:
+                data = {k: v for k, v in data.items()
+                        if k != key and self._is_valid(v)}
+            self._dump(data)
+
+    def export(self, filename):
+        """
+        Write all valid database entries to `filename`, in JSON format.
+        """
+        data = {k: v for k, v in self._load().items() if self._is_valid(v)}
+        with open(str(filename), 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+
+def is_collective(comm):
+    """True if `comm` is an MPI communicator with more than one rank."""
+    return comm is not None and comm is not MPI.COMM_NULL and comm.size > 1
+
+
 @total_ordering
 class Record(object):
 
@@ -186,12 +568,16 @@ class Record(object):
         return self.time < other.time
 
 
-def init_time_bounds(stepper, at_args, args):
+def init_time_bounds(stepper, at_args, args, timetiled=False):
     if stepper is None:
         return
     dim = stepper.dim.root
+    # With time tiling, each run must span at least a few time tiles
+    squeezer = options['squeezer']
+    if timetiled:
+        squeezer = max(squeezer, max(options['blocksize-time']))
     if stepper.direction is Backward:
-        at_args[dim.min_name] = at_args[dim.max_name] - options['squeezer']
+        at_args[dim.min_name] = at_args[dim.max_name] - squeezer
         if dim.size_name in args:
             # May need to shrink to avoid OOB accesses
             at_args[dim.min_name] = max(at_args[dim.min_name], args[dim.min_name])
@@ -199,7 +585,7 @@ def init_time_bounds(stepper, at_args, args):
             warning("too few time iterations; skipping")
             return False
     else:
-        at_args[dim.max_name] = at_args[dim.min_name] + options['squeezer']
+        at_args[dim.max_name] = at_args[dim.min_name] + squeezer
         if dim.size_name in args:
             # May need to shrink to avoid OOB accesses
             at_args[dim.max_name] = min(at_args[dim.max_name], args[dim.max_name])
@@ -267,16 +653,23 @@ def generate_block_shapes(blockable, args, level):
     for d in blockable:
         mapper[d] = mapper.get(d.parent, -1) + 1
 
+    # The time tiles, if any, are treated separately
+    time_blocks = [d for d in mapper if d.root.is_Time]
+    for d in time_blocks:
+        mapper.pop(d)
+
     # Generate level-0 block shapes
     level_0 = [d for d, v in mapper.items() if v == 0]
-    # Max attemptable block shape
-    max_bs = tuple((d.step, d.symbolic_size.subs(args)) for d in level_0)
+    # Max attemptable block shape. The extent of skewed blocks depends on the
+    # time tile, so in that case we resort to the root Dimensions' extent
+    max_bs = tuple((d.step, (d.root if time_blocks else d).symbolic_size.subs(args))
+                   for d in level_0)
     # Defaults (basic mode)
     ret = [tuple((d.step, v) for d in level_0) for v in options['blocksize-l0']]
     # Always try the entire iteration space (degenerate block)
     ret.append(max_bs)
     # More attempts if autotuning in aggressive mode
-    if level in ['aggressive', 'max']:
+    if level in ['model', 'aggressive', 'max']:
         # Ramp up to larger block shapes
         handle = tuple((i, options['blocksize-l0'][-1]) for i, _ in ret[0])
         for i in range(3):
@@ -318,12 +711,151 @@ def generate_block_shapes(blockable, args, level):
     # TODO -- currently, there's no Operator producing depth>2 hierarchical blocking,
     # so for simplicity we ignore this for the time being
 
+    # Generate time block shapes
+    for d in time_blocks:
+        max_bs = d.symbolic_size.subs(args)
+        shapes = [v for v in options['blocksize-time'] if v <= max_bs] or [max_bs]
+        if level not in ['model', 'aggressive', 'max']:
+            shapes = shapes[1:-1] or shapes
+        ret = [((d.step, v),) + bs for v in shapes for bs in ret]
+
     # Normalize
     ret = [tuple((k.name, v) for k, v in bs) for bs in ret]
 
     return ret
 
 
+def schedule(tunable, elapsed, level):
+    """
+    Yield the autotuning candidates in the order they should be run. With the
+    'model' level, successive halving is applied: the candidates are run over
+    and over, and after each round only the faster half survives.
+    """
+    candidates = list(tunable)
+    while candidates:
+        for i in candidates:
+            yield i
+        if level != 'model' or not options['model-halving']:
+            return
+        candidates = sorted([i for i in candidates if i in elapsed], key=elapsed.get)
+        candidates = candidates[:len(candidates) // 2]
+        if len(candidates) < 2:
+            return
+
+
+def rank_candidates(operator, tree, blockable, tunable, args):
+    """
+    Sort the autotuning candidates in ascending order of estimated cost. The
+    cost is given by an analytic model that combines:
+
+        * the fraction of time spent in data movement, based on the operational
+          intensity of the Section enclosing `tree`;
+        * the block working set, which determines the cache level (and therefore
+          the penalty) at which the block data is reused;
+        * the redundant loads of the halo points at the block boundaries;
+        * the load imbalance, as the blocks are distributed among the threads.
+    """
+    platform = configuration['platform']
+    itemsize = np.dtype(operator._dtype).itemsize
+
+    # Operations and traffic (in bytes) per iteration of the enclosing Section
+    data = find_section(operator, tree)
+    try:
+        npoints = subs_op_args(data.points, args)
+        ops = float(subs_op_args(data.sops, args))
+        traffic = float(subs_op_args(data.traffic, args)) / float(npoints) * itemsize
+        fmem = min(1., options['model-balance'] * traffic / ops)
+    except (AttributeError, TypeError, ValueError, ZeroDivisionError):
+        # Assume a memory-bound Section
+        fmem = 1.
+
+    # Mapper from the Dimensions to their extent and halo
+    functions = [f for f in FindSymbols().visit(tree.root)
+                 if f.is_DiscreteFunction and not f.is_SparseFunction]
+    extent = {}
+    halo = {}
+    for f in functions:
+        for d in f.dimensions:
+            if d.is_Space:
+                try:
+                    extent[d.root] = args[d.root.max_name] - args[d.root.min_name] + 1
+                except KeyError:
+                    extent[d.root] = f.shape[f.dimensions.index(d)]
+                halo[d.root] = max(halo.get(d.root, 0), sum(f._size_halo[d]))
+
+    # Only the outermost level of blocking matters
+    blocks = [d for d in blockable if not d.parent.is_Incr]
+    tblocks = [d for d in blocks if d.root.is_Time]
+    sblocks = [d for d in blocks if not d.root.is_Time]
+
+    # The blocks are distributed among the threads through the collapsed loops
+    collapsed = [i.dim.root for i in tree[:(tree[0].ncollapsed or 1)]
+                 if i.dim in sblocks]
+
+    caches = [platform.cache_size(i) for i in (2, 3)]
+
+    def cost(candidate):
+        bs, nt = candidate
+        values = dict(bs + nt)
+        shape = {d.root: values.get(d.step.name, extent.get(d.root, 1)) for d in sblocks}
+        depth = max([values.get(d.step.name, 1) for d in tblocks], default=1)
+
+        # With time tiling, the block has to accommodate the skewed dependences
+        shape_halo = {d: v + halo.get(d, 0)*depth for d, v in shape.items()}
+
+        # The working set, in bytes
+        wset = 0
+        for f in functions:
+            nslots = f.time_order + 1 if f.is_TimeFunction else 1
+            npoints = 1
+            for d in f.dimensions:
+                if d.is_Space:
+                    npoints *= shape_halo.get(d.root, extent[d.root] + halo[d.root])
+            wset += nslots * npoints * itemsize
+
+        # The penalty for the cache level at which the working set fits
+        penalties = options['model-penalties']
+        penalty = penalties[-1]
+        for v, size in zip(penalties, caches):
+            if size is None or wset <= size:
+                penalty = v
+                break
+
+        # The redundant halo loads, amortized over the time tile
+        redundancy = prod(shape_halo[d] / shape[d] for d in shape) / depth
+
+        # The load imbalance, if the blocks are distributed among the threads
+        imbalance = 1.
+        nthreads = max([v for k, v in nt if k is not None], default=1)
+        if not tblocks and nthreads > 1:
+            nblocks = prod(-(-extent[d] // shape[d]) for d in collapsed)
+            imbalance = (-(-nblocks // nthreads)) * nthreads / nblocks
+
+        return imbalance * ((1. - fmem) + fmem * penalty * redundancy)
+
+    ranked = sorted(tunable, key=cost)
+
+    log("model-ranked candidates <%s>" %
+        ';'.join(','.join('%s=%s' % i for i in bs if i[0] is not None)
+                 for bs, _ in ranked[:options['model-topk']]))
+
+    return ranked
+
+
+def find_section(operator, tree):
+    """
+    Retrieve the profiling data of the Section enclosing `tree`, either
+    directly or through a call to the ElementalFunction containing `tree`.
+    """
+    efuncs = {k: v for k, v in operator._func_table.items()
+              if tree.root in FindNodes(Iteration).visit(v.root)}
+    for s in FindNodes(Section).visit(operator.body):
+        if tree.root in FindNodes(Iteration).visit(s) or \
+                any(i.name in efuncs for i in FindNodes(Call).visit(s)):
+            return operator._profiler._sections.get(s.name)
+    return None
+
+
 def generate_nthreads(nthreads, args, level):
     if nthreads == 1:
         return [((None, 1),)]
@@ -360,10 +892,28 @@ options = {
     'squeezer': 4,
     'blocksize-l0': (8, 16, 24, 32, 64, 96, 128),
     'blocksize-l1': (8, 16, 32),
+    'blocksize-time': (2, 4, 8, 16),
+    'db-path': None,
+    'db-maxage': None,
+    'model-topk': 6,
+    'model-halving': True,
+    'model-balance': 10.,
+    'model-penalties': (1., 1.5, 3.),
+    'cire-variants': (None, 'inv-basic', 'inv-compound'),
+    'cire-runs': 2,
 }
 """Autotuning options."""
 
 
+levels = ['basic', 'model', 'aggressive', 'max']
+"""The autotuning levels, in increasing order of aggressiveness."""
+
+
+def version():
+    from devito import __version__
+    return __version__
+
+
 def log(msg):
     perf("AutoTuner: %s" % msg)
 
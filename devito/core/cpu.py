@@ -4,11 +4,14 @@ import numpy as np
 
 from devito.core.operator import CoreOperator, CustomOperator
 from devito.exceptions import InvalidOperator
+from devito.operations.interpolators import Injection, LinearInterpolator
 from devito.passes.equations import buffering, collect_derivatives
-from devito.passes.clusters import (Blocking, Lift, cire, cse, eliminate_arrays,
-                                    extract_increments, factorize, fuse, optimize_pows)
+from devito.passes.clusters import (Blocking, Lift, TimeTiling, cire, cse,
+                                    eliminate_arrays, extract_increments, factorize,
+                                    fuse, optimize_pows)
 from devito.passes.iet import (CTarget, OmpTarget, avoid_denormals, mpiize,
-                               optimize_halospots, hoist_prodders, relax_incr_dimensions)
+                               optimize_halospots, hoist_prodders, relax_incr_dimensions,
+                               color_sparse_increments, hoist_color_regions)
 from devito.tools import timed_pass
 
 __all__ = ['Cpu64NoopCOperator', 'Cpu64NoopOmpOperator', 'Cpu64AdvCOperator',
@@ -82,6 +85,7 @@ class Cpu64OperatorMixin(object):
         # Blocking
         o['blockinner'] = oo.pop('blockinner', False)
         o['blocklevels'] = oo.pop('blocklevels', cls.BLOCK_LEVELS)
+        o['time-tiling'] = oo.pop('time-tiling', False)
 
         # CIRE
         o['min-storage'] = oo.pop('min-storage', False)
@@ -89,6 +93,11 @@ class Cpu64OperatorMixin(object):
         o['cire-maxpar'] = oo.pop('cire-maxpar', False)
         o['cire-maxalias'] = oo.pop('cire-maxalias', False)
         o['cire-ftemps'] = oo.pop('cire-ftemps', False)
+        o['cire-variant'] = oo.pop('cire-variant', None)
+        o['cire-select'] = oo.pop('cire-select', 'heuristic')
+        if o['cire-select'] not in ('heuristic', 'empirical'):
+            raise InvalidOperator("Illegal `cire-select=%s`; accepted values are "
+                                  "`heuristic` and `empirical`" % o['cire-select'])
         o['cire-mincost'] = {
             'invariants': {
                 'scalar': np.inf,
@@ -103,6 +112,10 @@ class Cpu64OperatorMixin(object):
         o['par-chunk-nonaffine'] = oo.pop('par-chunk-nonaffine', cls.PAR_CHUNK_NONAFFINE)
         o['par-dynamic-work'] = oo.pop('par-dynamic-work', cls.PAR_DYNAMIC_WORK)
         o['par-nested'] = oo.pop('par-nested', cls.PAR_NESTED)
+        o['par-inject'] = oo.pop('par-inject', 'atomic')
+        if o['par-inject'] not in ('atomic', 'color'):
+            raise InvalidOperator("Illegal `par-inject=%s`; accepted values are "
+                                  "`atomic` and `color`" % o['par-inject'])
 
         # Recognised but unused by the CPU backend
         oo.pop('par-disabled', None)
@@ -151,8 +164,20 @@ class Cpu64AdvOperator(Cpu64OperatorMixin, CoreOperator):
     @classmethod
     @timed_pass(name='specializing.DSL')
     def _specialize_dsl(cls, expressions, **kwargs):
+        options = kwargs['options']
+
         expressions = collect_derivatives(expressions)
 
+        # The sparse points are colored based on their precomputed reference grid
+        # points, so the colored injections must index the grid through these very
+        # same reference grid points rather than recomputing them
+        if options['openmp'] and options['par-inject'] == 'color':
+            expressions = [i.interpolator.inject(i.field, i.expr, i.offset,
+                                                 precompute=True)
+                           if isinstance(i, Injection) and
+                           isinstance(i.interpolator, LinearInterpolator) else i
+                           for i in expressions]
+
         return expressions
 
     @classmethod
@@ -186,6 +211,10 @@ class Cpu64AdvOperator(Cpu64OperatorMixin, CoreOperator):
         # Reduce flops (no arithmetic alterations)
         clusters = cse(clusters, sregistry)
 
+        # Skew the blocked loop nests to tile the time loop
+        if options['time-tiling']:
+            clusters = TimeTiling(options).process(clusters)
+
         return clusters
 
     @classmethod
@@ -209,7 +238,12 @@ class Cpu64AdvOperator(Cpu64OperatorMixin, CoreOperator):
         # Parallelism
         parizer = cls._Target.Parizer(sregistry, options, platform)
         parizer.make_simd(graph)
-        parizer.make_parallel(graph)
+        if options['openmp'] and options['par-inject'] == 'color':
+            color_sparse_increments(graph)
+            parizer.make_parallel(graph)
+            hoist_color_regions(graph)
+        else:
+            parizer.make_parallel(graph)
 
         # Misc optimizations
         hoist_prodders(graph)
@@ -270,6 +304,10 @@ class Cpu64FsgOperator(Cpu64AdvOperator):
         # Blocking to improve data locality
         clusters = Blocking(options).process(clusters)
 
+        # Skew the blocked loop nests to tile the time loop
+        if options['time-tiling']:
+            clusters = TimeTiling(options).process(clusters)
+
         return clusters
 
 
@@ -314,6 +352,7 @@ class Cpu64CustomOperator(Cpu64OperatorMixin, CustomOperator):
             'cire-sops': lambda i: cire(i, 'sops', sregistry, options, platform),
             'cse': lambda i: cse(i, sregistry),
             'opt-pows': optimize_pows,
+            'time-tiling': TimeTiling(options).process,
             'topofuse': lambda i: fuse(i, toposort=True)
         }
 
@@ -344,7 +383,7 @@ class Cpu64CustomOperator(Cpu64OperatorMixin, CustomOperator):
         'buffering',
         # Clusters
         'blocking', 'topofuse', 'fuse', 'factorize', 'cire-sops', 'cse', 'lift',
-        'opt-pows',
+        'opt-pows', 'time-tiling',
         # IET
         'denormals', 'optcomms', 'openmp', 'mpi', 'simd', 'prodders',
     )
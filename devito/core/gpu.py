@@ -66,6 +66,8 @@ class DeviceOperatorMixin(object):
         o['cire-maxpar'] = oo.pop('cire-maxpar', True)
         o['cire-maxalias'] = oo.pop('cire-maxalias', False)
         o['cire-ftemps'] = oo.pop('cire-ftemps', False)
+        o['cire-variant'] = oo.pop('cire-variant', None)
+        o['cire-select'] = 'heuristic'
         o['cire-mincost'] = {
             'invariants': {
                 'scalar': 1,
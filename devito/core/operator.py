@@ -1,8 +1,8 @@
-from devito.core.autotuning import autotune
+from devito.core.autotuning import autotune, autotune_cire
 from devito.exceptions import InvalidOperator
 from devito.logger import warning
 from devito.parameters import configuration
-from devito.operator import Operator
+from devito.operator import Operator, SymbolRegistry
 from devito.tools import as_tuple, timed_pass
 from devito.types import NThreads
 
@@ -37,6 +37,24 @@ class BasicOperator(Operator):
 
         return kwargs
 
+    @classmethod
+    def _build(cls, expressions, **kwargs):
+        op = super()._build(expressions, **kwargs)
+
+        # Maybe replace the CIRE variant picked by the heuristics with the
+        # fastest one, as measured empirically
+        if kwargs['options'].get('cire-select') == 'empirical':
+            def build(options):
+                kw = dict(kwargs)
+                kw['options'] = dict(kwargs['options'])
+                kw['options'].update(options)
+                kw['sregistry'] = SymbolRegistry()
+                return super(BasicOperator, cls)._build(expressions, **kw)
+
+            op = autotune_cire(op, build)
+
+        return op
+
     def _autotune(self, args, setup):
         if setup in [False, 'off']:
             return args
@@ -1,9 +1,12 @@
 import abc
+from collections import Counter
 from functools import reduce
 from operator import mul
+from pathlib import Path
 import mmap
 import os
 import sys
+import tempfile
 
 import numpy as np
 import ctypes
@@ -11,11 +14,16 @@ from ctypes.util import find_library
 
 from devito.logger import logger
 from devito.parameters import configuration
-from devito.tools import dtype_to_ctype
+from devito.tools import dtype_to_ctype, fstype
 
 __all__ = ['ALLOC_FLAT', 'ALLOC_NUMA_LOCAL', 'ALLOC_NUMA_ANY',
-           'ALLOC_KNL_MCDRAM', 'ALLOC_KNL_DRAM', 'ALLOC_GUARD',
-           'default_allocator']
+           'ALLOC_KNL_MCDRAM', 'ALLOC_KNL_DRAM', 'ALLOC_GUARD', 'ALLOC_HUGEPAGE',
+           'HugePageAllocator', 'MmapAllocator',
+           'default_allocator', 'allocation_stats']
+
+
+_live_bytes = Counter()
+"""The number of bytes currently allocated through each MemoryAllocator."""
 
 
 class MemoryAllocator(object):
@@ -33,6 +41,9 @@ class MemoryAllocator(object):
     guaranteed_alignment = 64
     """Guaranteed data alignment."""
 
+    zero_filled = False
+    """True if the allocated memory is guaranteed to be zero-initialized."""
+
     @classmethod
     def available(cls):
         if cls._attempted_init is False:
@@ -87,8 +98,20 @@ class MemoryAllocator(object):
         # assign the new shape to the shape attribute of the array:
         pointer.shape = shape
 
+        self._account(pointer.nbytes)
+
         return (pointer, memfree_args)
 
+    def _account(self, nbytes):
+        """
+        Update the number of bytes currently allocated through ``self``. This is
+        to be called with a negative ``nbytes`` once the memory is freed.
+        """
+        _live_bytes[self] += nbytes
+
+    def __repr__(self):
+        return type(self).__name__
+
     @abc.abstractmethod
     def _alloc_C_libcall(self, size, ctype):
         """
@@ -305,6 +328,9 @@ class NumaAllocator(MemoryAllocator):
     def free(self, c_pointer, c_bytesize):
         self.lib.numa_free(c_pointer, c_bytesize)
 
+    def __repr__(self):
+        return "NumaAllocator[%s]" % self._node
+
     @property
     def node(self):
         return self._node
@@ -318,6 +344,308 @@ class NumaAllocator(MemoryAllocator):
         return self._node == 'local'
 
 
+def libc_mmap():
+    """
+    Return `libc`, with the prototypes of `mmap`, `munmap`, `madvise` and
+    `msync` set up, or None if not available (e.g., not on Linux).
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    handle = find_library('c')
+    if handle is None:
+        return None
+    try:
+        lib = ctypes.CDLL(handle, use_errno=True)
+    except OSError:
+        return None
+    lib.mmap.restype = ctypes.c_void_p
+    lib.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int,
+                         ctypes.c_int, ctypes.c_int, ctypes.c_long]
+    lib.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    lib.madvise.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int]
+    lib.msync.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int]
+    return lib
+
+
+class HugePageAllocator(MemoryAllocator):
+
+    """
+    Memory allocator based on ``mmap``, backed by huge pages, with a pool of
+    freed blocks to be recycled by subsequent allocations.
+
+    Large allocations are rounded up to a multiple of the huge page size and are
+    either mapped with ``MAP_HUGETLB``, if ``explicit=True`` and enough huge pages
+    have been reserved by the system administrator, or otherwise flagged with
+    ``madvise(MADV_HUGEPAGE)``, so that the kernel backs them with transparent
+    huge pages. Either way, this reduces the TLB misses on large grids.
+
+    Upon ``free``, the blocks are not unmapped, but rather retained in a pool,
+    grouped by size class, up to ``pool_size`` bytes. Thus, repeatedly allocating
+    equally-shaped Functions (e.g., the wavefields in a sequence of shots) entirely
+    bypasses ``mmap``/``munmap``, as well as the page faults upon first touch.
+
+    Parameters
+    ----------
+    explicit : bool, optional
+        Use explicit huge pages (``MAP_HUGETLB``), falling back to transparent
+        huge pages if not available. Defaults to False.
+    pool_size : int, optional
+        The maximum number of bytes retained in the pool. Defaults to 4GB.
+
+    Notes
+    -----
+    A recycled block is *not* zeroed. This is harmless for Functions, since their
+    data is always initialized upon allocation.
+    """
+
+    # Linux-specific constants, not exposed by the `mmap` module
+    MAP_HUGETLB = 0x40000
+    MADV_HUGEPAGE = 14
+
+    hugepagesize = 2*1024*1024
+
+    @classmethod
+    def initialize(cls):
+        cls.lib = libc_mmap()
+        if cls.lib is None:
+            return
+
+        try:
+            with open('/proc/meminfo') as f:
+                for line in f:
+                    if line.startswith('Hugepagesize'):
+                        cls.hugepagesize = int(line.split()[1])*1024
+        except (OSError, ValueError, IndexError):
+            pass
+
+    def __init__(self, explicit=False, pool_size=4*1024**3):
+        self.explicit = explicit
+        self.pool_size = pool_size
+
+        self._pool = {}
+        self._pool_nbytes = 0
+
+    def _size_class(self, nbytes):
+        # Large blocks are rounded up to a multiple of the huge page size, small
+        # ones to a multiple of the (ordinary) page size
+        if nbytes >= self.hugepagesize:
+            align = self.hugepagesize
+        else:
+            align = mmap.PAGESIZE
+        return max(align, (nbytes + align - 1) // align * align)
+
+    def _mmap(self, c_bytesize, flags):
+        c_pointer = self.lib.mmap(None, c_bytesize, mmap.PROT_READ | mmap.PROT_WRITE,
+                                  mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS | flags, -1, 0)
+        if c_pointer is None or c_pointer == ctypes.c_void_p(-1).value:
+            return None
+        return c_pointer
+
+    def _alloc_C_libcall(self, size, ctype):
+        if not self.available():
+            raise RuntimeError("Couldn't find `libc`'s `mmap` to allocate memory")
+
+        c_bytesize = self._size_class(size * ctypes.sizeof(ctype))
+
+        # Recycle a pooled block, if any
+        try:
+            c_pointer = self._pool[c_bytesize].pop()
+            self._pool_nbytes -= c_bytesize
+            return ctypes.c_void_p(c_pointer), (c_pointer, c_bytesize)
+        except (KeyError, IndexError):
+            pass
+
+        hugetlb = c_bytesize >= self.hugepagesize
+        c_pointer = None
+        if self.explicit and hugetlb:
+            c_pointer = self._mmap(c_bytesize, self.MAP_HUGETLB)
+        if c_pointer is None:
+            c_pointer = self._mmap(c_bytesize, 0)
+            if c_pointer is None:
+                return None, None
+            if hugetlb:
+                # A failure is harmless -- we simply get ordinary pages
+                self.lib.madvise(c_pointer, c_bytesize, self.MADV_HUGEPAGE)
+
+        return ctypes.c_void_p(c_pointer), (c_pointer, c_bytesize)
+
+    def free(self, c_pointer, c_bytesize):
+        if self._pool_nbytes + c_bytesize <= self.pool_size:
+            self._pool.setdefault(c_bytesize, []).append(c_pointer)
+            self._pool_nbytes += c_bytesize
+        else:
+            self.lib.munmap(c_pointer, c_bytesize)
+
+    def release(self):
+        """
+        Unmap all of the blocks in the pool, thus returning the memory to the system.
+        """
+        for c_bytesize, v in self._pool.items():
+            for c_pointer in v:
+                self.lib.munmap(c_pointer, c_bytesize)
+        self._pool.clear()
+        self._pool_nbytes = 0
+
+    @property
+    def pool_nbytes(self):
+        """The number of bytes currently retained in the pool."""
+        return self._pool_nbytes
+
+
+class MmapAllocator(MemoryAllocator):
+
+    """
+    Memory allocator backed by files, mapped in memory through ``mmap``. This
+    enables out-of-core Functions, in particular TimeFunctions saving the whole
+    time history (``save=nt``), whose size is bounded by the storage, rather
+    than the RAM, capacity.
+
+    The Operators access the data as usual, while the kernel pages it in and out
+    transparently and asynchronously: by default, the mappings are flagged with
+    ``madvise(MADV_SEQUENTIAL)``, so that the time slices ahead of a sweep are
+    read in advance and those behind it are dropped early. Note, however, that
+    the written pages stay in RAM until the kernel's background writeback gets to
+    them. Explicit control is provided through ``prefetch`` and ``evict``, which
+    are typically used between the time windows of an Operator applied piecewise
+    (e.g., via ``time_m`` and ``time_M``), for example along the backward sweep
+    of a gradient computation.
+
+    Parameters
+    ----------
+    path : str, optional
+        The directory in which the files are created. Defaults to
+        ``configuration['ooc-dir']``. It should be on a fast local storage; a
+        warning is emitted if it's RAM-backed (e.g., tmpfs), as the data would
+        then consume RAM anyway. The files are removed as soon as they're mapped,
+        so they never outlive the Functions.
+    advice : int, optional
+        The ``madvise`` advice for the mappings. Defaults to MADV_SEQUENTIAL.
+    """
+
+    # Linux-specific constants, not exposed by the `mmap` module on all Pythons
+    MADV_NORMAL = 0
+    MADV_SEQUENTIAL = 2
+    MADV_WILLNEED = 3
+    MADV_DONTNEED = 4
+    MS_SYNC = 4
+
+    # Files extended through `ftruncate` read as zeros
+    zero_filled = True
+
+    # File system types keeping the files in RAM
+    _ram_fstypes = ('tmpfs', 'ramfs')
+
+    # The directories already checked for being RAM-backed
+    _checked = set()
+
+    @classmethod
+    def initialize(cls):
+        cls.lib = libc_mmap()
+
+    def __init__(self, path=None, advice=MADV_SEQUENTIAL):
+        self.path = path
+        self.advice = advice
+
+        # The file descriptors of the mapped files, to flush them upon eviction
+        self._fds = {}
+
+    def _alloc_C_libcall(self, size, ctype):
+        if not self.available():
+            raise RuntimeError("Couldn't find `libc`'s `mmap` to allocate memory")
+
+        c_bytesize = max(size * ctypes.sizeof(ctype), 1)
+
+        fd, filename = tempfile.mkstemp(dir=self._make_dir(), suffix='.dat')
+        try:
+            os.ftruncate(fd, c_bytesize)
+            c_pointer = self.lib.mmap(None, c_bytesize,
+                                      mmap.PROT_READ | mmap.PROT_WRITE,
+                                      mmap.MAP_SHARED, fd, 0)
+        except OSError:
+            os.close(fd)
+            raise
+        finally:
+            os.unlink(filename)
+        if c_pointer is None or c_pointer == ctypes.c_void_p(-1).value:
+            os.close(fd)
+            return None, None
+
+        if self.advice != self.MADV_NORMAL:
+            self.lib.madvise(c_pointer, c_bytesize, self.advice)
+
+        self._fds[c_pointer] = fd
+
+        return ctypes.c_void_p(c_pointer), (c_pointer, c_bytesize)
+
+    def _make_dir(self):
+        path = self.path or configuration['ooc-dir']
+        if path is None:
+            path = Path('/var/tmp').joinpath('devito-ooc-uid%s' % os.getuid())
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        if path not in self._checked:
+            self._checked.add(path)
+            fs = fstype(path)
+            if fs in self._ram_fstypes:
+                logger.warning("The out-of-core data directory `%s` is on a RAM-backed "
+                               "file system (%s), so out-of-core Functions will "
+                               "consume RAM; use `DEVITO_OOC_DIR` to select a "
+                               "disk-backed directory" % (path, fs))
+
+        return path
+
+    def free(self, c_pointer, c_bytesize):
+        self.lib.munmap(c_pointer, c_bytesize)
+        os.close(self._fds.pop(c_pointer))
+
+    def _advise(self, function, start, stop, advice):
+        data = function._data_allocated
+        # The outermost Dimension is the slowest varying one, hence the slices
+        # along it are contiguous in memory
+        stride = data.strides[0]
+        start = max(start, 0)*stride
+        stop = min(stop, data.shape[0])*stride
+        if stop <= start:
+            return
+        base = data.ctypes.data
+        # madvise requires page-aligned addresses
+        lower = (base + start) // mmap.PAGESIZE * mmap.PAGESIZE
+        upper = base + stop
+        if advice == self.MADV_DONTNEED:
+            # Only drop the pages entirely within the range
+            lower = (base + start + mmap.PAGESIZE - 1) // mmap.PAGESIZE * mmap.PAGESIZE
+            upper = upper // mmap.PAGESIZE * mmap.PAGESIZE
+            if upper <= lower:
+                return
+            # Unmapping the pages isn't enough, as the dirty ones would stay in
+            # the page cache until the background writeback. So they're first
+            # written back, and then the, now clean, pages are dropped from the
+            # page cache too
+            self.lib.msync(lower, upper - lower, self.MS_SYNC)
+            self.lib.madvise(lower, upper - lower, advice)
+            os.posix_fadvise(self._fds[base], lower - base, upper - lower,
+                             os.POSIX_FADV_DONTNEED)
+        else:
+            self.lib.madvise(lower, upper - lower, advice)
+
+    def prefetch(self, function, start, stop):
+        """
+        Asynchronously read in the slices ``[start, stop)``, along the outermost
+        Dimension (e.g., time), of the data of ``function``.
+        """
+        self._advise(function, start, stop, self.MADV_WILLNEED)
+
+    def evict(self, function, start, stop):
+        """
+        Release the memory of the slices ``[start, stop)``, along the outermost
+        Dimension (e.g., time), of the data of ``function``. The modified data is
+        written back to the file, blocking until done, so it isn't lost: it's paged
+        back in upon the next access.
+        """
+        self._advise(function, start, stop, self.MADV_DONTNEED)
+
+
 class ExternalAllocator(MemoryAllocator):
 
     """
@@ -370,12 +698,26 @@ class ExternalAllocator(MemoryAllocator):
 
 ALLOC_GUARD = GuardAllocator(1048576)
 ALLOC_FLAT = PosixAllocator()
+ALLOC_HUGEPAGE = HugePageAllocator()
 ALLOC_KNL_DRAM = NumaAllocator(0)
 ALLOC_KNL_MCDRAM = NumaAllocator(1)
 ALLOC_NUMA_ANY = NumaAllocator('any')
 ALLOC_NUMA_LOCAL = NumaAllocator('local')
 
 
+def allocation_stats():
+    """
+    Return a mapper from MemoryAllocators to the number of bytes currently
+    allocated through them. The memory provided by ExternalAllocators, which is
+    owned by the user, is not accounted for.
+    """
+    stats = Counter()
+    for k, v in _live_bytes.items():
+        if v > 0:
+            stats[repr(k)] += v
+    return dict(stats)
+
+
 def infer_knl_mode():
     path = os.path.join('/sys', 'bus', 'node', 'devices', 'node1')
     return 'flat' if os.path.exists(path) else 'cache'
@@ -396,6 +738,9 @@ def default_allocator():
         * ALLOC_KNL_MCDRAM: On a Knights Landing platform, allocate memory in MCDRAM.
                             Falls back to DRAM if there isn't enough space.
         * ALLOC_KNL_DRAM: On a Knights Landing platform, allocate memory in DRAM.
+        * ALLOC_HUGEPAGE: Allocate memory backed by (transparent) huge pages, and
+                          recycle the freed memory through a pool. This is never
+                          the default, but may be passed explicitly to Functions.
 
     The default allocator is chosen based on the following algorithm: ::
 
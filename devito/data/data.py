@@ -83,6 +83,7 @@ class Data(np.ndarray):
             # without going through `__array_finalize__`
             return
         self._allocator.free(*self._memfree_args)
+        self._allocator._account(-self.nbytes)
         self._memfree_args = None
 
     def __reduce__(self):
@@ -273,24 +274,12 @@ class Data(np.ndarray):
                 super(Data, self).__setitem__(glb_idx, val)
         elif isinstance(val, Data) and val._is_distributed:
             if comm_type is index_by_index:
+                glb_idx = self._normalize_index(glb_idx)
                 glb_idx, val = self._process_args(glb_idx, val)
                 val_idx = as_tuple([slice(i.glb_min, i.glb_max+1, 1) for
                                     i in val._decomposition])
                 idx = self._set_global_idx(val, glb_idx, val_idx)
-                comm = self._distributor.comm
-                nprocs = self._distributor.nprocs
-                # Prepare global lists:
-                data_global = []
-                idx_global = []
-                for j in range(nprocs):
-                    data_global.append(comm.bcast(np.array(val), root=j))
-                    idx_global.append(comm.bcast(idx, root=j))
-                # Set the data:
-                for j in range(nprocs):
-                    skip = any(i is None for i in idx_global[j]) \
-                        or data_global[j].size == 0
-                    if not skip:
-                        self.__setitem__(idx_global[j], data_global[j])
+                self._redistribute(idx, np.array(val))
             elif self._is_distributed:
                 # `val` is decomposed, `self` is decomposed -> local set
                 super(Data, self).__setitem__(glb_idx, val)
@@ -493,6 +482,83 @@ class Data(np.ndarray):
                 mapped_idx.append(None)
         return as_tuple(mapped_idx)
 
+    def _redistribute(self, idx, val):
+        """
+        Insert the blocks of a distributed array into `self`. ``val`` is the
+        block stored by the calling rank, which goes to the global indices ``idx``.
+
+        Only the metadata (i.e., indices and shapes of the blocks, and index ranges
+        owned by each rank) is replicated. Then, each rank only sends, through a
+        single Alltoallv, the portions of its block intersecting the local data of
+        the other ranks.
+        """
+        comm = self._distributor.comm
+        nprocs = comm.Get_size()
+
+        if val.size == 0 or any(i is None for i in idx):
+            idx = None
+        else:
+            # Normalize negative integer indices
+            idx = tuple(i + (self.shape[n] if dec is None else dec.glb_max + 1)
+                        if is_integer(i) and i < 0 else i
+                        for n, (i, dec) in enumerate(zip(idx, self._decomposition)))
+
+        # The global index range owned by the calling rank, for each dimension
+        owned = []
+        for dec in self._decomposition:
+            if dec is None:
+                owned.append(None)
+            elif dec.loc_empty:
+                owned.append((0, -1))
+            else:
+                owned.append((dec.loc_abs_min, dec.loc_abs_max))
+
+        metadata = comm.allgather((idx, val.shape, owned))
+
+        # What goes out to each rank
+        sendbuf = []
+        scounts = np.zeros(nprocs, dtype=np.int32)
+        for r, (_, _, r_owned) in enumerate(metadata):
+            v = index_overlap(idx, val.shape, r_owned)
+            if v is not None:
+                block = np.ascontiguousarray(val[v[1]], dtype=self.dtype)
+                sendbuf.append(block.ravel())
+                scounts[r] = block.size
+        sendbuf = np.concatenate(sendbuf) if sendbuf else np.empty(0, self.dtype)
+
+        # What comes in from each rank
+        recvs = []
+        rcounts = np.zeros(nprocs, dtype=np.int32)
+        for r, (r_idx, r_shape, _) in enumerate(metadata):
+            v = index_overlap(r_idx, r_shape, owned)
+            if v is not None:
+                shape = tuple(i.stop - i.start for i in v[1])
+                recvs.append((v[0], shape))
+                rcounts[r] = int(np.prod(shape))
+        recvbuf = np.empty(rcounts.sum(), dtype=self.dtype)
+
+        sdispls = np.concatenate([[0], np.cumsum(scounts)[:-1]]).astype(np.int32)
+        rdispls = np.concatenate([[0], np.cumsum(rcounts)[:-1]]).astype(np.int32)
+        comm.Alltoallv([sendbuf, (scounts, sdispls)], [recvbuf, (rcounts, rdispls)])
+
+        # Set the data. By construction, the received blocks are entirely local,
+        # so the global indices are shifted straight into local indices
+        offset = 0
+        for sub_idx, shape in recvs:
+            loc_idx = []
+            for i, s, mod, dec in zip(sub_idx, self.shape, self._modulo,
+                                      self._decomposition):
+                v = 0 if dec is None else dec.loc_abs_min
+                if is_integer(i):
+                    i = i - v
+                else:
+                    i = slice(i.start - v, i.stop - v, i.step)
+                loc_idx.append(index_apply_modulo(i, s) if mod else i)
+            size = int(np.prod(shape))
+            self.view(np.ndarray)[tuple(loc_idx)] = \
+                recvbuf[offset:offset+size].reshape(shape)
+            offset += size
+
     def _gather(self, start=None, stop=None, step=1, rank=0):
         """
         Method for gathering distributed data into a NumPy array
@@ -4,7 +4,7 @@ from devito.tools import Tag, as_tuple, is_integer
 
 __all__ = ['Index', 'NONLOCAL', 'PROJECTED', 'index_is_basic', 'index_apply_modulo',
            'index_dist_to_repl', 'convert_index', 'index_handle_oob',
-           'loc_data_idx', 'mpi_index_maps', 'flip_idx']
+           'loc_data_idx', 'mpi_index_maps', 'index_overlap', 'flip_idx']
 
 
 class Index(Tag):
@@ -324,6 +324,64 @@ def mpi_index_maps(loc_idx, shape, topology, coords, comm):
     return owners, send, global_si, local_si
 
 
+def index_overlap(idx, shape, owned):
+    """
+    Intersect a block of data, of shape ``shape``, going to the global indices
+    ``idx``, with the global index ranges ``owned`` by an MPI rank.
+
+    Parameters
+    ----------
+    idx : tuple of ints and slices
+        The global indices of the block. Slices must have non-negative start
+        and step. Integers are dimensions along which the block is projected.
+        None means the block is empty.
+    shape : tuple of ints
+        The shape of the block.
+    owned : tuple of 2-tuples
+        The (min, max) global index owned by the MPI rank, for each dimension.
+        None means the whole dimension is owned.
+
+    Returns
+    -------
+    A 2-tuple, with the global indices of the intersection and the indices of
+    the intersection within the block, or None if the intersection is empty.
+
+    Examples
+    --------
+    >>> index_overlap((slice(2, 10, 2),), (4,), ((5, 8),))
+    ((slice(6, 9, 2),), (slice(2, 4, None),))
+    """
+    if idx is None:
+        return None
+    if len([i for i in idx if isinstance(i, slice)]) != len(shape):
+        raise ValueError("Cannot map a block of shape `%s` onto `%s`" % (shape, idx))
+
+    glb_idx = []
+    blk_idx = []
+    axes = iter(shape)
+    for i, o in zip(idx, owned):
+        if is_integer(i):
+            if o is not None and not o[0] <= i <= o[1]:
+                return None
+            glb_idx.append(i)
+            continue
+
+        n = next(axes)
+        start = i.start or 0
+        step = i.step or 1
+        if o is None:
+            k0, k1 = 0, n
+        else:
+            k0 = max(0, -((start - o[0]) // step))
+            k1 = min(n, (o[1] - start) // step + 1)
+        if k1 <= k0:
+            return None
+        glb_idx.append(slice(start + k0*step, start + (k1 - 1)*step + 1, step))
+        blk_idx.append(slice(k0, k1))
+
+    return tuple(glb_idx), tuple(blk_idx)
+
+
 def flip_idx(idx, decomposition):
     """
     This function serves two purposes:
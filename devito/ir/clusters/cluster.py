@@ -307,7 +307,7 @@ class ClusterGroup(tuple):
 
     @cached_property
     def scope(self):
-        return Scope(exprs=self.exprs)
+        return Scope.concatenate([c.scope for c in self])
 
     @cached_property
     def itintervals(self):
@@ -15,7 +15,8 @@ __all__ = ['LoweredEq', 'ClusterizedEq', 'DummyEq']
 
 class IREq(sympy.Eq):
 
-    _state = ('is_Increment', 'ispace', 'dspace', 'conditionals', 'implicit_dims')
+    _state = ('is_Increment', 'operation', 'ispace', 'dspace', 'conditionals',
+              'implicit_dims')
 
     @property
     def is_Scalar(self):
@@ -31,6 +32,10 @@ class IREq(sympy.Eq):
     def is_Increment(self):
         return self._is_Increment
 
+    @property
+    def operation(self):
+        return self._operation
+
     @property
     def ispace(self):
         return self._ispace
@@ -188,6 +193,7 @@ class LoweredEq(IREq):
         expr._reads, expr._writes = detect_io(expr)
 
         expr._is_Increment = input_expr.is_Increment
+        expr._operation = input_expr.operation
         expr._implicit_dims = input_expr.implicit_dims
 
         return expr
@@ -8,6 +8,7 @@ from collections import OrderedDict, namedtuple
 from collections.abc import Iterable
 
 import cgen as c
+from sympy import Add
 
 from devito.data import FULL
 from devito.ir.equations import ClusterizedEq, DummyEq
@@ -20,11 +21,12 @@ from devito.tools import (Signer, as_tuple, filter_ordered, filter_sorted, flatt
 from devito.types.basic import AbstractFunction, Indexed, LocalObject, Symbol
 
 __all__ = ['Node', 'Block', 'Expression', 'Element', 'Callable', 'Call', 'Conditional',
-           'Iteration', 'List', 'LocalExpression', 'Section', 'TimedList', 'Prodder',
-           'MetaCall', 'PointerCast', 'ForeignExpression', 'HaloSpot', 'IterationTree',
-           'ExpressionBundle', 'AugmentedExpression', 'Increment', 'Return', 'While',
-           'ParallelIteration', 'ParallelBlock', 'Dereference', 'Lambda', 'SyncSpot',
-           'PragmaList', 'DummyExpr', 'BlankLine', 'ParallelTree']
+           'Iteration', 'List', 'LocalExpression', 'Section', 'TimedList', 'TracedList',
+           'CounteredList', 'Prodder', 'MetaCall', 'PointerCast', 'ForeignExpression',
+           'HaloSpot', 'IterationTree', 'ExpressionBundle', 'AugmentedExpression',
+           'Increment', 'Return', 'While', 'ParallelIteration', 'ParallelBlock',
+           'Dereference', 'Lambda', 'SyncSpot', 'PragmaList', 'DummyExpr', 'BlankLine',
+           'ParallelTree']
 
 # First-class IET nodes
 
@@ -417,18 +419,39 @@ class AugmentedExpression(Expression):
 
     is_Increment = True
 
+    is_augmented = True
+
     def __init__(self, expr, op, pragmas=None):
         super(AugmentedExpression, self).__init__(expr, pragmas=pragmas)
         self.op = op
 
+    @property
+    def operation(self):
+        """The reduction operation, a SymPy function such as Add or Max."""
+        return Add if self.op == '+' else None
+
 
 class Increment(AugmentedExpression):
 
-    """Shortcut for ``AugmentedExpression(expr, '+'), since it's so widely used."""
+    """
+    Shortcut for ``AugmentedExpression(expr, '+'), since it's so widely used.
+
+    If ``expr`` performs a different reduction operation, such as a max-reduction,
+    the Increment represents the assignment ``lhs = operation(lhs, rhs)``.
+    """
 
     def __init__(self, expr, pragmas=None):
         super(Increment, self).__init__(expr, '+', pragmas=pragmas)
 
+    @property
+    def operation(self):
+        return getattr(self.expr, 'operation', None) or Add
+
+    @property
+    def is_augmented(self):
+        """True if representable as an augmented assignment, False otherwise."""
+        return self.operation is Add
+
 
 class Iteration(Node):
 
@@ -773,6 +796,11 @@ class TimedList(List):
                                     '(end_ ## S .tv_sec-start_ ## S.tv_sec)+(double)'
                                     '(end_ ## S .tv_usec-start_ ## S .tv_usec)/1000000;'))
 
+    @classmethod
+    def _headers(cls):
+        """The C macros used by the TimedList."""
+        return [cls._start_timer_header(), cls._stop_timer_header()]
+
     @property
     def name(self):
         return self._name
@@ -781,11 +809,142 @@ class TimedList(List):
     def timer(self):
         return self._timer
 
+    @property
+    def extra_args(self):
+        """The objects, besides the Timer, used by the TimedList."""
+        return ()
+
     @property
     def free_symbols(self):
         return ()
 
 
+class TracedList(TimedList):
+
+    """
+    Wrap a Node with C-level timers, also recording the start and end time of
+    each of its executions in a ring buffer.
+
+    Parameters
+    ----------
+    timer : Timer
+        The Timer used by the TracedList.
+    tracer : Tracer
+        The Tracer in whose ring buffer the executions are recorded.
+    lname : str
+        A unique name for the timed code block. Must be one of the Tracer's
+        sections.
+    body : Node or list of Node
+        The TracedList body.
+    """
+
+    def __init__(self, timer, tracer, lname, body):
+        self._name = lname
+        self._timer = timer
+        self._tracer = tracer
+
+        index = tracer.sections.index(lname)
+        List.__init__(self,
+                      header=(c.Line('START_TIMER(%s)' % lname),
+                              c.Line('START_TRACE(%s)' % lname)),
+                      body=body,
+                      footer=(c.Line('STOP_TRACE(%s,%d,%s)' %
+                                     (lname, index, tracer.name)),
+                              c.Line('STOP_TIMER(%s,%s)' % (lname, timer.name))))
+
+    @classmethod
+    def _start_trace_header(cls):
+        return ('START_TRACE(S)', ('struct timespec tstart_ ## S , tend_ ## S ; '
+                                   'clock_gettime(CLOCK_MONOTONIC, &tstart_ ## S);'))
+
+    @classmethod
+    def _stop_trace_header(cls):
+        return ('STOP_TRACE(S,I,T)', ('clock_gettime(CLOCK_MONOTONIC, &tend_ ## S); '
+                                      'if (T->size > 0) { '
+                                      'long e_ ## S = 3*(T->nevents % T->size); '
+                                      'T->events[e_ ## S] = I; '
+                                      'T->events[e_ ## S + 1] = '
+                                      '(double)tstart_ ## S .tv_sec+'
+                                      '(double)tstart_ ## S .tv_nsec/1000000000; '
+                                      'T->events[e_ ## S + 2] = '
+                                      '(double)tend_ ## S .tv_sec+'
+                                      '(double)tend_ ## S .tv_nsec/1000000000; '
+                                      'T->nevents++; }'))
+
+    @classmethod
+    def _headers(cls):
+        return super()._headers() + [cls._start_trace_header(), cls._stop_trace_header()]
+
+    @property
+    def tracer(self):
+        return self._tracer
+
+    @property
+    def extra_args(self):
+        return (self._tracer,)
+
+
+class CounteredList(TimedList):
+
+    """
+    Wrap a Node with C-level timers as well as with hardware performance
+    counters, accumulating the events occurred within each of its executions.
+
+    Parameters
+    ----------
+    timer : Timer
+        The Timer used by the CounteredList.
+    counters : PerfCounters
+        The PerfCounters in which the events are accumulated.
+    lname : str
+        A unique name for the timed code block.
+    body : Node or list of Node
+        The CounteredList body.
+    """
+
+    def __init__(self, timer, counters, lname, body):
+        self._name = lname
+        self._timer = timer
+        self._counters = counters
+
+        header = [c.Line('START_TIMER(%s)' % lname)]
+        header.extend(c.Line('START_COUNTER(%s,%s,%s)' % (lname, i, counters.name))
+                      for i in counters.events)
+        footer = [c.Line('STOP_COUNTER(%s,%s,%s)' % (lname, i, counters.name))
+                  for i in counters.events]
+        footer.append(c.Line('STOP_TIMER(%s,%s)' % (lname, timer.name)))
+        List.__init__(self, header=header, body=body, footer=footer)
+
+    @classmethod
+    def _start_counter_header(cls):
+        return ('START_COUNTER(S,E,T)', ('long long cs_ ## S ## _ ## E = 0; '
+                                         'if (T->fd_ ## E >= 0) '
+                                         'read(T->fd_ ## E, &cs_ ## S ## _ ## E, '
+                                         'sizeof(long long));'))
+
+    @classmethod
+    def _stop_counter_header(cls):
+        return ('STOP_COUNTER(S,E,T)', ('long long ce_ ## S ## _ ## E = 0; '
+                                        'if (T->fd_ ## E >= 0) { '
+                                        'read(T->fd_ ## E, &ce_ ## S ## _ ## E, '
+                                        'sizeof(long long)); '
+                                        'T->S ## _ ## E += '
+                                        'ce_ ## S ## _ ## E - cs_ ## S ## _ ## E; }'))
+
+    @classmethod
+    def _headers(cls):
+        return super()._headers() + [cls._start_counter_header(),
+                                     cls._stop_counter_header()]
+
+    @property
+    def counters(self):
+        return self._counters
+
+    @property
+    def extra_args(self):
+        return (self._counters,)
+
+
 class PointerCast(ExprStmt, Node):
 
     """
@@ -13,7 +13,7 @@ from devito.exceptions import VisitorException
 from devito.ir.iet.nodes import Node, Iteration, Expression, Call, Lambda
 from devito.ir.support.space import Backward
 from devito.symbolics import ccode
-from devito.tools import GenericVisitor, as_tuple, filter_sorted, flatten
+from devito.tools import GenericVisitor, as_tuple, filter_ordered, filter_sorted, flatten
 from devito.types.basic import AbstractFunction
 from devito.types import ArrayObject, VoidPointer
 
@@ -274,6 +274,15 @@ class CGen(Visitor):
             code = c.Module(list(o.pragmas) + [code])
         return code
 
+    def visit_Increment(self, o):
+        if o.is_augmented:
+            return self.visit_AugmentedExpression(o)
+        rhs = o.operation(o.expr.lhs, o.expr.rhs, evaluate=False)
+        code = c.Assign(ccode(o.expr.lhs, dtype=o.dtype), ccode(rhs, dtype=o.dtype))
+        if o.pragmas:
+            code = c.Module(list(o.pragmas) + [code])
+        return code
+
     def visit_LocalExpression(self, o):
         if o.write.is_Array:
             lhs = '%s%s' % (
@@ -367,7 +376,15 @@ class CGen(Visitor):
         body = flatten(self._visit(i) for i in o.children)
         return c.Collection(body)
 
-    def visit_Operator(self, o):
+    def visit_Operator(self, o, mode='monolithic'):
+        """
+        Generate the C code of an Operator.
+
+        With `mode='monolithic'`, a single cgen Module is returned. With
+        `mode='split'`, each elemental function ends up in its own translation
+        unit, and a mapper from translation unit names to cgen Modules is
+        returned, the Operator's kernel being the last translation unit.
+        """
         blankline = c.Line("")
 
         # Kernel signature and body
@@ -378,31 +395,55 @@ class CGen(Visitor):
         kernel = c.FunctionBody(signature, c.Block(body + retval))
 
         # Elemental functions
-        esigns = []
-        efuncs = [blankline]
-        for i in o._func_table.values():
-            if i.local:
-                esigns.append(c.FunctionDeclaration(c.Value(i.root.retval, i.root.name),
-                                                    self._args_decl(i.root.parameters)))
-                efuncs.extend([i.root.ccode, blankline])
+        efuncs = OrderedDict([(i.root.name, i.root) for i in o._func_table.values()
+                              if i.local])
 
         # Header files, extra definitions, ...
         header = [c.Define(*i) for i in o._headers] + [blankline]
         includes = [c.Include(i, system=(False if i.endswith('.h') else True))
                     for i in o._includes]
         includes += [blankline]
-        cdefs = [i._C_typedecl for i in o.parameters if i._C_typedecl is not None]
-        for i in o._func_table.values():
-            if i.local:
-                cdefs.extend([j._C_typedecl for j in i.root.parameters
-                              if j._C_typedecl is not None])
-        cdefs = filter_sorted(cdefs, key=lambda i: i.tpname)
-        if o._compiler.src_ext == 'cpp':
-            cdefs += [c.Extern('C', signature)]
-        cdefs = [i for j in cdefs for i in (j, blankline)]
 
-        return c.Module(header + includes + cdefs +
-                        esigns + [blankline, kernel] + efuncs)
+        def make_preamble(callables, extern=None):
+            cdefs = [j._C_typedecl for i in callables for j in i.parameters
+                     if j._C_typedecl is not None]
+            cdefs = filter_sorted(cdefs, key=lambda i: i.tpname)
+            if extern is not None:
+                cdefs += [c.Extern('C', extern)]
+            return header + includes + [i for j in cdefs for i in (j, blankline)]
+
+        def make_esign(i):
+            return c.FunctionDeclaration(c.Value(i.retval, i.name),
+                                         self._args_decl(i.parameters))
+
+        if o._compiler.src_ext == 'cpp':
+            extern = signature
+        else:
+            extern = None
+
+        if mode == 'monolithic':
+            preamble = make_preamble([o] + list(efuncs.values()), extern)
+            esigns = [make_esign(i) for i in efuncs.values()]
+            ecode = [blankline]
+            for i in efuncs.values():
+                ecode.extend([i.ccode, blankline])
+            return c.Module(preamble + esigns + [blankline, kernel] + ecode)
+
+        assert mode == 'split'
+        units = OrderedDict()
+        for name, efunc in list(efuncs.items()) + [(o.name, o)]:
+            # Each translation unit only declares what it actually uses
+            callees = filter_ordered(efuncs[i.name] for i in FindNodes(Call).visit(efunc)
+                                     if i.name in efuncs and i.name != name)
+            if efunc is o:
+                code = kernel
+                preamble = make_preamble([o] + callees, extern)
+            else:
+                code = efunc.ccode
+                preamble = make_preamble([efunc] + callees)
+            esigns = [make_esign(i) for i in callees]
+            units[name] = c.Module(preamble + esigns + [blankline, code, blankline])
+        return units
 
 
 class FindSections(Visitor):
@@ -116,7 +116,12 @@ def stree_make_halo(stree):
         for f, v in hs.fmapper.items():
             spot = k
             ancestors = [n for n in k.ancestors if n.is_Iteration]
-            for n in ancestors:
+            # The halo exchange cannot be placed outside of the Iterations over
+            # the `loc_indices`' Dimensions (e.g., a time loop within time tiles)
+            roots = {d.root for d in v.loc_indices}
+            start = max([n + 1 for n, i in enumerate(ancestors)
+                         if i.dim.root in roots], default=0)
+            for n in ancestors[start:]:
                 # Place the halo exchange right before the first
                 # distributed Dimension which requires it
                 if any(i.dim in n.dim._defines for i in v.halos):
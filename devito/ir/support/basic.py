@@ -1,7 +1,7 @@
 from itertools import chain
 
 from cached_property import cached_property
-from sympy import S
+from sympy import Integer, S
 
 from devito.ir.support.space import Backward, IterationSpace
 from devito.ir.support.vector import LabeledVector, Vector
@@ -111,6 +111,25 @@ class IterationInstance(LabeledVector):
     def findices(self):
         return self.labels
 
+    @cached_property
+    def offsets(self):
+        """
+        The index functions split into a symbolic part and an integer offset,
+        for example `x + 2 -> (x, 2)`. Two index functions with the same symbolic
+        part are at a distance given by the difference of their offsets.
+        """
+        retval = []
+        for i in self:
+            try:
+                c, v = i.as_coeff_Add()
+            except AttributeError:
+                c, v = S.Zero, i
+            if c.is_Integer:
+                retval.append((v, int(c)))
+            else:
+                retval.append((i, 0))
+        return tuple(retval)
+
     @cached_property
     def defined_findices_affine(self):
         ret = set()
@@ -195,6 +214,16 @@ class TimedAccess(IterationInstance):
 
         return obj
 
+    def _retime(self, timestamp):
+        """
+        A copy of `self` with a different `timestamp`. The properties derived from
+        the index functions, which are expensive to compute, are shared.
+        """
+        obj = tuple.__new__(self.__class__, self)
+        obj.__dict__.update(self.__dict__)
+        obj.timestamp = timestamp
+        return obj
+
     def __repr__(self):
         mode = '\033[1;37;31mW\033[0m' if self.is_write else '\033[1;37;32mR\033[0m'
         return "%s<%s,[%s]>" % (mode, self.name, ', '.join(str(i) for i in self))
@@ -332,10 +361,15 @@ class TimedAccess(IterationInstance):
 
             if not ai or ai._defines & sit.dim._defines:
                 # E.g., `self=R<f,[t + 1, x]>`, `self.itintervals=(time, x)` and `ai=t`
-                if sit.direction is Backward:
-                    ret.append(other[n] - self[n])
+                sv, so = self.offsets[n]
+                ov, oo = other.offsets[n]
+                if sv is ov or sv == ov:
+                    # Same offset class, e.g. `x + 2` and `x - 1`, which spares
+                    # the far more expensive symbolic subtraction
+                    v = Integer(so - oo)
                 else:
-                    ret.append(self[n] - other[n])
+                    v = self[n] - other[n]
+                ret.append(-v if sit.direction is Backward else v)
             elif fi in sit.dim._defines:
                 # E.g., `self=R<u,[t+1, ii_src_0+1, ii_src_1+2]>` and `fi=p_src` (`n=1`)
                 ret.append(S.Infinity)
@@ -687,6 +721,8 @@ class Scope(object):
         """
         exprs = as_tuple(exprs)
 
+        self.exprs = exprs
+
         self.reads = {}
         self.writes = {}
 
@@ -719,18 +755,63 @@ class Scope(object):
                     v = self.reads.setdefault(j.function, [])
                     v.append(TimedAccess(j, 'R', -1, e.ispace))
 
-        # The iteration symbols too
-        dimensions = set().union(*[e.dimensions for e in exprs])
-        for d in dimensions:
-            for i in d._defines_symbols:
-                for j in i.free_symbols:
-                    v = self.reads.setdefault(j.function, [])
-                    v.append(TimedAccess(j, 'R', -1))
+        self._init_iteration_reads(set().union(*[e.dimensions for e in exprs]))
 
         # A set of rules to drive the collection of dependencies
         self.rules = as_tuple(rules)
         assert all(callable(i) for i in self.rules)
 
+    def _init_iteration_reads(self, dimensions, cache=None):
+        # The iteration symbols too. These accesses only depend on the symbol,
+        # hence they may be recycled from `cache`
+        self._dimensions = dimensions
+        self._iteration_reads = dict(cache or {})
+        for d in dimensions:
+            for i in d._defines_symbols:
+                for j in i.free_symbols:
+                    try:
+                        access = self._iteration_reads[j]
+                    except KeyError:
+                        access = self._iteration_reads[j] = TimedAccess(j, 'R', -1)
+                    self.reads.setdefault(j.function, []).append(access)
+
+    @classmethod
+    def concatenate(cls, scopes, rules=None):
+        """
+        The Scope of the concatenation of the expressions of several Scopes.
+
+        This is equivalent to, but much cheaper than, building a new Scope from
+        scratch, as the TimedAccesses of `scopes` are recycled.
+        """
+        obj = cls.__new__(cls)
+        obj.exprs = ()
+        obj.reads = {}
+        obj.writes = {}
+        obj.initialized = set()
+
+        dimensions = set()
+        cache = {}
+        for scope in as_tuple(scopes):
+            offset = len(obj.exprs)
+            exclude = {id(i) for i in scope._iteration_reads.values()}
+            for src, dst in [(scope.reads, obj.reads), (scope.writes, obj.writes)]:
+                for k, v in src.items():
+                    v = [a._retime(a.timestamp + offset) if offset and a.timestamp >= 0
+                         else a for a in v if id(a) not in exclude]
+                    if v:
+                        dst.setdefault(k, []).extend(v)
+            obj.initialized.update(scope.initialized)
+            obj.exprs += scope.exprs
+            dimensions.update(scope._dimensions)
+            cache.update(scope._iteration_reads)
+
+        obj._init_iteration_reads(dimensions, cache)
+
+        obj.rules = as_tuple(rules)
+        assert all(callable(i) for i in obj.rules)
+
+        return obj
+
     def getreads(self, function):
         return as_tuple(self.reads.get(function))
 
@@ -782,80 +863,102 @@ class Scope(object):
         return tuple(a for a in self.accesses
                      if a.timestamp in timestamps and a.mode in modes)
 
+    def _d_flow_gen(self, function, touched=None):
+        for w in self.writes.get(function, []):
+            for r in self.reads.get(function, []):
+                if touched is not None and id(w) not in touched and id(r) not in touched:
+                    continue
+
+                dependence = Dependence(w, r)
+
+                if any(not rule(dependence) for rule in self.rules):
+                    continue
+
+                distance = dependence.distance
+                try:
+                    is_flow = distance > 0 or (r.lex_ge(w) and distance == 0)
+                except TypeError:
+                    # Non-integer vectors are not comparable.
+                    # Conservatively, we assume it is a dependence, unless
+                    # it's a read-for-increment
+                    is_flow = not r.is_read_increment
+                if is_flow:
+                    yield dependence
+
     @memoized_generator
     def d_flow_gen(self):
         """Generate the flow (or "read-after-write") dependences."""
-        for k, v in self.writes.items():
-            for w in v:
-                for r in self.reads.get(k, []):
-                    dependence = Dependence(w, r)
-
-                    if any(not rule(dependence) for rule in self.rules):
-                        continue
-
-                    distance = dependence.distance
-                    try:
-                        is_flow = distance > 0 or (r.lex_ge(w) and distance == 0)
-                    except TypeError:
-                        # Non-integer vectors are not comparable.
-                        # Conservatively, we assume it is a dependence, unless
-                        # it's a read-for-increment
-                        is_flow = not r.is_read_increment
-                    if is_flow:
-                        yield dependence
+        for k in self.writes:
+            for i in self._d_flow_gen(k):
+                yield i
 
     @cached_property
     def d_flow(self):
         """Flow (or "read-after-write") dependences."""
         return DependenceGroup(self.d_flow_gen())
 
+    def _d_anti_gen(self, function, touched=None):
+        for w in self.writes.get(function, []):
+            for r in self.reads.get(function, []):
+                if touched is not None and id(w) not in touched and id(r) not in touched:
+                    continue
+
+                dependence = Dependence(r, w)
+
+                if any(not rule(dependence) for rule in self.rules):
+                    continue
+
+                distance = dependence.distance
+                try:
+                    is_anti = distance > 0 or (r.lex_lt(w) and distance == 0)
+                except TypeError:
+                    # Non-integer vectors are not comparable.
+                    # Conservatively, we assume it is a dependence, unless
+                    # it's a read-for-increment
+                    is_anti = not r.is_read_increment
+                if is_anti:
+                    yield dependence
+
     @memoized_generator
     def d_anti_gen(self):
         """Generate the anti (or "write-after-read") dependences."""
-        for k, v in self.writes.items():
-            for w in v:
-                for r in self.reads.get(k, []):
-                    dependence = Dependence(r, w)
-
-                    if any(not rule(dependence) for rule in self.rules):
-                        continue
-
-                    distance = dependence.distance
-                    try:
-                        is_anti = distance > 0 or (r.lex_lt(w) and distance == 0)
-                    except TypeError:
-                        # Non-integer vectors are not comparable.
-                        # Conservatively, we assume it is a dependence, unless
-                        # it's a read-for-increment
-                        is_anti = not r.is_read_increment
-                    if is_anti:
-                        yield dependence
+        for k in self.writes:
+            for i in self._d_anti_gen(k):
+                yield i
 
     @cached_property
     def d_anti(self):
         """Anti (or "write-after-read") dependences."""
         return DependenceGroup(self.d_anti_gen())
 
+    def _d_output_gen(self, function, touched=None):
+        for w1 in self.writes.get(function, []):
+            for w2 in self.writes.get(function, []):
+                if touched is not None and id(w1) not in touched and \
+                        id(w2) not in touched:
+                    continue
+
+                dependence = Dependence(w2, w1)
+
+                if any(not rule(dependence) for rule in self.rules):
+                    continue
+
+                distance = dependence.distance
+                try:
+                    is_output = distance > 0 or (w2.lex_gt(w1) and distance == 0)
+                except TypeError:
+                    # Non-integer vectors are not comparable.
+                    # Conservatively, we assume it is a dependence
+                    is_output = True
+                if is_output:
+                    yield dependence
+
     @memoized_generator
     def d_output_gen(self):
         """Generate the output (or "write-after-write") dependences."""
-        for k, v in self.writes.items():
-            for w1 in v:
-                for w2 in self.writes.get(k, []):
-                    dependence = Dependence(w2, w1)
-
-                    if any(not rule(dependence) for rule in self.rules):
-                        continue
-
-                    distance = dependence.distance
-                    try:
-                        is_output = distance > 0 or (w2.lex_gt(w1) and distance == 0)
-                    except TypeError:
-                        # Non-integer vectors are not comparable.
-                        # Conservatively, we assume it is a dependence
-                        is_output = True
-                    if is_output:
-                        yield dependence
+        for k in self.writes:
+            for i in self._d_output_gen(k):
+                yield i
 
     @cached_property
     def d_output(self):
@@ -878,11 +981,16 @@ class Scope(object):
         the given TimedAccess objects.
         """
         accesses = as_tuple(accesses)
-        for d in self.d_all_gen():
-            for i in accesses:
-                if d.source is i or d.sink is i:
-                    yield d
-                    break
+
+        # Only the pairs of accesses to the same Function, at least one of
+        # which in `accesses`, may be involved
+        touched = {id(i) for i in accesses}
+        functions = {i.function for i in accesses}
+        for gen in [self._d_flow_gen, self._d_anti_gen, self._d_output_gen]:
+            for k in self.writes:
+                if k in functions:
+                    for i in gen(k, touched):
+                        yield i
 
     @memoized_meth
     def d_from_access(self, accesses):
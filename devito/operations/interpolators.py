@@ -5,6 +5,7 @@ import numpy as np
 from cached_property import cached_property
 
 from devito.logger import warning
+from devito.parameters import configuration
 from devito.symbolics import retrieve_function_carriers, indexify, INT
 from devito.tools import powerset, flatten, prod
 from devito.types import (ConditionalDimension, Dimension, DefaultDimension, Eq, Inc,
@@ -74,11 +75,12 @@ class Injection(UnevaluatedSparseOperation):
     Evaluates to a list of Eq objects.
     """
 
-    def __init__(self, field, expr, offset, interpolator, callback):
+    def __init__(self, field, expr, offset, interpolator, callback, precompute=None):
         # TODO: unused now, but will be necessary to compute the adjoint
         self.field = field
         self.expr = expr
         self.offset = offset
+        self.precompute = precompute
 
         super(Injection, self).__init__(interpolator, callback)
 
@@ -161,7 +163,8 @@ class LinearInterpolator(GenericInterpolator):
         A = A.subs(reference_cell)
         return A.inv().T * p
 
-    def _interpolation_indices(self, variables, offset=0, field_offset=0):
+    def _interpolation_indices(self, variables, offset=0, field_offset=0,
+                               precompute=False):
         """
         Generate interpolation indices for the DiscreteFunctions in ``variables``.
         """
@@ -184,6 +187,17 @@ class LinearInterpolator(GenericInterpolator):
             # Track Indexed substitutions
             idx_subs.append(mapper)
 
+        if precompute:
+            # Temporaries for the indirection dimensions, loaded from the
+            # precomputed reference grid points
+            gridpoints, _ = self.sfunction._geometry
+            mapper = {idx: gridpoints.indexify((self.sfunction._sparse_dim, i))
+                      for i, idx in enumerate(self.sfunction._coordinate_indices)}
+            temps = [Eq(v, k.xreplace(mapper), implicit_dims=self.sfunction.dimensions)
+                     for k, v in points.items()]
+
+            return idx_subs, temps
+
         # Temporaries for the position
         temps = [Eq(v, k, implicit_dims=self.sfunction.dimensions)
                  for k, v in self.sfunction._position_map.items()]
@@ -199,6 +213,25 @@ class LinearInterpolator(GenericInterpolator):
 
         return idx_subs, temps
 
+    @property
+    def _precomputed(self):
+        """
+        True if the interpolation geometry (i.e., the reference grid points and
+        the interpolation coefficients) is to be precomputed once per Operator
+        application, rather than at each iteration of the time loop.
+        """
+        return configuration['sparse-precompute']
+
+    def _coefficients(self, precompute=False):
+        """
+        The interpolation coefficients, ordered as ``sfunction._point_increments``.
+        """
+        if precompute:
+            _, coeffs = self.sfunction._geometry
+            return [coeffs.indexify((self.sfunction._sparse_dim, i))
+                    for i in range(len(self.sfunction._point_increments))]
+        return self._interpolation_coeffs
+
     def interpolate(self, expr, offset=0, increment=False, self_subs={}):
         """
         Generate equations interpolating an arbitrary expression into ``self``.
@@ -227,11 +260,13 @@ class LinearInterpolator(GenericInterpolator):
             field_offset = variables[0].origin
             # List of indirection indices for all adjacent grid points
             idx_subs, temps = self._interpolation_indices(variables, offset,
-                                                          field_offset=field_offset)
+                                                          field_offset=field_offset,
+                                                          precompute=self._precomputed)
 
             # Substitute coordinate base symbols into the interpolation coefficients
+            coeffs = self._coefficients(self._precomputed)
             args = [_expr.xreplace(v_sub) * b.xreplace(v_sub)
-                    for b, v_sub in zip(self._interpolation_coeffs, idx_subs)]
+                    for b, v_sub in zip(coeffs, idx_subs)]
 
             # Accumulate point-wise contributions into a temporary
             rhs = Scalar(name='sum', dtype=self.sfunction.dtype)
@@ -247,7 +282,7 @@ class LinearInterpolator(GenericInterpolator):
 
         return Interpolation(expr, offset, increment, self_subs, self, callback)
 
-    def inject(self, field, expr, offset=0):
+    def inject(self, field, expr, offset=0, precompute=None):
         """
         Generate equations injecting an arbitrary expression into a field.
 
@@ -259,8 +294,13 @@ class LinearInterpolator(GenericInterpolator):
             Injected expression.
         offset : int, optional
             Additional offset from the boundary.
+        precompute : bool, optional
+            If True, the interpolation geometry is precomputed once per Operator
+            application. Defaults to ``configuration['sparse-precompute']``.
         """
         def callback():
+            _precompute = self._precomputed if precompute is None else precompute
+
             # Derivatives must be evaluated before the introduction of indirect accesses
             try:
                 _expr = expr.evaluate
@@ -274,16 +314,17 @@ class LinearInterpolator(GenericInterpolator):
             field_offset = field.origin
             # List of indirection indices for all adjacent grid points
             idx_subs, temps = self._interpolation_indices(variables, offset,
-                                                          field_offset=field_offset)
+                                                          field_offset=field_offset,
+                                                          precompute=_precompute)
 
             # Substitute coordinate base symbols into the interpolation coefficients
             eqns = [Inc(field.xreplace(vsub), _expr.xreplace(vsub) * b,
                         implicit_dims=self.sfunction.dimensions)
-                    for b, vsub in zip(self._interpolation_coeffs, idx_subs)]
+                    for b, vsub in zip(self._coefficients(_precompute), idx_subs)]
 
             return temps + eqns
 
-        return Injection(field, expr, offset, self, callback)
+        return Injection(field, expr, offset, self, callback, precompute)
 
 
 class PrecomputedInterpolator(GenericInterpolator):
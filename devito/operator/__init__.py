@@ -1,4 +1,5 @@
 from .symbols import SymbolRegistry  # noqa
-from .operator import Operator  # noqa
+from .operator import Operator, compile_all  # noqa
+from .checkpointing import Checkpointer  # noqa
 from .profiling import profiler_registry  # noqa
 from .registry import operator_registry  # noqa
@@ -0,0 +1,286 @@
+"""
+A persistent, on-disk cache of lowered Operators, such that the construction
+of an Operator identical to one built in a previous run (e.g., by a previous
+process) may skip lowering altogether.
+"""
+
+import os
+import pickle
+import sys
+from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+import sympy
+
+from devito.finite_differences import Derivative
+from devito.logger import debug, warning
+from devito.operator.profiling import profiling_level
+from devito.parameters import configuration
+from devito.symbolics import retrieve_functions
+from devito.tools import (Signer, as_tuple, filter_sorted, flatten, make_tempdir,
+                          timed_pass)
+from devito.types import Dimension, Eq
+
+__all__ = ['lowering_cache']
+
+
+class LoweringCache(object):
+
+    """
+    A cache of lowered, not yet jit-compiled, Operators, stored as pickles in
+    `configuration['lowering-cache-dir']`.
+
+    The cache key is a hash of the input expressions, the metadata of the objects
+    they use (Functions, Dimensions, Grids, ...), the Operator options, the target
+    platform, the configuration and the Devito version. The user-provided objects
+    are pickled by reference, so an Operator retrieved from the cache binds to the
+    objects provided upon construction, not to those of the Operator that was
+    stored.
+
+    The cache requires Python 3.8 or later, as it relies on
+    `pickle.Pickler.reducer_override` to preserve the lowered expressions as they
+    are; on earlier versions, it's disabled.
+    """
+
+    _warned = False
+
+    @property
+    def path(self):
+        path = configuration['lowering-cache-dir']
+        if path is None:
+            return make_tempdir('lowcache')
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def clear(self):
+        for i in self.path.glob('*.pkl'):
+            i.unlink()
+
+    def entry(self, cls, expressions, **kwargs):
+        """
+        The CacheEntry for an Operator of type `cls` constructed from `expressions`
+        and `kwargs`, or None if the cache is disabled.
+        """
+        if not configuration['lowering-cache']:
+            return None
+        if sys.version_info < (3, 8):
+            if not self._warned:
+                warning("The lowering cache requires Python 3.8 or later; disabled")
+                LoweringCache._warned = True
+            return None
+        return CacheEntry(self, cls, expressions, kwargs)
+
+
+class CacheEntry(object):
+
+    def __init__(self, cache, cls, expressions, kwargs):
+        self.cache = cache
+        self.kwargs = kwargs
+
+        # Pickles from a different Devito version might unpickle successfully,
+        # yet into objects the current version doesn't expect
+        from devito import __version__
+        items = [__version__, cls.__name__, str(configuration._signature_items())]
+        # The profiler instruments the IET, so it's part of the key too, even
+        # though it doesn't impact the JIT-compilation configuration
+        items.append(profiling_level())
+        for k in ['profiling-trace-size', 'profiling-counters']:
+            items.append(str(configuration[k]))
+        for k in ['mode', 'language', 'name']:
+            items.append(str(kwargs.get(k)))
+        items.append(str(sorted(kwargs['options'].items(), key=str)))
+        items.append(str(sorted(kwargs.get('subs', {}).items(), key=str)))
+        items.append(str(sorted(vars(kwargs['platform']).items(), key=str)))
+        exprs = []
+        for e in flatten(as_tuple(expressions)):
+            if isinstance(e, Eq):
+                items.extend([canonical(e), str(e.implicit_dims), str(e.subdomain),
+                              str(e.substitutions)])
+                exprs.append(e)
+            else:
+                # Injection and Interpolation
+                sfunction = e.interpolator.sfunction
+                items.extend([type(e).__name__, type(e.interpolator).__name__,
+                              sfunction.name])
+                for i in ['expr', 'field', 'offset', 'increment', 'self_subs']:
+                    items.append(canonical(getattr(e, i, None)))
+                exprs.extend([sympy.sympify(e.expr), sfunction])
+                if getattr(e, 'field', None) is not None:
+                    exprs.append(e.field)
+        self.objects = user_objects(exprs)
+        for k, v in self.objects.items():
+            items.extend([k, describe(v)])
+        self.key = Signer._sign(items)
+
+    @property
+    def filename(self):
+        return self.cache.path.joinpath('%s.pkl' % self.key)
+
+    @timed_pass(name='lowering-cache')
+    def load(self):
+        """
+        Retrieve the lowered Operator from the cache, or None if not available.
+        """
+        try:
+            with open(self.filename, 'rb') as f:
+                op = Unpickler(f, self.objects).load()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            debug("Couldn't load `%s` from the lowering cache [%s]" % (self.filename, e))
+            return None
+
+        # Bind to the current compiler and reset the compile-time timers
+        op._compiler = self.kwargs['compiler']
+        op._profiler.py_timers.clear()
+
+        return op
+
+    def store(self, op):
+        """
+        Store the lowered Operator `op` into the cache. Operators that can't be
+        pickled, or that use stateful objects not captured by the cache key, are
+        silently ignored.
+        """
+        # The Functions carrying user data must be bound upon retrieval
+        mapped = {id(i) for i in self.objects.values()}
+        unknown = [i.name for i in op.parameters
+                   if getattr(i, 'is_DiscreteFunction', False)
+                   and id(i.function) not in mapped]
+        if unknown:
+            debug("Operator `%s` not stored in the lowering cache [unexpected `%s`]"
+                  % (op.name, ', '.join(unknown)))
+            return
+
+        try:
+            buf = BytesIO()
+            Pickler(buf, self.objects).dump(op)
+        except Exception as e:
+            debug("Operator `%s` not stored in the lowering cache [%s]" % (op.name, e))
+            return
+
+        # Write then rename, so that concurrent readers only ever see complete files
+        with NamedTemporaryFile(dir=self.cache.path, delete=False) as f:
+            f.write(buf.getvalue())
+        os.replace(f.name, self.filename)
+
+
+class Pickler(pickle.Pickler):
+
+    def __init__(self, file, objects):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.mapper = {id(v): k for k, v in objects.items()}
+
+    def persistent_id(self, obj):
+        return self.mapper.get(id(obj))
+
+    def reducer_override(self, obj):
+        # Note: only called as of Python 3.8
+        # By default, SymPy would re-evaluate the arithmetic operations upon
+        # unpickling, thus potentially altering the lowered expressions (e.g.,
+        # `a*a` would become `a**2`)
+        if isinstance(obj, (sympy.Add, sympy.Mul, sympy.Pow)):
+            return unevaluated, (obj.func, obj.args)
+        return NotImplemented
+
+
+def unevaluated(func, args):
+    return func(*args, evaluate=False)
+
+
+class Unpickler(pickle.Unpickler):
+
+    def __init__(self, file, objects):
+        super().__init__(file)
+        self.objects = objects
+
+    def persistent_load(self, pid):
+        return self.objects[pid]
+
+
+def user_objects(exprs):
+    """
+    A mapper from unique, deterministic keys to the user-provided objects (Functions,
+    Dimensions, Grids, ...) reachable from `exprs`.
+    """
+    functions = {f.function for f in retrieve_functions(exprs)}
+    functions.update(flatten([getattr(f, i) for i in getattr(f, '_sub_functions', ())]
+                             for f in list(functions)))
+    functions = filter_sorted(functions - {None}, key=lambda f: f.name)
+
+    symbols = set()
+    for e in exprs:
+        symbols.update(e.free_symbols)
+        symbols.update(getattr(e, 'implicit_dims', ()))
+    for f in functions:
+        symbols.update(f.dimensions)
+        if f.grid is not None:
+            symbols.update(f.grid.dimensions)
+            symbols.update([f.grid.time_dim, f.grid.stepping_dim])
+    symbols.update(flatten(d._defines for d in symbols if isinstance(d, Dimension)))
+    symbols = [i for i in symbols
+               if hasattr(i, 'name') and not getattr(i, 'is_Indexed', False)]
+    symbols = filter_sorted(set(symbols) - set(functions),
+                            key=lambda i: (type(i).__name__, i.name))
+
+    objects = {}
+    for i in functions + symbols:
+        objects['%s:%s' % (type(i).__name__, i.name)] = i
+
+    grids = sorted({f.grid for f in functions if f.grid is not None},
+                   key=lambda g: min(f.name for f in functions if f.grid is g))
+    for n, g in enumerate(grids):
+        objects['Grid:%d' % n] = g
+        objects['Distributor:%d' % n] = g.distributor
+
+    return objects
+
+
+def canonical(expr, memo=None):
+    """
+    A deterministic string representation of `expr`. Unlike `str(expr)`, this
+    captures the metadata of the Derivatives (e.g., the FD order); it's also much
+    cheaper, since the arguments of SymPy objects are already in canonical order.
+    """
+    if not isinstance(expr, sympy.Basic):
+        return str(expr)
+    if expr.is_Atom:
+        return '%s:%s' % (type(expr).__name__, expr)
+
+    memo = {} if memo is None else memo
+    try:
+        return memo[expr]
+    except KeyError:
+        pass
+
+    items = [canonical(i, memo) for i in expr.args]
+    if isinstance(expr, Derivative):
+        items.extend(str(i) for i in [expr.fd_order, expr.deriv_order, expr.side,
+                                      expr.transpose, expr._subs, expr.x0])
+    ret = memo[expr] = '%s(%s)' % (type(expr).__name__, ','.join(items))
+
+    return ret
+
+
+def describe(obj):
+    """
+    A string summarizing the metadata of a user-provided object, which determines,
+    together with the input expressions, the code of an Operator.
+    """
+    items = []
+    if hasattr(obj, 'distributor'):
+        items.extend([str(obj), str(obj.shape_local), str(obj.dtype)])
+    elif hasattr(obj, 'topology'):
+        items.extend([str(obj.nprocs), str(obj.myrank), str(obj.topology)])
+    else:
+        exclude = ['initializer', '_value', 'grid', 'function', 'parent']
+        for k in getattr(obj, '_pickle_args', []) + getattr(obj, '_pickle_kwargs', []):
+            if k not in exclude:
+                items.append('%s=%s' % (k, getattr(obj, k, None)))
+        items.append(str(getattr(obj, 'shape_allocated', None)))
+    return ','.join(items)
+
+
+lowering_cache = LoweringCache()
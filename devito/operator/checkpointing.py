@@ -0,0 +1,337 @@
+"""
+Memory-bounded checkpointed execution of a forward/reverse pair of Operators,
+as required, for example, to compute the gradient of an objective functional
+without storing the entire time history of the forward wavefield.
+"""
+
+from collections import namedtuple
+from tempfile import TemporaryFile
+
+import numpy as np
+
+from devito.logger import perf
+from devito.tools import as_tuple
+
+__all__ = ['Checkpointer', 'revolve']
+
+
+Action = namedtuple('Action', 'type capo end slot')
+Action.__doc__ = """
+A step of a checkpointing schedule. The `type` is one of:
+
+    * 'advance': run the forward Operator over the timesteps [capo, end);
+    * 'lastfw': like 'advance', but it also concludes the forward sweep;
+    * 'takeshot': store the state at timestep `capo` into `slot`;
+    * 'restore': load the state at timestep `capo` from `slot`;
+    * 'revstart': run the reverse Operator at timestep `capo`;
+    * 'reverse': run the forward Operator and then the reverse Operator at
+      timestep `capo`.
+"""
+
+
+def binomial(n, k):
+    """
+    The binomial coefficient `n` choose `k` (`math.comb` requires Python 3.8).
+    """
+    if k < 0 or k > n:
+        return 0
+    ret = 1
+    for i in range(min(k, n - k)):
+        ret = ret * (n - i) // (i + 1)
+    return ret
+
+
+def binomial_cost(nsteps, nfree):
+    """
+    The minimum number of forward timesteps required to reverse `nsteps`
+    timesteps, given a checkpoint at the first timestep and `nfree` additional
+    checkpoints [Griewank2000].
+    """
+    if nsteps <= 1:
+        return nsteps
+    r = 0
+    while binomial(nfree + 1 + r, nfree + 1) < nsteps:
+        r += 1
+    return (r + 1)*nsteps - binomial(nfree + 1 + r, nfree + 2)
+
+
+def binomial_split(nsteps, nfree):
+    """
+    The offset of the next checkpoint to be taken, given a checkpoint at the
+    first of `nsteps` timesteps and `nfree` additional checkpoints. This minimizes
+    the number of recomputed timesteps.
+    """
+    # The cost as a function of the split point is convex, so we bisect over
+    # its discrete derivative
+    cost = lambda m: m + binomial_cost(nsteps - m, nfree - 1) + binomial_cost(m, nfree)
+    lo, hi = 1, nsteps - 1
+    while lo < hi:
+        m = (lo + hi) // 2
+        if cost(m + 1) >= cost(m):
+            hi = m
+        else:
+            lo = m + 1
+    return lo
+
+
+def revolve(nt, ncheckpoints):
+    """
+    Generate an optimal binomial checkpointing schedule, as in the
+    Revolve algorithm [Griewank2000].
+
+    Parameters
+    ----------
+    nt : int
+        The number of timesteps.
+    ncheckpoints : int
+        The number of checkpoints that may be stored at the same time.
+
+    Returns
+    -------
+    Two lists of Actions, for the forward and the reverse sweeps.
+
+    References
+    ----------
+    .. [Griewank2000] A. Griewank and A. Walther, "Algorithm 799: revolve: an
+       implementation of checkpointing for the reverse or adjoint mode of
+       computational differentiation," ACM Trans. Math. Softw., 26(1), 2000.
+    """
+    if nt < 1 or ncheckpoints < 1:
+        raise ValueError("Expected at least one timestep and one checkpoint")
+
+    # The forward sweep stores checkpoints along the way, placed so to optimally
+    # reverse [0, nt-1) -- the last timestep is reversed straight away
+    fwd = []
+    chain = []
+    capo, nfree = 0, ncheckpoints - 1
+    while True:
+        fwd.append(Action('takeshot', capo, None, len(chain)))
+        chain.append((capo, nfree))
+        if nfree == 0 or nt - 1 - capo <= 1:
+            break
+        m = capo + binomial_split(nt - 1 - capo, nfree)
+        fwd.append(Action('advance', capo, m, None))
+        capo, nfree = m, nfree - 1
+    fwd.append(Action('lastfw', capo, nt, None))
+
+    # The reverse sweep processes the segments between adjacent checkpoints,
+    # from the last to the first one
+    rev = [Action('revstart', nt - 1, None, None)]
+    end = nt - 1
+    for slot, (capo, nfree) in reversed(list(enumerate(chain))):
+        _treeverse(rev, capo, end, nfree, slot)
+        end = capo
+
+    return fwd, rev
+
+
+def _treeverse(actions, capo, end, nfree, slot):
+    """
+    Append to `actions` the schedule to reverse the timesteps [capo, end),
+    given the checkpoint at `capo` in `slot` and `nfree` additional checkpoints.
+    """
+    while end > capo:
+        nsteps = end - capo
+        if nsteps == 1 or nfree == 0:
+            for t in range(end - 1, capo - 1, -1):
+                actions.append(Action('restore', capo, None, slot))
+                if t > capo:
+                    actions.append(Action('advance', capo, t, None))
+                actions.append(Action('reverse', t, None, None))
+            return
+        m = capo + binomial_split(nsteps, nfree)
+        actions.append(Action('restore', capo, None, slot))
+        actions.append(Action('advance', capo, m, None))
+        actions.append(Action('takeshot', m, None, slot + 1))
+        _treeverse(actions, m, end, nfree - 1, slot + 1)
+        end = m
+
+
+class CheckpointStorage(object):
+
+    """
+    Preallocated host buffers, optionally followed by memory-mapped files, in
+    which the state of a set of TimeFunctions is stored.
+
+    Parameters
+    ----------
+    functions : list of TimeFunction
+        The TimeFunctions whose state is checkpointed.
+    nmemory : int
+        The number of checkpoints stored in host memory.
+    ndisk : int, optional
+        The number of checkpoints stored in memory-mapped files. Defaults to 0.
+    disk_dir : str, optional
+        The directory of the memory-mapped files. Defaults to the system's
+        temporary directory. The files are deleted once the storage is released.
+    """
+
+    def __init__(self, functions, nmemory, ndisk=0, disk_dir=None):
+        self.functions = as_tuple(functions)
+        self.nmemory = nmemory
+        self.ndisk = ndisk
+
+        # The entire allocated data is stored (rather than just the domain region),
+        # since it's contiguous in memory and thus faster to copy
+        self._memory = [np.empty((nmemory,) + f._data_buffer.shape, dtype=f.dtype)
+                        for f in self.functions]
+        self._disk = []
+        if ndisk > 0:
+            for f in self.functions:
+                fp = TemporaryFile(dir=disk_dir)
+                self._disk.append(np.memmap(fp, dtype=f.dtype, mode='w+',
+                                            shape=(ndisk,) + f._data_buffer.shape))
+
+    @classmethod
+    def nbytes_per_checkpoint(cls, functions):
+        return sum(f._data_buffer.nbytes for f in as_tuple(functions))
+
+    def _buffers(self, slot):
+        if slot < self.nmemory:
+            return [i[slot] for i in self._memory]
+        else:
+            return [i[slot - self.nmemory] for i in self._disk]
+
+    def save(self, slot):
+        for f, b in zip(self.functions, self._buffers(slot)):
+            np.copyto(b, f._data_buffer)
+
+    def load(self, slot):
+        for f, b in zip(self.functions, self._buffers(slot)):
+            np.copyto(f._data_buffer, b)
+
+
+class Checkpointer(object):
+
+    """
+    Run a forward Operator and then a reverse (e.g., adjoint) Operator, with
+    the forward state required by the latter recomputed from a limited number
+    of checkpoints, scheduled as in the Revolve algorithm.
+
+    Parameters
+    ----------
+    fwd_op : Operator
+        The forward Operator.
+    rev_op : Operator
+        The reverse Operator.
+    wavefields : list of TimeFunction
+        The forward wavefields, that is the state to be checkpointed.
+    nt : int
+        The number of timesteps.
+    fwd_args : dict, optional
+        The runtime arguments of the forward Operator.
+    rev_args : dict, optional
+        The runtime arguments of the reverse Operator.
+    ncheckpoints : int, optional
+        The number of checkpoints. By default, this is derived from the memory
+        and disk budgets, if any, or it is chosen so that each forward timestep
+        is recomputed at most twice.
+    memory : int, optional
+        The maximum amount of host memory, in bytes, used for the checkpoints.
+    disk : int, optional
+        The maximum amount of disk space, in bytes, used for the checkpoints that
+        do not fit in ``memory``. These are stored in memory-mapped files.
+    disk_dir : str, optional
+        The directory in which the memory-mapped files are created.
+
+    Examples
+    --------
+    >>> from devito import Grid, TimeFunction, Function, Eq, Operator, Checkpointer
+    >>> grid = Grid(shape=(4, 4))
+    >>> u = TimeFunction(name='u', grid=grid)
+    >>> v = TimeFunction(name='v', grid=grid)
+    >>> g = Function(name='g', grid=grid)
+    >>> fwd_op = Operator(Eq(u.forward, u + 1))
+    >>> rev_op = Operator([Eq(v.backward, v + 1), Eq(g, g + u*v)])
+    >>> cp = Checkpointer(fwd_op, rev_op, [u], nt=8, ncheckpoints=3)
+    >>> cp.apply_forward()
+    >>> summary = cp.apply_reverse()
+    """
+
+    def __init__(self, fwd_op, rev_op, wavefields, nt, fwd_args=None, rev_args=None,
+                 ncheckpoints=None, memory=None, disk=None, disk_dir=None):
+        self.wavefields = as_tuple(wavefields)
+        self.nt = nt
+
+        nbytes = CheckpointStorage.nbytes_per_checkpoint(self.wavefields)
+        nmemory = memory // nbytes if memory is not None else None
+        ndisk = disk // nbytes if disk is not None else 0
+        if ncheckpoints is None:
+            if nmemory is None:
+                # At most two recomputations of each forward timestep
+                ncheckpoints = 1
+                while binomial(ncheckpoints + 2, 2) < nt:
+                    ncheckpoints += 1
+                if disk is not None:
+                    ncheckpoints = min(ncheckpoints, ndisk)
+            else:
+                ncheckpoints = nmemory + ndisk
+        ncheckpoints = min(ncheckpoints, nt)
+        if nmemory is None:
+            nmemory = ncheckpoints if disk is None else 0
+        nmemory = min(nmemory, ncheckpoints)
+        if ncheckpoints < 1 or ncheckpoints - nmemory > ndisk:
+            raise ValueError("Cannot fit the checkpoints, each of %d bytes, within "
+                             "the given memory and disk budgets" % nbytes)
+        self.ncheckpoints = ncheckpoints
+
+        self.storage = CheckpointStorage(self.wavefields, nmemory,
+                                         ncheckpoints - nmemory, disk_dir)
+        self.schedule = revolve(nt, ncheckpoints)
+
+        time_dim = self.wavefields[0].time_dim.root
+        self.fwd = fwd_op.prepare(**(fwd_args or {}))
+        self.rev = rev_op.prepare(**(rev_args or {}))
+
+        # The Operators may start iterating at different offsets
+        self.min_name = time_dim.min_name
+        self.max_name = time_dim.max_name
+        self.offsets = {self.fwd: self.fwd.args[self.min_name],
+                        self.rev: self.rev.args[self.min_name]}
+
+        nrecomputed = sum(i.end - i.capo if i.type == 'advance' else 1
+                          for i in self.schedule[1] if i.type in ('advance', 'reverse'))
+        perf("Checkpointing `%s`: %d checkpoints (%d on disk), %d recomputed "
+             "timesteps out of %d" % (fwd_op.name, ncheckpoints, ncheckpoints - nmemory,
+                                      nrecomputed, nt))
+
+    def _apply(self, call, t_start, t_end):
+        offset = self.offsets[call]
+        call.run(**{self.min_name: t_start + offset, self.max_name: t_end - 1 + offset})
+
+    def _run(self, actions):
+        for action in actions:
+            if action.type in ('advance', 'lastfw'):
+                self._apply(self.fwd, action.capo, action.end)
+            elif action.type == 'takeshot':
+                self.storage.save(action.slot)
+            elif action.type == 'restore':
+                self.storage.load(action.slot)
+            elif action.type == 'revstart':
+                self._apply(self.rev, action.capo, action.capo + 1)
+            elif action.type == 'reverse':
+                self._apply(self.fwd, action.capo, action.capo + 1)
+                self._apply(self.rev, action.capo, action.capo + 1)
+            else:
+                raise ValueError("Unknown action `%s`" % action.type)
+
+    def apply_forward(self):
+        """
+        Run the forward Operator over all timesteps, storing checkpoints
+        along the way.
+        """
+        self._run(self.schedule[0])
+        self.fwd.finalize()
+
+    def apply_reverse(self):
+        """
+        Run the reverse Operator over all timesteps, backwards, recomputing
+        the forward state from the checkpoints as needed.
+
+        Returns
+        -------
+        PerformanceSummary
+            The performance summary of the reverse Operator.
+        """
+        self._run(self.schedule[1])
+        return self.rev.finalize()
@@ -1,19 +1,24 @@
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import reduce
 from operator import attrgetter, mul
 from math import ceil
+from time import time as seq_time
 
 from cached_property import cached_property
 import ctypes
+import numpy as np
 
 from devito.arch import compiler_registry, platform_registry
 from devito.exceptions import InvalidOperator
 from devito.logger import info, perf, warning, is_log_enabled_for
 from devito.ir.equations import LoweredEq, lower_exprs, generate_implicit_exprs
 from devito.ir.clusters import ClusterGroup, clusterize
-from devito.ir.iet import Callable, EntryFunction, MetaCall, derive_parameters, iet_build
+from devito.ir.iet import (CGen, Callable, EntryFunction, MetaCall, derive_parameters,
+                           iet_build)
 from devito.ir.stree import stree_build
-from devito.operator.profiling import create_profile
+from devito.operator.caching import lowering_cache
+from devito.operator.profiling import BuildSummary, create_profile
 from devito.operator.registry import operator_selector
 from devito.operator.symbols import SymbolRegistry
 from devito.mpi import MPI
@@ -21,10 +26,10 @@ from devito.parameters import configuration
 from devito.passes import Graph, instrument
 from devito.symbolics import estimate_cost
 from devito.tools import (DAG, Signer, ReducerMap, as_tuple, flatten, filter_ordered,
-                          filter_sorted, split, timed_pass, timed_region)
-from devito.types import Evaluable
+                          filter_sorted, memoized_func, split, timed_pass, timed_region)
+from devito.types import Evaluable, NThreads, Timer
 
-__all__ = ['Operator']
+__all__ = ['Operator', 'compile_all']
 
 
 class Operator(Callable):
@@ -152,10 +157,18 @@ class Operator(Callable):
         # Create a symbol registry
         kwargs['sregistry'] = SymbolRegistry()
 
-        # Lower to a JIT-compilable object
+        # Lower to a JIT-compilable object, unless one was already stored in the
+        # lowering cache by a previous run
         with timed_region('op-compile') as r:
-            op = cls._build(expressions, **kwargs)
+            entry = lowering_cache.entry(cls, expressions, **kwargs)
+            op = entry.load() if entry is not None else None
+            cached = op is not None
+            if not cached:
+                op = cls._build(expressions, **kwargs)
+                if entry is not None:
+                    entry.store(op)
         op._profiler.py_timers.update(r.timings)
+        op._build_summary = BuildSummary(r.timings, 'op-compile', cached)
 
         # Emit info about how long it took to perform the lowering
         op._emit_build_profiling()
@@ -205,6 +218,7 @@ class Operator(Callable):
         op._compiler = kwargs['compiler']
         op._lib = None
         op._cfunction = None
+        op._jit_future = None
 
         # References to local or external routines
         op._func_table = OrderedDict()
@@ -395,6 +409,14 @@ class Operator(Callable):
 
     # Read-only properties exposed to the outside world
 
+    @property
+    def build_summary(self):
+        """
+        A BuildSummary with the time spent in each compilation pass while
+        building the Operator.
+        """
+        return self._build_summary
+
     @cached_property
     def output(self):
         return tuple(self._output)
@@ -527,6 +549,8 @@ class Operator(Callable):
                 pass
         for d in self.dimensions:
             ret.update(d._arg_names)
+        for o in self.objects:
+            ret.update(o._arg_names)
         return frozenset(ret)
 
     def _autotune(self, args, setup):
@@ -557,17 +581,97 @@ class Operator(Callable):
         Operator, reagardless of how many times this method is invoked.
         """
         if self._lib is None:
-            with self._profiler.timer_on('jit-compile'):
-                recompiled, src_file = self._compiler.jit_compile(self._soname,
-                                                                  str(self.ccode))
-
-            elapsed = self._profiler.py_timers['jit-compile']
-            if recompiled:
-                perf("Operator `%s` jit-compiled `%s` in %.2f s with `%s`" %
-                     (self.name, src_file, elapsed, self._compiler))
+            if self._jit_future is not None:
+                # JIT compilation started through `compile_async`; we just wait
+                # for its completion, which re-raises any compilation error
+                self._jit_future.result()
+                return
+
+            self._jit_compile_code(self._soname, self._jit_code)
+
+    @property
+    def _jit_code(self):
+        """
+        The C code to be JIT-compiled. With `jit-split`, this is a mapper from
+        translation unit names to C code, one translation unit per efunc.
+        """
+        if configuration['jit-split'] and not configuration['jit-backdoor']:
+            units = CGen().visit(self, mode='split')
+            return OrderedDict((k, str(v)) for k, v in units.items())
+        else:
+            return str(self.ccode)
+
+    def _jit_compile_code(self, soname, code):
+        with self._profiler.timer_on('jit-compile'):
+            recompiled, src_file = self._compiler.jit_build(soname, code, self._jit_comm)
+
+        elapsed = self._profiler.py_timers['jit-compile']
+        if recompiled:
+            perf("Operator `%s` jit-compiled `%s` in %.2f s with `%s`" %
+                 (self.name, src_file, elapsed, self._compiler))
+        else:
+            perf("Operator `%s` fetched `%s` in %.2f s from jit-cache" %
+                 (self.name, src_file, elapsed))
+
+        return self
+
+    def compile_async(self):
+        """
+        JIT-compile the C code generated by the Operator in the background.
+
+        The C compiler runs in a separate thread, so that the caller may carry
+        on with other work (e.g., setting up the runtime arguments or
+        compiling other Operators). Repeated invocations of this method return
+        the same Future. The codepy cache locking is still in place, so two
+        Operators with the same C code are never compiled concurrently.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A Future whose result is the Operator itself, once compiled.
+
+        Examples
+        --------
+        >>> from devito import Eq, Grid, TimeFunction, Operator
+        >>> grid = Grid(shape=(3, 3))
+        >>> u = TimeFunction(name='u', grid=grid)
+        >>> op = Operator(Eq(u.forward, u + 1))
+        >>> future = op.compile_async()
+        >>> summary = op.apply(time_M=1)  # Waits for the compilation to complete
+        """
+        if self._jit_future is None:
+            # The C code is generated upfront, as the IET isn't thread-safe
+            soname = self._soname
+            code = self._jit_code
+            if self._jit_comm is not None:
+                # The `broadcast` JIT cache requires collective communications,
+                # which must not be issued from a separate thread
+                self._jit_future = Future()
+                try:
+                    self._jit_future.set_result(self._jit_compile_code(soname, code))
+                except Exception as e:
+                    self._jit_future.set_exception(e)
             else:
-                perf("Operator `%s` fetched `%s` in %.2f s from jit-cache" %
-                     (self.name, src_file, elapsed))
+                self._jit_future = jit_executor().submit(self._jit_compile_code,
+                                                         soname, code)
+        return self._jit_future
+
+    @property
+    def _jit_comm(self):
+        """
+        The MPI communicator used by the `broadcast` JIT cache, if any, None
+        otherwise.
+        """
+        if not configuration['mpi'] or configuration['jit-cache'] != 'broadcast':
+            return None
+        grids = {getattr(i, 'grid', None) for i in self.input}
+        grids.discard(None)
+        if len(grids) != 1:
+            return None
+        comm = grids.pop().comm
+        if comm is MPI.COMM_NULL or comm.size == 1:
+            return None
+        return comm
 
     @property
     def cfunction(self):
@@ -657,10 +761,165 @@ class Operator(Callable):
 
         # Invoke kernel function with args
         arg_values = [args[p.name] for p in self.parameters]
+        cfunction = self.cfunction
+        with self._profiler.timer_on('apply', comm=args.comm):
+            self._invoke(cfunction, arg_values)
+
+        # Post-process runtime arguments
+        self._postprocess_arguments(args, **kwargs)
+
+        # Output summary of performance achieved
+        return self._emit_apply_profiling(args)
+
+    def apply_batch(self, batch, nworkers=None):
+        """
+        Execute the Operator once for each set of arguments in ``batch``.
+
+        The runs share the same JIT-compiled kernel, and up to ``nworkers`` of them
+        take place at the same time, each one on its own subgroup of threads. This
+        is useful, for example, to process many shots of a seismic survey, where
+        the model parameters are shared (read-only) across all runs while the
+        wavefields and the source/receiver sets change from shot to shot.
+
+        Parameters
+        ----------
+        batch : list of dict
+            The arguments of each run, in the same format as those of ``apply``.
+        nworkers : int, optional
+            The maximum number of concurrent runs. Defaults to the number of
+            physical cores, capped to ``len(batch)``. The threads available
+            to the Operator are evenly split among the workers, unless the number
+            of threads is explicitly provided in ``batch``. With MPI, the runs
+            are necessarily executed one after the other.
+
+        Returns
+        -------
+        list of PerformanceSummary
+            One PerformanceSummary per run, in the same order as ``batch``.
+
+        Notes
+        -----
+        Concurrent runs must write to different objects. For example, each
+        shot must use its own TimeFunction for the wavefield and its own
+        SparseTimeFunction for the receivers.
+
+        Examples
+        --------
+        >>> from devito import Eq, Grid, Function, TimeFunction, Operator
+        >>> grid = Grid(shape=(3, 3))
+        >>> m = Function(name='m', grid=grid)
+        >>> u = TimeFunction(name='u', grid=grid)
+        >>> op = Operator(Eq(u.forward, u + m))
+        >>> us = [TimeFunction(name='u', grid=grid) for _ in range(4)]
+        >>> summaries = op.apply_batch([{'u': i, 'time_M': 2} for i in us])
+        """
+        batch = [dict(i) for i in batch]
+        if not batch:
+            return []
+
+        nworkers = nworkers or configuration['platform'].cores_physical
+        nworkers = max(min(nworkers, len(batch)), 1)
+
+        # Split the available threads among the concurrent runs
+        nthreads = [i for i in self.input if isinstance(i, NThreads)]
+        for kwargs in batch:
+            for p in nthreads:
+                if not any(i in kwargs for i in p._arg_names):
+                    kwargs[p.name] = max(p.default_value() // nworkers, 1)
+
+        # Build the arguments lists to invoke the kernel function. Each run gets
+        # its own profiling timers, as concurrent runs would otherwise clash
+        timers = [i for i in self.parameters if isinstance(i, Timer)]
+        argss = []
+        with self._profiler.timer_on('arguments'):
+            for kwargs in batch:
+                for t in timers:
+                    kwargs.setdefault(t.name, ctypes.byref(t.dtype._type_()))
+                argss.append(self.arguments(**kwargs))
+
+        if any(args.comm is not MPI.COMM_NULL for args in argss):
+            # The runs would concurrently issue MPI calls over the same communicator
+            nworkers = 1
+        elif nworkers > 1:
+            for f in self.output:
+                if not f.is_DiscreteFunction:
+                    continue
+                objs = [id(kwargs.get(f.name, f)) for kwargs in batch]
+                if len(set(objs)) < len(objs):
+                    raise ValueError("Concurrent runs cannot write to the same `%s`; "
+                                     "pass a different `%s` to each run or set "
+                                     "`nworkers=1`" % (f.name, f.name))
+
+        # The kernel function is JIT-compiled (if necessary) upfront
+        cfunction = self.cfunction
+
+        def run(args):
+            arg_values = [args[p.name] for p in self.parameters]
+            tic = seq_time()
+            self._invoke(cfunction, arg_values)
+            return seq_time() - tic
+
+        # ctypes releases the GIL upon calling into C, so Python threads suffice
+        # to run the kernel function concurrently
+        with self._profiler.timer_on('apply_batch'):
+            if nworkers == 1:
+                timings = [run(args) for args in argss]
+            else:
+                with ThreadPoolExecutor(max_workers=nworkers) as executor:
+                    timings = list(executor.map(run, argss))
+
+        info("Operator `%s` ran a batch of %d runs in %.2f s" %
+             (self.name, len(batch), ceil(self._profiler.py_timers['apply_batch']*100)
+              / 100))
+
+        summaries = []
+        for args, kwargs, timing in zip(argss, batch, timings):
+            # Post-process runtime arguments
+            self._postprocess_arguments(args, **kwargs)
+
+            # Output summary of performance achieved
+            self._profiler.py_timers['apply'] = timing
+            summaries.append(self._emit_apply_profiling(args))
+
+        return summaries
+
+    def prepare(self, **kwargs):
+        """
+        Process the runtime arguments once, for the Operator to be then run
+        repeatedly at a low overhead.
+
+        Parameters
+        ----------
+        **kwargs
+            The runtime arguments, as in ``apply``.
+
+        Returns
+        -------
+        PreparedCall
+            An object whose method ``run`` executes the Operator. Only the
+            arguments passed to ``run`` are re-processed; these are typically
+            the iteration bounds, the scalar values, or Functions replaced by
+            others of identical shape.
+
+        Examples
+        --------
+        >>> from devito import Eq, Grid, TimeFunction, Operator
+        >>> grid = Grid(shape=(3, 3))
+        >>> u = TimeFunction(name='u', grid=grid)
+        >>> op = Operator(Eq(u.forward, u + 1))
+        >>> call = op.prepare()
+        >>> for i in range(4):
+        ...     call.run(time_m=2*i, time_M=2*i+1)
+        >>> summary = call.finalize()
+        >>> u.data[0, 0, 0]
+        8.0
+        """
+        return PreparedCall(self, **kwargs)
+
+    def _invoke(self, cfunction, arg_values):
+        """Call the JIT-compiled kernel function with the runtime arguments."""
         try:
-            cfunction = self.cfunction
-            with self._profiler.timer_on('apply', comm=args.comm):
-                cfunction(*arg_values)
+            cfunction(*arg_values)
         except ctypes.ArgumentError as e:
             if e.args[0].startswith("argument "):
                 argnum = int(e.args[0][9:].split(':')[0]) - 1
@@ -672,12 +931,6 @@ class Operator(Callable):
             else:
                 raise
 
-        # Post-process runtime arguments
-        self._postprocess_arguments(args, **kwargs)
-
-        # Output summary of performance achieved
-        return self._emit_apply_profiling(args)
-
     # Performance profiling
 
     def _emit_build_profiling(self):
@@ -690,6 +943,10 @@ class Operator(Callable):
         timings = self._profiler.py_timers.copy()
 
         tot = timings.pop('op-compile')
+
+        # The Operator may have been jit-compiled already, e.g. to empirically
+        # select the fastest among several variants
+        timings.pop('jit-compile', None)
         perf("Operator `%s` generated in %.2f s" % (self.name, fround(tot)))
 
         max_hotspots = 3
@@ -765,6 +1022,11 @@ class Operator(Callable):
             name = "%s%s<%s>" % (k.name, rank, itershapes)
 
             perf("%s* %s ran in %.2f s [%s]" % (indent, name, fround(v.time), metrics))
+            counters = summary.counters.get(k)
+            if counters:
+                measured = ["%s=%s" % (n, ("%.2f" % c) if isinstance(c, float) else c)
+                            for n, c in counters.items() if c is not None]
+                perf("%s  measured: [%s]" % (indent, ', '.join(measured)))
             for n, time in summary.subsections.get(k.name, {}).items():
                 perf("%s+ %s ran in %.2f s [%.2f%%]" %
                      (indent*2, n, time, fround(time/v.time*100)))
@@ -816,8 +1078,16 @@ class Operator(Callable):
     # Pickling support
 
     def __getstate__(self):
-        if self._lib:
+        if self._jit_future is not None:
+            # Futures can't be pickled; also, an ongoing asynchronous JIT
+            # compilation must be complete before pickling the Operator
+            self._jit_future.result()
             state = dict(self.__dict__)
+            state['_jit_future'] = None
+        else:
+            state = self.__dict__
+        if self._lib:
+            state = dict(state)
             # The compiled shared-object will be pickled; upon unpickling, it
             # will be restored into a potentially different temporary directory,
             # so the entire process during which the shared-object is loaded and
@@ -834,9 +1104,7 @@ class Operator(Callable):
             with open(self._lib._name, 'rb') as f:
                 state['binary'] = f.read()
                 state['soname'] = self._soname
-            return state
-        else:
-            return self.__dict__
+        return state
 
     def __getnewargs_ex__(self):
         return (None,), {}
@@ -852,6 +1120,30 @@ class Operator(Callable):
             self._lib.name = soname
 
 
+def compile_all(operators):
+    """
+    JIT-compile multiple Operators concurrently.
+
+    Parameters
+    ----------
+    operators : list of Operator
+        The Operators to be compiled.
+
+    Returns
+    -------
+    list of concurrent.futures.Future
+        One Future per Operator, whose result is the Operator itself once
+        compiled. Use `concurrent.futures.wait` to wait for all of them.
+    """
+    return [op.compile_async() for op in as_tuple(operators)]
+
+
+@memoized_func
+def jit_executor():
+    """The pool of threads performing asynchronous JIT compilation."""
+    return ThreadPoolExecutor(max_workers=configuration['platform'].cores_logical)
+
+
 # Misc helpers
 
 
@@ -867,6 +1159,160 @@ class ArgumentsMap(dict):
         return self.grid.comm if self.grid is not None else MPI.COMM_NULL
 
 
+class PreparedCall(object):
+
+    """
+    An Operator along with its runtime arguments, processed once to be then
+    run repeatedly at a low overhead. Built through ``Operator.prepare``.
+
+    The arguments passed to ``run`` are processed selectively:
+
+        * the iteration bounds of a Dimension, which are re-validated against
+          the shape of the Functions accessed along that Dimension;
+        * scalar values, such as those of Constants;
+        * Functions (or NumPy arrays) replacing others of identical shape,
+          for which only the C-level data pointer is updated.
+
+    Anything else triggers a full re-processing of the runtime arguments.
+    """
+
+    def __init__(self, op, **kwargs):
+        self.op = op
+        self._prepare(**kwargs)
+
+    def _prepare(self, **kwargs):
+        op = self.op
+
+        self.kwargs = kwargs
+        self.args = op._prepare_arguments(**kwargs)
+        self.cfunction = op.cfunction
+
+        self._index = {p.name: n for n, p in enumerate(op.parameters)}
+        self._values = [self.args.get(p.name) for p in op.parameters]
+
+        # The Dimensions in the order their arguments must be processed
+        dag = DAG(op.dimensions, [(i, i.parent) for i in op.dimensions if i.is_Derived])
+        self._order = list(reversed(dag.topological_sort()))
+
+        # Map each argument name to the object handling it. Note that derived
+        # Dimensions share the argument names of their parents
+        self._dimensions = {}
+        for d in self._order:
+            for i in d._arg_names:
+                self._dimensions.setdefault(i, d)
+        self._scalars = {}
+        self._functions = {}
+        for p in op.input:
+            if p.is_Dimension:
+                continue
+            elif p.is_DiscreteFunction:
+                if not p.is_SparseFunction:
+                    self._functions[p.name] = p
+            else:
+                for i in p._arg_names:
+                    self._scalars[i] = p
+
+        # The shapes of the Functions accessed along each Dimension, used to
+        # re-validate any new iteration bounds
+        self._checks = {}
+        for p in op.parameters:
+            if p.name not in self._functions:
+                continue
+            shape = self._shape(self.args[p.name], p.ndim)
+            for d, size in zip(p.dimensions, shape):
+                self._checks.setdefault(d, []).append((size, op._dspace[p][d]))
+
+        self.elapsed = 0.
+        self._finalized = False
+
+    @classmethod
+    def _shape(cls, dataobj, ndim):
+        return tuple(dataobj._obj.size[i] for i in range(ndim))
+
+    def _update(self, **kwargs):
+        op = self.op
+        args = self.args
+
+        dims = {}
+        updates = {}
+        for k, v in kwargs.items():
+            if k in self._dimensions:
+                dims.setdefault(self._dimensions[k], {})[k] = v
+            elif k in self._scalars and np.isscalar(v):
+                p = self._scalars[k]
+                updates.update(p._arg_values(**{k: v}))
+            elif k in self._functions:
+                p = self._functions[k]
+                is_function = getattr(v, 'is_DiscreteFunction', False)
+                data = v._data_buffer if is_function else v
+                if not isinstance(data, np.ndarray) or \
+                   data.shape != self._shape(args[k], p.ndim) or \
+                   data.dtype != p.dtype:
+                    return False
+                key = v if is_function else p
+                updates[k] = key._C_make_dataobj(data)
+            else:
+                return False
+
+        if dims:
+            # Derived Dimensions must be processed after their parents
+            merged = dict(self.kwargs, **kwargs)
+            for d in self._order:
+                if d in dims:
+                    v = d._arg_values(dict(args, **updates), op._dspace[d], args.grid,
+                                      **dims[d])
+                elif d._defines & set(dims):
+                    v = d._arg_values(dict(args, **updates), op._dspace[d], args.grid,
+                                      **merged)
+                else:
+                    continue
+                updates.update(v)
+
+        args.update(updates)
+        for k, v in updates.items():
+            try:
+                self._values[self._index[k]] = v
+            except KeyError:
+                pass
+
+        for d in dims:
+            for size, interval in self._checks.get(d, []):
+                d._arg_check(args, size, interval)
+
+        self.kwargs.update(kwargs)
+
+        return True
+
+    def run(self, **kwargs):
+        """
+        Execute the Operator.
+
+        Parameters
+        ----------
+        **kwargs
+            The runtime arguments to be updated before the execution.
+        """
+        if self._finalized or not self._update(**kwargs):
+            kwargs = dict(self.kwargs, **kwargs)
+            self._prepare(**kwargs)
+
+        tic = seq_time()
+        self.op._invoke(self.cfunction, self._values)
+        self.elapsed += seq_time() - tic
+
+    def finalize(self):
+        """
+        Post-process the runtime arguments (e.g., gather the SparseFunctions'
+        data across MPI ranks), and produce a PerformanceSummary of all runs
+        since the arguments were processed.
+        """
+        self.op._postprocess_arguments(self.args, **self.kwargs)
+        self._finalized = True
+
+        self.op._profiler.py_timers['apply'] = self.elapsed
+        return self.op._emit_apply_profiling(self.args)
+
+
 def parse_kwargs(**kwargs):
     """
     Parse keyword arguments provided to an Operator.
@@ -5,23 +5,27 @@ from operator import mul
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, run
 from time import time as seq_time
+import json
 import os
 
+from cached_property import cached_property
 import cgen as c
+import numpy as np
 from sympy import S
 
-from devito.ir.iet import (ExpressionBundle, List, TimedList, Section,
-                           Iteration, FindNodes, Transformer)
-from devito.ir.support import IntervalGroup
+from devito.ir.iet import (ExpressionBundle, List, TimedList, TracedList, CounteredList,
+                           Section, Iteration, FindNodes, Transformer)
+from devito.ir.support import Interval, IntervalGroup
 from devito.logger import warning, error
 from devito.mpi import MPI
 from devito.mpi.routines import MPICall, MPIList, RemainderCall
 from devito.parameters import configuration
 from devito.passes.iet import BusyWait
 from devito.symbolics import subs_op_args
-from devito.tools import DefaultOrderedDict, flatten
+from devito.tools import DefaultOrderedDict, flatten, is_integer, perf_events
+from devito.types import PerfCounters, Tracer
 
-__all__ = ['create_profile']
+__all__ = ['create_profile', 'BuildSummary', 'Trace']
 
 
 SectionData = namedtuple('SectionData', 'ops sops points traffic itermaps')
@@ -64,8 +68,11 @@ class Profiler(object):
 
             bundles = FindNodes(ExpressionBundle).visit(s)
 
+            # Time-tiled iteration spaces are mapped back onto the untiled ones
+            ispaces = [untile(i.ispace.intervals) for i in bundles]
+
             # Total operation count
-            ops = sum(i.ops*i.ispace.size for i in bundles)
+            ops = sum(i.ops*j.size for i, j in zip(bundles, ispaces))
 
             # Operation count at each section iteration
             sops = sum(i.ops for i in bundles)
@@ -74,7 +81,7 @@ class Profiler(object):
             mapper = {}
             for i in bundles:
                 for k, v in i.traffic.items():
-                    mapper.setdefault(k, []).append(v)
+                    mapper.setdefault(k, []).append(untile(v))
             traffic = 0
             for i in mapper.values():
                 try:
@@ -84,13 +91,13 @@ class Profiler(object):
                     traffic += sum(j.size for j in i)
 
             # Each ExpressionBundle lives in its own iteration space
-            itermaps = [i.ispace.dimension_map for i in bundles]
+            itermaps = [OrderedDict([(i.dim, i.size) for i in j]) for j in ispaces]
 
             # Track how many grid points are written within `s`
             points = set()
-            for i in bundles:
+            for i, j in zip(bundles, ispaces):
                 if any(e.write.is_TimeFunction for e in i.exprs):
-                    points.add(i.size)
+                    points.add(j.size)
             points = sum(points, S.Zero)
 
             self._sections[s.name] = SectionData(ops, sops, points, traffic, itermaps)
@@ -293,6 +300,214 @@ class AdvancedProfilerVerbose2(AdvancedProfiler):
         return (MPICall, BusyWait)
 
 
+class TraceProfiler(AdvancedProfilerVerbose1):
+
+    """
+    Like AdvancedProfilerVerbose1, but also record the start and end time of
+    each execution of each profiled section (e.g., at each timestep) in a
+    preallocated ring buffer. The timeline is made available through the
+    `trace` attribute of the PerformanceSummary.
+    """
+
+    _default_includes = ['time.h']
+
+    @cached_property
+    def tracer(self):
+        return Tracer('tracer', self.all_sections)
+
+    def instrument(self, iet, timer):
+        sections = FindNodes(Section).visit(iet)
+        if sections:
+            mapper = {}
+            for i in sections:
+                n = i.name
+                assert n in timer.fields
+                mapper[i] = i._rebuild(body=TracedList(timer=timer, tracer=self.tracer,
+                                                       lname=n, body=i.body))
+            return Transformer(mapper, nested=True).visit(iet)
+        else:
+            return iet
+
+    def summary(self, args, dtype, reduce_over=None):
+        summary = super().summary(args, dtype, reduce_over=reduce_over)
+
+        try:
+            events, dropped = Tracer.read(args[self.tracer.name]._obj)
+        except KeyError:
+            # No profiled sections
+            return summary
+
+        subsections = flatten(self._subsections.values())
+        comm = args.comm
+        if comm is not MPI.COMM_NULL:
+            eventss = comm.allgather(events)
+            dropped = sum(comm.allgather(dropped))
+        else:
+            eventss = [events]
+        summary.trace = Trace(self.all_sections, eventss, dropped, subsections)
+
+        return summary
+
+
+class CountersProfiler(AdvancedProfiler):
+
+    """
+    Like AdvancedProfiler, but also measure the events, such as cycles and
+    instructions, occurred within each profiled section through the hardware
+    performance counters (Linux `perf_event`). The events are given by
+    `configuration['profiling-counters']`, and are reported next to the modelled
+    performance in the PerformanceSummary.
+
+    Notes
+    -----
+    The counters follow the thread running the Operator as well as the threads
+    it creates afterwards, so the threads of an already initialized OpenMP
+    runtime may escape the measurements.
+    """
+
+    _default_includes = ['unistd.h']
+
+    line_size = 64
+    """The cache line size, in bytes, used to convert LLC misses into traffic."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._warned = False
+
+    @cached_property
+    def counters(self):
+        events = configuration['profiling-counters']
+        unknown = [i for i in events if i not in perf_events]
+        if unknown:
+            raise ValueError("Unknown hardware counters `%s`; the known ones are `%s`"
+                             % (unknown, list(perf_events)))
+        return PerfCounters('counters', self._sections, events)
+
+    def instrument(self, iet, timer):
+        sections = FindNodes(Section).visit(iet)
+        if sections:
+            mapper = {}
+            for i in sections:
+                n = i.name
+                assert n in timer.fields
+                if n in self.counters.sections:
+                    body = CounteredList(timer=timer, counters=self.counters, lname=n,
+                                         body=i.body)
+                else:
+                    body = TimedList(timer=timer, lname=n, body=i.body)
+                mapper[i] = i._rebuild(body=body)
+            return Transformer(mapper, nested=True).visit(iet)
+        else:
+            return iet
+
+    def summary(self, args, dtype, reduce_over=None):
+        summary = super().summary(args, dtype, reduce_over=reduce_over)
+
+        try:
+            obj = args[self.counters.name]._obj
+        except KeyError:
+            # No profiled sections
+            return summary
+
+        comm = args.comm
+        for name in self.counters.sections:
+            counters = self.counters.read(obj, name)
+            if comm is not MPI.COMM_NULL:
+                countss = comm.allgather(counters)
+                for rank in range(comm.size):
+                    summary.add_counters(name, rank, countss[rank], self.line_size)
+            else:
+                summary.add_counters(name, None, counters, self.line_size)
+
+        unavailable = [i for i, fd in zip(self.counters.events, self.counters.fds)
+                       if fd < 0]
+        if unavailable and not self._warned:
+            warning("Couldn't read hardware counters `%s`" % unavailable)
+            self._warned = True
+
+        return summary
+
+
+class Trace(object):
+
+    """
+    The timeline of an Operator run, that is the start and end time of each
+    execution of each profiled section, as recorded by the `trace` profiler.
+
+    Parameters
+    ----------
+    sections : list of str
+        The names of the profiled sections.
+    events : list of ndarray
+        The events recorded by each MPI rank, as `(section index, start time,
+        end time)` triplets.
+    dropped : int, optional
+        The number of events overwritten in the ring buffers. Defaults to 0.
+    subsections : list of str, optional
+        The sections that are nested within other sections.
+    """
+
+    def __init__(self, sections, events, dropped=0, subsections=None):
+        self.sections = list(sections)
+        self.dropped = dropped
+        self.subsections = list(subsections or [])
+
+        # The time is relative to the first recorded event of each rank
+        dtype = [('rank', np.int32), ('section', np.int32),
+                 ('start', np.float64), ('end', np.float64)]
+        processed = []
+        for rank, v in enumerate(events):
+            a = np.empty(len(v), dtype=dtype)
+            a['rank'] = rank
+            a['section'] = v[:, 0]
+            t0 = v[:, 1].min() if len(v) > 0 else 0.
+            a['start'] = v[:, 1] - t0
+            a['end'] = v[:, 2] - t0
+            processed.append(a)
+        self.events = np.concatenate(processed)
+
+    def __repr__(self):
+        return "Trace[%d events]" % len(self.events)
+
+    def to_numpy(self):
+        """
+        The recorded events, as a NumPy structured array with fields `rank`,
+        `section`, `start` and `end`. The times are in seconds.
+        """
+        return self.events
+
+    def to_chrome(self, filename=None):
+        """
+        The recorded events in the Chrome trace format, which may be
+        visualized, for example, through Perfetto or `chrome://tracing`.
+
+        Parameters
+        ----------
+        filename : str, optional
+            If provided, the trace is also written, in JSON, to this file.
+        """
+        events = []
+        for rank in np.unique(self.events['rank']):
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': int(rank),
+                           'args': {'name': 'rank %d' % rank}})
+        for rank, section, start, end in self.events:
+            name = self.sections[section]
+            events.append({'name': name,
+                           'cat': 'subsection' if name in self.subsections else 'section',
+                           'ph': 'X',
+                           'ts': start*10**6,
+                           'dur': (end - start)*10**6,
+                           'pid': int(rank),
+                           'tid': 0})
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+        if filename is not None:
+            with open(str(filename), 'w') as f:
+                json.dump(trace, f)
+
+        return trace
+
+
 class AdvisorProfiler(AdvancedProfiler):
 
     """
@@ -343,6 +558,33 @@ class AdvisorProfiler(AdvancedProfiler):
         return iet
 
 
+def untile(intervals):
+    """
+    Map the Intervals of a time-tiled iteration space back onto the Intervals
+    of the original, untiled, iteration space. The tile Dimensions are dropped,
+    while the Dimensions iterating within a tile are replaced by their roots.
+    """
+    if not any(i.dim.is_Incr and i.dim.root.is_Time for i in intervals):
+        return intervals
+
+    roots = {i.dim for i in intervals if not i.dim.is_Incr}
+    processed = []
+    for i in intervals:
+        d = i.dim
+        if d.is_Incr:
+            if not is_integer(d.step) or d.root in roots:
+                # A tile Dimension, or a root already in the iteration space
+                continue
+            i = Interval(d.root, 0, 0)
+            roots.add(d.root)
+        elif not (is_integer(i.lower) and is_integer(i.upper)):
+            # E.g., the time loop within a time tile
+            i = i.zero()
+        processed.append(i)
+
+    return IntervalGroup(processed)
+
+
 class PerformanceSummary(OrderedDict):
 
     def __init__(self, *args, **kwargs):
@@ -350,6 +592,8 @@ class PerformanceSummary(OrderedDict):
         self.subsections = DefaultOrderedDict(lambda: OrderedDict())
         self.input = OrderedDict()
         self.globals = {}
+        self.counters = OrderedDict()
+        self.trace = None
 
     def add(self, name, rank, time,
             ops=None, points=None, traffic=None, sops=None, itershapes=None):
@@ -382,6 +626,38 @@ class PerformanceSummary(OrderedDict):
 
         self.subsections[sname][name] = time
 
+    def add_counters(self, name, rank, counters, line_size=64):
+        """
+        Add the events measured through the hardware performance counters for a
+        given code section, alongside the derived metrics that may be compared
+        with the modelled ones:
+
+            * ipc: instructions per cycle;
+            * traffic: the memory traffic, in bytes, implied by the LLC misses;
+            * oi: the operational intensity, given the `ops` of the code section
+              and the measured traffic;
+            * gflopss: the GFlops/s, given the counted floating-point operations.
+        """
+        k = PerfKey(name, rank)
+        if k not in self:
+            return
+
+        counters = dict(counters)
+        cycles = counters.get('cycles')
+        instructions = counters.get('instructions')
+        misses = counters.get('llc_misses')
+        fpops = counters.get('fp_ops')
+
+        counters['ipc'] = instructions/cycles if cycles and instructions is not None \
+            else None
+        counters['traffic'] = misses*line_size if misses is not None else None
+        ops = self.input[k].ops
+        counters['oi'] = float(ops)/counters['traffic'] \
+            if ops and counters['traffic'] else None
+        counters['gflopss'] = fpops/10**9/self[k].time if fpops is not None else None
+
+        self.counters[k] = counters
+
     def add_glb_vanilla(self, time):
         """
         Reduce the following performance data:
@@ -425,14 +701,64 @@ class PerformanceSummary(OrderedDict):
         return OrderedDict([(k, v.time) for k, v in self.items()])
 
 
-def create_profile(name):
-    """Create a new Profiler."""
+class BuildSummary(OrderedDict):
+
+    """
+    The time, in seconds, spent in each compilation pass while building an
+    Operator. The keys are the paths of nested `timed_pass` names, for example
+    `('lowering.Clusters', 'cire')`.
+
+    Parameters
+    ----------
+    timings : dict, optional
+        The nested timings produced by a `timed_region`.
+    name : str, optional
+        The name of the `timed_region`, whose time is the total build time.
+    cached : bool, optional
+        True if the Operator was retrieved from the lowering cache. Defaults
+        to False.
+    """
+
+    def __init__(self, timings=None, name=None, cached=False):
+        super(BuildSummary, self).__init__()
+        timings = timings or {}
+        self.total = timings.get(name, 0.)
+        self.cached = cached
+
+        def _flatten(timings, path):
+            for k, v in timings.items():
+                if k == 'total' or not isinstance(v, dict):
+                    continue
+                self[path + (k,)] = v.get('total', 0.)
+                _flatten(v, path + (k,))
+        _flatten(timings, ())
+
+    @property
+    def by_name(self):
+        """
+        The time spent in each pass, regardless of where it was invoked from.
+        """
+        ret = OrderedDict()
+        for path, v in self.items():
+            # Recursive passes are only accounted once
+            if path[-1] not in path[:-1]:
+                ret[path[-1]] = ret.get(path[-1], 0.) + v
+        return ret
+
+
+def profiling_level():
+    """The profiling level in use, given the current configuration."""
     if configuration['log-level'] in ['DEBUG', 'PERF'] and \
        configuration['profiling'] == 'basic':
         # Enforce performance profiling in DEBUG mode
-        level = 'advanced'
+        return 'advanced'
     else:
-        level = configuration['profiling']
+        return configuration['profiling']
+
+
+def create_profile(name):
+    """Create a new Profiler."""
+    level = profiling_level()
     profiler = profiler_registry[level](name)
 
     if profiler.initialized:
@@ -452,6 +778,8 @@ profiler_registry = {
     'advanced': AdvancedProfiler,
     'advanced1': AdvancedProfilerVerbose1,
     'advanced2': AdvancedProfilerVerbose2,
+    'trace': TraceProfiler,
+    'counters': CountersProfiler,
     'advisor': AdvisorProfiler
 }
 """Profiling levels."""
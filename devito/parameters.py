@@ -150,14 +150,26 @@ env_vars_mapper = {
     'DEVITO_ARCH': 'compiler',
     'DEVITO_PLATFORM': 'platform',
     'DEVITO_PROFILING': 'profiling',
+    'DEVITO_PROFILING_TRACE_SIZE': 'profiling-trace-size',
+    'DEVITO_PROFILING_COUNTERS': 'profiling-counters',
     'DEVITO_DEVELOP': 'develop-mode',
     'DEVITO_OPT': 'opt',
     'DEVITO_MPI': 'mpi',
+    'DEVITO_SPARSE_RESIDENT': 'sparse-resident',
+    'DEVITO_SPARSE_PRECOMPUTE': 'sparse-precompute',
     'DEVITO_LANGUAGE': 'language',
     'DEVITO_AUTOTUNING': 'autotuning',
+    'DEVITO_AUTOTUNING_DB': 'autotuning-db',
     'DEVITO_LOGGING': 'log-level',
     'DEVITO_FIRST_TOUCH': 'first-touch',
     'DEVITO_JIT_BACKDOOR': 'jit-backdoor',
+    'DEVITO_JIT_SPLIT': 'jit-split',
+    'DEVITO_JIT_CACHE': 'jit-cache',
+    'DEVITO_JIT_CACHE_DIR': 'jit-cache-dir',
+    'DEVITO_LOWERING_CACHE': 'lowering-cache',
+    'DEVITO_LOWERING_CACHE_DIR': 'lowering-cache-dir',
+    'DEVITO_OOC_DIR': 'ooc-dir',
+    'DEVITO_CACHE_BUDGET': 'cache-budget',
     'DEVITO_IGNORE_UNKNOWN_PARAMS': 'ignore-unknowns',
     'DEVITO_SAFE_MATH': 'safe-math'
 }
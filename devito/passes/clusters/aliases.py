@@ -38,7 +38,8 @@ def cire(clusters, mode, sregistry, options, platform):
         The symbol registry, to create unique temporary names.
     options : dict
         The optimization options.
-        Accepted: ['min-storage', 'cire-maxpar', 'cire-rotate', 'cire-maxalias'].
+        Accepted: ['min-storage', 'cire-maxpar', 'cire-rotate', 'cire-maxalias',
+        'cire-variant'].
         * 'min-storage': if True, the pass will try to minimize the amount of
           storage introduced for the tensor temporaries. This might also reduce
           the operation count. On the other hand, this might affect fusion and
@@ -53,6 +54,9 @@ def cire(clusters, mode, sregistry, options, platform):
         * 'cire-maxalias': if True, capture the largest redundancies. This will
           minimize the flop count while maximizing the number of tensor temporaries,
           thus increasing the working set size.
+        * 'cire-variant': the CIRE transformer whose schedule is used, if not
+          empty, regardless of the heuristics. Accepted: [None, 'inv-basic',
+          'inv-compound']. Defaults to None, that is the heuristics decide.
     platform : Platform
         The underlying platform. Used to optimize the shape of the introduced
         tensor symbols.
@@ -116,6 +120,12 @@ def _cire(cluster, context, space, sregistry, options, platform):
     if not any(i.schedule for i in variants):
         return [cluster]
 
+    # Maybe a specific variant was requested
+    if options['cire-variant'] in space:
+        variant = variants[space.index(options['cire-variant'])]
+        if variant.schedule:
+            variants = [variant]
+
     # Pick the variant with the highest score, that is the variant with the best
     # trade-off between operation count reduction and working set size increase
     schedule, exprs = pick_best(variants)
@@ -1,12 +1,16 @@
-from collections import Counter
+from collections import Counter, OrderedDict
+
+from sympy import And, Eq, Or, sympify
 
 from devito.ir.clusters import Queue
-from devito.ir.support import TILABLE, IntervalGroup, IterationSpace
-from devito.symbolics import uxreplace
-from devito.tools import timed_pass
+from devito.ir.support import (SEQUENTIAL, TILABLE, Forward, Interval, IntervalGroup,
+                               IterationSpace)
+from devito.logger import warning
+from devito.symbolics import MAX, MIN, retrieve_indexed, uxreplace
+from devito.tools import filter_ordered, timed_pass
 from devito.types import IncrDimension
 
-__all__ = ['Blocking']
+__all__ = ['Blocking', 'TimeTiling']
 
 
 class Blocking(Queue):
@@ -161,3 +165,418 @@ def decompose(ispace, d, block_dims):
     directions.update({bd: ispace.directions[d] for bd in block_dims})
 
     return IterationSpace(intervals, sub_iterators, directions)
+
+
+class TimeTiling(Queue):
+
+    """
+    Tile the time loop by skewing the block Dimensions introduced by Blocking,
+    a transformation also known as "wavefront" temporal blocking.
+
+    Within a time tile, the space blocks are visited in sequence, and each block
+    is iterated over all of the timesteps in the tile before moving on to the
+    next one. To honour the data dependences, at timestep `time` a block is
+    shifted by `skew*(time - time0_blk0)` points along each blocked Dimension,
+    where `skew` is derived from the stencil radii. Sparse operations, such as
+    injection and interpolation, are performed within the block containing the
+    (shifted) sparse point.
+
+    Notes
+    -----
+    The transformation is currently restricted to Forward time-stepping Operators
+    with a single level of blocking and no distributed-memory parallelism. In
+    all other cases, the Clusters are returned untouched.
+    """
+
+    template = "%s0_blk0"
+
+    def __init__(self, options):
+        self.levels = options['blocklevels']
+        self.mpi = options['mpi']
+
+        super(TimeTiling, self).__init__()
+
+    @timed_pass(name='time-tiling')
+    def process(self, clusters):
+        return super(TimeTiling, self).process(clusters)
+
+    def callback(self, clusters, prefix):
+        if len(prefix) != 1 or not prefix[0].dim.is_Time:
+            return clusters
+
+        try:
+            return self._tile(clusters, prefix[0])
+        except TimeTilingError as e:
+            warning("Couldn't apply time tiling (%s)" % e)
+            return clusters
+
+    def _tile(self, clusters, prefix):
+        if self.mpi:
+            raise TimeTilingError("distributed-memory parallelism is unsupported")
+        if self.levels != 1:
+            raise TimeTilingError("only one level of blocking is supported")
+        if prefix.direction is not Forward:
+            raise TimeTilingError("only Forward time-stepping is supported")
+        if prefix.offsets != (0, 0):
+            raise TimeTilingError("unsupported time iteration space")
+
+        time = prefix.dim
+
+        # Classify the Clusters within the time loop
+        units = []
+        for c in clusters:
+            blocks = tiled_dimensions(c)
+            if blocks:
+                units.append(TTUnit('stencil', [c], blocks))
+            elif len(c.itintervals) == 1:
+                # E.g., `r0 = 1/dt`, to be recomputed within each block
+                if any(not e.lhs.is_Symbol for e in c.exprs):
+                    raise TimeTilingError("unsupported time-level Cluster")
+                units.append(TTUnit('scalar', [c]))
+            elif units and units[-1].kind == 'sparse' and \
+                    units[-1].dim is c.itintervals[1].dim:
+                units[-1].clusters.append(c)
+            else:
+                units.append(TTUnit('sparse', [c]))
+
+        stencils = [u for u in units if u.kind == 'stencil']
+        if not stencils:
+            raise TimeTilingError("no blocked stencils found")
+
+        # The tiled Dimensions must be the same across all stencils
+        roots = filter_ordered(b.root for b in stencils[0].blocks)
+        if any({b.root for b in u.blocks} != set(roots) for u in stencils):
+            raise TimeTilingError("the stencils are blocked along different "
+                                  "Dimensions")
+        if any(d.root in roots for u in units if u.kind != 'stencil'
+               for d in u.clusters[0].ispace.dimensions):
+            raise TimeTilingError("found non-blocked loop nests over the "
+                                  "blocked Dimensions")
+
+        # The Functions written within the time loop must either be defined
+        # over all of the tiled Dimensions (e.g., the wavefields) or over none
+        # of them (e.g., the receivers), in which case they must not be read
+        writes = set().union(*[c.scope.writes for c in clusters])
+        reads = set().union(*[c.scope.reads for c in clusters])
+        fields = set()
+        for f in writes:
+            if f.is_Symbol:
+                continue
+            elif f.is_Array:
+                raise TimeTilingError("block-local temporaries are unsupported")
+            elif all(d in f.dimensions for d in roots):
+                fields.add(f)
+            elif any(d.root in roots for d in f.dimensions) or f in reads:
+                raise TimeTilingError("unsupported write to `%s`" % f.name)
+
+        # Compute the per-unit access radii along each tiled Dimension
+        for u in units:
+            u.analyze(time, roots, fields)
+
+        # Compute the intra-timestep lag of each unit and the skewing factor
+        # such that all dependences are honoured
+        lags = {}
+        skew = {}
+        for d in roots:
+            for n, u in enumerate(units):
+                lags[(u, d)] = max([0] + [lags[(v, d)] + i for v in units[:n]
+                                          for i in v.distances(u, d, True)])
+            skew[d] = max([0] + [lags[(u, d)] - lags[(v, d)] + i
+                                 for u in units for v in units
+                                 for i in u.distances(v, d)])
+
+        # Create the time block Dimension
+        tb = IncrDimension(self.template % time.name, time, time.symbolic_min,
+                           time.symbolic_max)
+        tend = MIN(tb + tb.step - 1, time.symbolic_max)
+        shift = time - tb
+
+        # Create the space block Dimensions, skewed to accommodate `tend - tb`
+        # timesteps
+        bmapper = OrderedDict()
+        for d in roots:
+            v = [b.parent for u in stencils for b in u.blocks if b.root is d]
+            lower = min(u.bounds[d][0] for u in stencils)
+            upper = max(u.bounds[d][1] for u in stencils)
+            maxlag = max(lags[(u, d)] for u in units)
+            bmapper[d] = IncrDimension(v[0].name, d, d.symbolic_min + lower,
+                                       d.symbolic_max + upper + maxlag +
+                                       skew[d]*(tend - tb), step=v[0].step)
+
+        # The outer (sequential) portion of the new iteration spaces
+        intervals = [Interval(tb, 0, 0)]
+        intervals.extend([Interval(i, 0, 0) for i in bmapper.values()])
+        intervals.append(Interval(time, tb - time.symbolic_min,
+                                  tend - time.symbolic_max))
+        properties = {i.dim: {SEQUENTIAL} for i in intervals[:-1]}
+
+        processed = []
+        for u in units:
+            for c in u.clusters:
+                exprs = c.exprs
+                guards = dict(c.guards)
+
+                inner = []
+                if u.kind == 'stencil':
+                    mapper = {}
+                    for b in u.blocks:
+                        d = b.root
+                        bd = bmapper[d]
+                        offset = skew[d]*shift + lags[(u, d)]
+                        lower, upper = u.bounds[d]
+                        nd = IncrDimension(d.name, bd,
+                                           MAX(bd, d.symbolic_min + lower + offset),
+                                           MIN(bd + bd.step - 1,
+                                               d.symbolic_max + upper + offset),
+                                           1, size=bd.step)
+                        mapper[b] = nd - offset
+                        inner.append(nd)
+                    exprs = [uxreplace(e, mapper) for e in exprs]
+                elif u.kind == 'sparse' and u.is_guarded(c):
+                    conditions = []
+                    for d, bd in bmapper.items():
+                        if u.anchor is None:
+                            conditions.append(Eq(bd, bd.symbolic_min))
+                            continue
+                        point = u.anchor[d] + skew[d]*shift + lags[(u, d)]
+                        conditions.append(Or(point >= bd,
+                                             Eq(bd, bd.symbolic_min)))
+                        conditions.append(Or(point <= bd + bd.step - 1,
+                                             bd + bd.step > bd.symbolic_max))
+                    guard = And(*conditions)
+                    if u.dim in guards:
+                        guard = And(guards[u.dim], guard)
+                    guards[u.dim] = guard
+
+                ispace, cproperties = tile(c, time, u.blocks, intervals, inner)
+                cproperties.update(properties)
+
+                processed.append(c.rebuild(exprs=exprs, ispace=ispace,
+                                           guards=guards, properties=cproperties))
+
+        return processed
+
+
+class TimeTilingError(Exception):
+    pass
+
+
+class TTUnit(object):
+
+    """
+    A group of Clusters within the time loop that TimeTiling treats as a whole.
+    A unit is either a blocked loop nest ("stencil"), a sequence of Clusters
+    iterating over a sparse Dimension ("sparse"), or a Cluster iterating over
+    the sole time Dimension ("scalar").
+    """
+
+    def __init__(self, kind, clusters, blocks=None):
+        self.kind = kind
+        self.clusters = clusters
+        self.blocks = blocks or []
+
+        # Populated by `analyze`
+        self.accesses = {'r': {}, 'w': {}}
+        self.bounds = {}
+        self.guarded = []
+        self.anchor = None
+
+    def __repr__(self):
+        return "TTUnit<%s>[%s]" % (self.kind, len(self.clusters))
+
+    @property
+    def dim(self):
+        return self.clusters[0].itintervals[1].dim
+
+    def is_guarded(self, c):
+        return any(c is i for i in self.guarded)
+
+    def analyze(self, time, roots, fields):
+        if self.kind == 'stencil':
+            self._analyze_stencil(time, roots, fields)
+        elif self.kind == 'sparse':
+            self._analyze_sparse(time, roots, fields)
+        elif any(i.function in fields for i, _ in accesses(self.clusters[0].exprs)):
+            raise TimeTilingError("unsupported time-level access")
+
+    def _track(self, indexed, mode, time, distances):
+        f = indexed.function
+        key = tuple(i for d, i in zip(f.dimensions, indexed.indices) if d.root is time)
+        v = self.accesses[mode].setdefault(f, {}).setdefault(key, {})
+        for d, i in distances.items():
+            v[d] = max(v.get(d, 0), abs(int(i)))
+
+    def _analyze_stencil(self, time, roots, fields):
+        c, = self.clusters
+
+        if any(d is not time for d in c.guards):
+            raise TimeTilingError("guarded blocked loop nests are unsupported")
+        if any(c.ispace.sub_iterators.get(b) or c.ispace.sub_iterators.get(b.parent)
+               for b in self.blocks):
+            raise TimeTilingError("unsupported blocked loop nest")
+
+        for i in c.ispace:
+            for b in self.blocks:
+                if i.dim is b.parent:
+                    self.bounds[b.root] = i.offsets
+
+        mapper = {b.root: b for b in self.blocks}
+        for i, mode in accesses(c.exprs):
+            f = i.function
+            if f not in fields:
+                continue
+            distances = {}
+            for n, (d, v) in enumerate(zip(f.dimensions, i.indices)):
+                if d.root in mapper:
+                    distance = sympify(v - mapper[d.root] - f._offset_domain[n])
+                    if not distance.is_Integer:
+                        raise TimeTilingError("non-affine access `%s`" % i)
+                    distances[d.root] = distance
+            self._track(i, mode, time, distances)
+
+    def _analyze_sparse(self, time, roots, fields):
+        # Clusters that only define scalars, e.g. the sparse point coordinates,
+        # are executed within each block; all others are guarded so that they
+        # are executed exactly once per timestep, within the block containing
+        # the sparse point
+        defs = {}
+        defined = set()
+        for c in self.clusters:
+            exprs = accesses(c.exprs)
+            if any(not e.lhs.is_Symbol for e in c.exprs) or \
+                    any(i.function in fields for i, _ in exprs):
+                self.guarded.append(c)
+            elif not self.guarded:
+                defined.update(e.lhs for e in c.exprs)
+            defs.update({e.lhs.name: e.rhs for e in c.exprs
+                         if e.lhs.is_Symbol and not e.is_Increment})
+        defined = {i.name for i in defined}
+
+        def expand(expr):
+            # NOTE: the scalar temporaries may appear in the indices as objects
+            # other than the Symbols they're assigned to (e.g., the
+            # ConditionalDimensions of the sparse point coordinates), so we
+            # map them by name
+            for _ in range(len(defs) + 1):
+                mapper = {i: defs[i.name] for i in expr.free_symbols if i.name in defs}
+                if not mapper:
+                    break
+                expr = expr.xreplace(mapper)
+            return expr
+
+        # Pick the sparse point "anchor", that is an index along each tiled
+        # Dimension, preferably from an access to a Function written to
+        # within the time loop
+        candidates = [i for c in self.guarded for i, _ in accesses(c.exprs)
+                      if all(d in i.function.dimensions for d in roots)]
+        candidates = sorted(candidates, key=lambda i: i.function not in fields)
+        if not candidates:
+            # A purely sparse computation, will be performed by the first block
+            return
+
+        i = candidates[0]
+        f = i.function
+        self.anchor = {d.root: v - f._offset_domain[n]
+                       for n, (d, v) in enumerate(zip(f.dimensions, i.indices))
+                       if d.root in roots}
+
+        # The anchor must be computable before entering any guarded Cluster
+        symbols = set().union(*[v.free_symbols for v in self.anchor.values()])
+        if any(s.name in defs and s.name not in defined for s in symbols):
+            raise TimeTilingError("cannot determine the sparse point location")
+        if symbols & set(self.clusters[0].ispace.dimensions[2:]):
+            raise TimeTilingError("cannot determine the sparse point location")
+
+        anchor = {d: expand(v) for d, v in self.anchor.items()}
+        for c in self.guarded:
+            for i, mode in accesses(c.exprs):
+                f = i.function
+                if f not in fields:
+                    continue
+                distances = {}
+                for n, (d, v) in enumerate(zip(f.dimensions, i.indices)):
+                    if d.root in anchor:
+                        v = expand(v - f._offset_domain[n])
+                        distance = sympify(v - anchor[d.root])
+                        if not distance.is_Integer:
+                            raise TimeTilingError("non-affine access `%s`" % i)
+                        distances[d.root] = distance
+                self._track(i, mode, time, distances)
+
+    def distances(self, other, d, intra=False):
+        """
+        The distances, along `d`, between the accesses performed by `self`
+        and those performed by `other` that induce a dependence. If `intra`
+        is True, only the accesses within the same timestep are considered.
+        """
+        ret = []
+        for m0, m1 in [('w', 'r'), ('w', 'w'), ('r', 'w')]:
+            for f, v0 in self.accesses[m0].items():
+                v1 = other.accesses[m1].get(f, {})
+                for t0, r0 in v0.items():
+                    for t1, r1 in v1.items():
+                        if intra and t0 != t1:
+                            continue
+                        ret.append(r0.get(d, 0) + r1.get(d, 0))
+        return ret
+
+
+def accesses(exprs):
+    """
+    The Indexeds appearing in `exprs`, each paired with the access mode,
+    either 'r' or 'w'.
+    """
+    ret = []
+    for e in exprs:
+        if e.lhs.is_Indexed:
+            ret.append((e.lhs, 'w'))
+            if e.is_Increment:
+                ret.append((e.lhs, 'r'))
+        ret.extend([(i, 'r') for i in retrieve_indexed(e.rhs, deep=True)])
+    return ret
+
+
+def tiled_dimensions(c):
+    """
+    The innermost block Dimensions of the Cluster `c`, or an empty list if
+    `c` isn't a blocked loop nest.
+    """
+    dims = [i.dim for i in c.itintervals[1:]]
+    outer = [d for d in dims if d.is_Incr and not d.parent.is_Incr]
+    if not outer:
+        return []
+
+    n = len(outer)
+    inner = dims[n:2*n]
+    if any(i is not j for i, j in zip(dims, outer)) or \
+            len(inner) != n or \
+            any(i.parent is not j for i, j in zip(inner, outer)) or \
+            any(d.is_Incr for d in dims[2*n:]):
+        raise TimeTilingError("unsupported blocked loop nest")
+
+    return inner
+
+
+def tile(c, time, blocks, prefix, inner):
+    """
+    Create the time-tiled IterationSpace of the Cluster `c`, in which the
+    `blocks` Dimensions (and their parent Dimensions) are replaced by `inner`.
+    """
+    dropped = [time] + blocks + [b.parent for b in blocks]
+    rest = [i for i in c.ispace if not any(i.dim is d for d in dropped)]
+
+    intervals = prefix + [Interval(d, 0, 0) for d in inner] + rest
+    dimensions = [i.dim for i in intervals]
+    intervals = IntervalGroup(intervals, relations=[dimensions])
+
+    sub_iterators = {i.dim: c.ispace.sub_iterators.get(i.dim, []) for i in rest}
+    sub_iterators[time] = c.ispace.sub_iterators.get(time, [])
+
+    directions = {d: Forward for d in dimensions}
+    directions.update({i.dim: c.ispace.directions[i.dim] for i in rest})
+
+    properties = {d: c.properties[b] - {TILABLE} for d, b in zip(inner, blocks)}
+    properties.update({i.dim: c.properties[i.dim] - {TILABLE} for i in rest})
+    properties[time] = c.properties[time]
+
+    return IterationSpace(intervals, sub_iterators, directions), properties
@@ -195,7 +195,7 @@ class Fusion(Queue):
             for cg1 in cgroups[n+1:]:
                 # A Scope to compute all cross-ClusterGroup anti-dependences
                 rule = lambda i: i.is_cross
-                scope = Scope(exprs=cg0.exprs + cg1.exprs, rules=rule)
+                scope = Scope.concatenate([cg0.scope, cg1.scope], rules=rule)
 
                 # Optimization: we exploit the following property:
                 # no prefix => (edge <=> at least one (any) dependence)
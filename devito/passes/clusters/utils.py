@@ -1,5 +1,7 @@
 from collections import Iterable
 
+from sympy import Add
+
 from devito.symbolics import uxreplace
 from devito.tools import flatten, timed_pass
 from devito.types import Symbol
@@ -76,9 +78,13 @@ def makeit_ssa(exprs):
         if len(where) > 1:
             needssa = e.is_Scalar or where[-1] != i
             lhs = Symbol(name='ssa%d' % c, dtype=e.dtype) if needssa else e.lhs
-            if e.is_Increment:
+            if e.is_Increment and e.operation in (None, Add):
                 # Turn AugmentedAssignment into Assignment
                 processed.append(e.func(lhs, mapper[e.lhs] + rhs, is_Increment=False))
+            elif e.is_Increment:
+                # E.g., `a = max(a, b)`
+                processed.append(e.func(lhs, e.operation(mapper[e.lhs], rhs),
+                                        is_Increment=False))
             else:
                 processed.append(e.func(lhs, rhs))
             mapper[e.lhs] = lhs
@@ -1,8 +1,9 @@
-from devito.ir.iet import MapNodes, Section, TimedList, Transformer
+from devito.ir.iet import FindNodes, MapNodes, Section, TimedList, Transformer
 from devito.mpi.routines import (HaloUpdateCall, HaloWaitCall, MPICall, MPIList,
                                  HaloUpdateList, HaloWaitList, RemainderCall)
 from devito.passes.iet.engine import iet_pass
 from devito.passes.iet.orchestration import BusyWait
+from devito.tools import filter_ordered, flatten
 from devito.types import Timer
 
 __all__ = ['instrument']
@@ -68,6 +69,9 @@ def instrument_sections(iet, **kwargs):
     if piet is iet:
         return piet, {}
 
-    headers = [TimedList._start_timer_header(), TimedList._stop_timer_header()]
+    # Some profilers use additional C macros and objects (e.g., ring buffers)
+    nodes = FindNodes(TimedList).visit(piet)
+    headers = filter_ordered([h for i in nodes for h in type(i)._headers()], key=str)
+    args = filter_ordered([timer] + flatten(i.extra_args for i in nodes), key=id)
 
-    return piet, {'args': timer, 'headers': headers}
+    return piet, {'args': args, 'headers': headers}
@@ -1,9 +1,27 @@
+from sympy import Add, Max, Min
+
 from devito.data import FULL
 
 __all__ = ['make_clause_reduction']
 
 
 def make_clause_reduction(symbols):
+    """
+    Build the reduction clause(s) for ``symbols``. Each item of ``symbols`` is
+    either an output (a Symbol or an Indexed), reduced via addition, or a
+    2-tuple ``(output, operation)``, with ``operation`` one of Add, Max, Min.
+    """
+    mapper = {}
+    for i in symbols:
+        i, op = i if isinstance(i, tuple) else (i, Add)
+        mapper.setdefault(reduction_ops[op], []).append(i)
+    return ' '.join(_make_clause_reduction(v, k) for k, v in mapper.items())
+
+
+reduction_ops = {Add: '+', Max: 'max', Min: 'min'}
+
+
+def _make_clause_reduction(symbols, op):
     args = []
     for i in symbols:
         if i.is_Indexed:
@@ -20,4 +38,4 @@ def make_clause_reduction(symbols):
             args.append('%s%s' % (i.name, ''.join(bounds)))
         else:
             args.append(str(i))
-    return 'reduction(+:%s)' % ','.join(args)
+    return 'reduction(%s:%s)' % (op, ','.join(args))
@@ -2,13 +2,16 @@ from itertools import product
 
 import cgen
 
-from devito.ir.iet import (Expression, List, Prodder, FindNodes, FindSymbols,
-                           Transformer, make_efunc, compose_nodes, filter_iterations,
-                           retrieve_iteration_tree)
+from devito.ir.equations import DummyEq
+from devito.ir.iet import (EntryFunction, Expression, Iteration, List, ParallelBlock,
+                           Prodder, FindNodes, FindSymbols, Transformer, make_efunc,
+                           compose_nodes, filter_iterations, retrieve_iteration_tree)
+from devito.ir.support import PARALLEL, PARALLEL_IF_ATOMIC, SEQUENTIAL
 from devito.passes.iet.engine import iet_pass
 from devito.tools import flatten, is_integer, split
 
-__all__ = ['avoid_denormals', 'hoist_prodders', 'relax_incr_dimensions', 'is_on_device']
+__all__ = ['avoid_denormals', 'hoist_prodders', 'relax_incr_dimensions',
+           'color_sparse_increments', 'hoist_color_regions', 'is_on_device']
 
 
 @iet_pass
@@ -64,12 +67,20 @@ def relax_incr_dimensions(iet, **kwargs):
     sregistry = kwargs['sregistry']
 
     efuncs = []
+    headers = []
     mapper = {}
     for tree in retrieve_iteration_tree(iet):
         iterations = [i for i in tree if i.dim.is_Incr]
         if not iterations:
             continue
 
+        if any(i.dim.root.is_Time for i in iterations):
+            # Time-tiled loop nests are left as they are, since the skewed
+            # blocks are already clipped to the iteration space
+            headers = [('MIN(a,b)', '(((a) < (b)) ? (a) : (b))'),
+                       ('MAX(a,b)', '(((a) > (b)) ? (a) : (b))')]
+            continue
+
         root = iterations[0]
         if root in mapper:
             continue
@@ -116,7 +127,115 @@ def relax_incr_dimensions(iet, **kwargs):
 
     iet = Transformer(mapper).visit(iet)
 
-    return iet, {'efuncs': efuncs}
+    return iet, {'efuncs': efuncs, 'headers': headers}
+
+
+@iet_pass
+def color_sparse_increments(iet):
+    """
+    Turn the Iterations over the sparse points of a SparseFunction that may only
+    be parallelized with atomic increments, such as injections, into sequential
+    Iterations over "colors" of sparse points. The sparse points with the same
+    color increment disjoint sets of grid points, so they can be iterated over in
+    parallel without atomics. For example:
+
+    for p = ...  // parallel if atomic     for c = ...  // sequential
+      u[f(p)] += ...                  -->    for k = colptr[c] ... colptr[c+1] - 1
+                                               p = perm[k]  // parallel
+                                               u[f(p)] += ...
+
+    The colors are computed from the precomputed reference grid points of the
+    sparse points, so only the Iterations indexing the grid through them are
+    colored; the others are left to atomic increments.
+    """
+    mapper = {}
+    args = []
+    for tree in retrieve_iteration_tree(iet):
+        for i in tree:
+            if i in mapper or not i.is_ParallelAtomic:
+                continue
+
+            sfunctions = [f for f in FindSymbols().visit(i)
+                          if getattr(f, 'is_SparseFunction', False)
+                          and f._sparse_dim is i.dim]
+            if len(sfunctions) != 1 or not hasattr(sfunctions[0], '_coloring'):
+                continue
+            gridpoints, _ = sfunctions[0]._geometry
+            if gridpoints not in FindSymbols().visit(i):
+                continue
+            colptr, perm = sfunctions[0]._coloring
+            c, = colptr.dimensions
+            k, = perm.dimensions
+
+            # The sparse points of a given color
+            body = [Expression(DummyEq(i.dim, perm[k]))]
+            body.extend(i.nodes)
+            properties = [PARALLEL if j is PARALLEL_IF_ATOMIC else j
+                          for j in i.properties]
+            inner = Iteration(body, k, (k.symbolic_min, k.symbolic_max, 1),
+                              properties=properties)
+
+            # The colors
+            body = [Expression(DummyEq(k.symbolic_min, colptr[c])),
+                    Expression(DummyEq(k.symbolic_max, colptr[c + 1] - 1)),
+                    inner]
+            outer = Iteration(body, c, (c.symbolic_min, c.symbolic_max - 1, 1),
+                              properties=SEQUENTIAL)
+
+            mapper[i] = outer
+            args.extend([colptr, perm, c.symbolic_min, c.symbolic_max])
+
+    iet = Transformer(mapper).visit(iet)
+
+    # The number of colors is a runtime value, so the bounds of the colors
+    # Dimension must be passed in as arguments to the entry point too
+    if isinstance(iet, EntryFunction):
+        parameters = iet.parameters + tuple(i for i in args if i not in iet.parameters)
+        iet = iet._rebuild(parameters=parameters)
+
+    return iet, {'args': args}
+
+
+@iet_pass
+def hoist_color_regions(iet):
+    """
+    Hoist the parallel regions around the Iterations over the sparse points of
+    a given color (see ``color_sparse_increments``) outside of the Iterations
+    over the colors, so that a single parallel region is opened rather than one
+    per color. The implicit barrier at the end of each work-sharing loop keeps
+    the colors apart. For example:
+
+    for c = ...                          #pragma omp parallel
+      k_m = colptr[c], k_M = ...           for c = ...
+      #pragma omp parallel         -->       k_m = colptr[c], k_M = ...
+      #pragma omp for                        #pragma omp for
+      for k = k_m ... k_M                    for k = k_m ... k_M
+    """
+    sfunctions = [f for f in FindSymbols().visit(iet)
+                  if getattr(f, 'is_SparseFunction', False) and '_coloring' in f.__dict__]
+    colors = [f._coloring[0].dimensions[0] for f in sfunctions]
+
+    mapper = {}
+    for i in FindNodes(Iteration).visit(iet):
+        if i.dim not in colors:
+            continue
+
+        # Expect the bounds of the sparse points of the color, followed by
+        # the parallel region
+        *prefix, region = i.nodes
+        if not (isinstance(region, ParallelBlock) and
+                all(isinstance(j, Expression) for j in prefix)):
+            continue
+        partree = region.partree
+
+        body = i._rebuild(nodes=prefix + list(partree.prefix) + [partree.root])
+        partree = partree._rebuild(prefix=(), body=body)
+
+        mapper[i] = region._rebuild(body=partree)
+
+    iet = Transformer(mapper).visit(iet)
+
+    return iet, {}
 
 
 def is_on_device(maybe_symbol, gpu_fit, only_writes=False):
@@ -1,8 +1,9 @@
 import numpy as np
 import cgen as c
-from sympy import Or, Max
+from sympy import Add, Or, Max
 
 from devito.data import FULL
+from devito.exceptions import InvalidOperator
 from devito.ir import (DummyEq, Conditional, Dereference, Expression, ExpressionBundle,
                        List, ParallelTree, Prodder, FindSymbols, FindNodes, Return,
                        VECTORIZED, Transformer, IsPerfectIteration, filter_iterations,
@@ -183,14 +184,17 @@ class PragmaShmTransformer(PragmaSimdTransformer):
         exprs = FindNodes(Expression).visit(partree)
         exprs = [i for i in exprs if i.is_Increment and not i.is_ForeignExpression]
 
-        reduction = [i.output for i in exprs]
+        reduction = [(i.output, i.operation or Add) for i in exprs]
         if all(i.is_Affine for i in partree.collapsed) or \
-           all(not i.is_Indexed for i in reduction):
+           all(not i.is_Indexed for i, _ in reduction):
             # Implement reduction
             mapper = {partree.root: partree.root._rebuild(reduction=reduction)}
-        else:
+        elif all(i.is_augmented for i in exprs):
             # Make sure the increment is atomic
             mapper = {i: i._rebuild(pragmas=self.lang['atomic']) for i in exprs}
+        else:
+            raise InvalidOperator("Cannot parallelize non-affine min/max "
+                                  "reductions into Indexeds")
 
         partree = Transformer(mapper).visit(partree)
 
@@ -12,7 +12,7 @@ from devito.tools import Pickable, as_tuple, is_integer
 __all__ = ['CondEq', 'CondNe', 'IntDiv', 'FunctionFromPointer', 'FieldFromPointer',
            'FieldFromComposite', 'ListInitializer', 'Byref', 'IndexedPointer',
            'DefFunction', 'InlineIf', 'Macro', 'Literal', 'INT', 'FLOAT', 'DOUBLE',
-           'FLOOR', 'cast_mapper']
+           'FLOOR', 'MIN', 'MAX', 'cast_mapper']
 
 
 class CondEq(sympy.Eq):
@@ -393,5 +393,10 @@ INT = Function('INT')
 FLOAT = Function('FLOAT')
 DOUBLE = Function('DOUBLE')
 FLOOR = Function('floor')
+MIN = Function('MIN')
+MAX = Function('MAX')
+
+# Pickling looks up the undefined functions by name within their module
+floor = FLOOR
 
 cast_mapper = {np.float32: FLOAT, float: DOUBLE, np.float64: DOUBLE}
@@ -1,8 +1,11 @@
+import ctypes
 import os
+import platform
 from pathlib import Path
 from tempfile import gettempdir
 
-__all__ = ['change_directory', 'make_tempdir']
+__all__ = ['change_directory', 'make_tempdir', 'fstype', 'perf_events',
+           'perf_event_open']
 
 
 class change_directory(object):
@@ -34,3 +37,94 @@ def make_tempdir(prefix=None):
     tmpdir = Path(gettempdir()).joinpath(name)
     tmpdir.mkdir(parents=True, exist_ok=True)
     return tmpdir
+
+
+def fstype(path):
+    """
+    The type (e.g., ext4, tmpfs) of the file system holding `path`, as listed in
+    `/proc/mounts`; None if unknown (e.g., not on Linux).
+    """
+    path = os.path.realpath(path)
+    ret = None
+    mountpoint = ''
+    try:
+        with open('/proc/mounts') as f:
+            for line in f:
+                _, mnt, fs = line.split()[:3]
+                if path != mnt and not path.startswith(mnt.rstrip('/') + '/'):
+                    continue
+                # The innermost mount point wins; if a mount point is mounted
+                # over, the last mount wins
+                if len(mnt) >= len(mountpoint):
+                    ret, mountpoint = fs, mnt
+    except (OSError, ValueError):
+        return None
+    return ret
+
+
+perf_events = {
+    'cycles': (0, 0),
+    'instructions': (0, 1),
+    'llc_references': (0, 2),
+    'llc_misses': (0, 3),
+    'branch_misses': (0, 5),
+    'task_clock': (1, 1),
+    'page_faults': (1, 2),
+}
+"""
+The events that may be counted through `perf_event_open`, as `(type, config)`
+pairs (see `man perf_event_open`). Raw, processor-specific, events, such as those
+counting the floating-point operations, may be added with type 4 (PERF_TYPE_RAW).
+"""
+
+
+class perf_event_attr(ctypes.Structure):
+    _fields_ = [('type', ctypes.c_uint32),
+                ('size', ctypes.c_uint32),
+                ('config', ctypes.c_uint64),
+                ('sample_period', ctypes.c_uint64),
+                ('sample_type', ctypes.c_uint64),
+                ('read_format', ctypes.c_uint64),
+                ('flags', ctypes.c_uint64),
+                ('wakeup_events', ctypes.c_uint32),
+                ('bp_type', ctypes.c_uint32),
+                ('config1', ctypes.c_uint64),
+                ('config2', ctypes.c_uint64)]
+
+
+_perf_event_open_nr = {'x86_64': 298, 'aarch64': 241, 'ppc64le': 319}
+
+_perf_event_fds = {}
+
+
+def perf_event_open(event):
+    """
+    Open a counter for the `perf_events` entry `event`, counting in user space
+    on the calling thread and on the threads it creates afterwards. The file
+    descriptors are cached, so each event is opened at most once per process.
+
+    Returns
+    -------
+    int
+        The file descriptor of the counter, or -1 if the counter can't be opened
+        (e.g., unsupported platform or event, insufficient permissions).
+    """
+    key = (os.getpid(), event)
+    if key in _perf_event_fds:
+        return _perf_event_fds[key]
+
+    fd = -1
+    try:
+        nr = _perf_event_open_nr[platform.machine()]
+        attr = perf_event_attr()
+        attr.type, attr.config = perf_events[event]
+        attr.size = ctypes.sizeof(perf_event_attr)
+        # inherit=1, exclude_kernel=1, exclude_hv=1
+        attr.flags = (1 << 1) | (1 << 5) | (1 << 6)
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.syscall(nr, ctypes.byref(attr), 0, -1, -1, 0)
+    except (KeyError, OSError, AttributeError):
+        pass
+
+    _perf_event_fds[key] = max(fd, -1)
+    return _perf_event_fds[key]
@@ -1,9 +1,13 @@
 import gc
 import weakref
+from collections import Counter, OrderedDict
 
 import sympy
 from sympy import cache
 
+from devito.logger import warning
+from devito.parameters import configuration
+
 
 __all__ = ['Cached', '_SymbolCache', 'CacheManager']
 
@@ -138,8 +142,75 @@ class CacheManager(object):
     """
     ncalls_w_force_false = 0
 
+    live = OrderedDict()
+    """
+    The data allocated by the cached objects, in least-recently-used order. This
+    is a mapper from `id(data)` to `(weakref(data), name, type, nbytes)`.
+    """
+
     @classmethod
-    def clear(cls, force=True):
+    def track(cls, obj):
+        """
+        Start tracking the data, just allocated, of the cached object `obj`.
+        """
+        data = obj._data
+        if data._memfree_args is None:
+            # E.g., user-provided memory through an ExternalAllocator
+            return
+        key = id(data)
+
+        def untrack(ref):
+            cls.live.pop(key, None)
+
+        # E.g., `Function` rather than the dynamically created `type(obj)`
+        t = obj._pickle_reconstruct.__name__
+
+        cls.live[key] = (weakref.ref(data, untrack), obj.name, t, data.nbytes)
+
+    @classmethod
+    def touch(cls, obj):
+        """
+        Mark the data of the cached object `obj` as the most recently used.
+        """
+        try:
+            cls.live.move_to_end(id(obj._data))
+        except KeyError:
+            pass
+
+    @classmethod
+    def nbytes_live(cls):
+        """The number of bytes of data held by the cached objects."""
+        # Note: `live` is iterated over through a snapshot, as any garbage
+        # collection triggered in the meantime may pop entries from it
+        return sum(v[3] for v in tuple(cls.live.values()))
+
+    @classmethod
+    def stats(cls):
+        """
+        Return the memory statistics of the cached objects, that is a mapper
+        with the following entries:
+
+            * 'allocators': the live bytes for each MemoryAllocator;
+            * 'functions': the live bytes for each type of Function;
+            * 'lru': the name and the live bytes of the objects holding data,
+              the least recently used first;
+            * 'budget': the memory budget, or None if unbounded.
+        """
+        from devito.data import allocation_stats
+
+        live = tuple(cls.live.values())
+
+        functions = Counter()
+        for _, _, t, nbytes in live:
+            functions[t] += nbytes
+
+        return {'allocators': allocation_stats(),
+                'functions': dict(functions),
+                'lru': [(name, nbytes) for _, name, _, nbytes in live],
+                'budget': configuration['cache-budget'] or None}
+
+    @classmethod
+    def clear_sympy_caches(cls):
         # Wipe out the "true" SymPy cache
         cache.clear_cache()
 
@@ -149,6 +220,62 @@ class CacheManager(object):
         sympy.polys.fields._field_cache.clear()
         sympy.polys.domains.modularinteger._modular_integer_cache.clear()
 
+    @classmethod
+    def clear_operator_caches(cls):
+        # The cached reduction Operators keep their Functions, and therefore
+        # their data, alive
+        from devito.builtins.utils import reductions
+        reductions.clear()
+
+    @classmethod
+    def reclaim(cls, nbytes=0):
+        """
+        Make room, within `configuration['cache-budget']`, for `nbytes` of new
+        data, by evicting the unreferenced cached objects. If no budget is set,
+        fall back to ``clear(force=False)``.
+
+        Notes
+        -----
+        Unless the budget would be exceeded, this is almost free. Otherwise,
+        garbage collection is performed one generation at a time, the youngest
+        first, until enough memory is reclaimed. Thus, a full garbage collection
+        only occurs if the unreferenced objects are old ones.
+
+        The unreferenced objects are evicted in the order the garbage collector
+        finds them, not in least-recently-used order: the objects still in
+        use can't be evicted anyway, while an unreferenced object is lost upon
+        the next garbage collection, be it triggered here or by the interpreter.
+        The recency of use is only reported, through ``stats`` and the warning
+        emitted when the budget can't be honoured.
+        """
+        budget = configuration['cache-budget']
+        if not budget:
+            cls.clear(force=False)
+            return
+        if cls.nbytes_live() + nbytes <= budget:
+            return
+
+        cls.clear_sympy_caches()
+        cls.clear_operator_caches()
+
+        for generation in range(3):
+            gc.collect(generation)
+            if cls.nbytes_live() + nbytes <= budget:
+                break
+        else:
+            # The objects in the cache are all referenced, so there's nothing
+            # else we can do
+            lru = ', '.join("%s (%d bytes)" % (name, v)
+                            for _, name, _, v in tuple(cls.live.values())[:3])
+            warning("Exceeding the cache budget of %d bytes; the least recently "
+                    "used data are: %s" % (budget, lru))
+
+        cls._purge()
+
+    @classmethod
+    def clear(cls, force=True):
+        cls.clear_sympy_caches()
+
         # Maybe trigger garbage collection
         if force is False:
             if cls.ncalls_w_force_false + 1 == cls.force_ths:
@@ -163,8 +290,13 @@ class CacheManager(object):
                 # We won't call gc.collect() this time
                 cls.ncalls_w_force_false += 1
         else:
+            cls.clear_operator_caches()
             gc.collect()
 
+        cls._purge()
+
+    @classmethod
+    def _purge(cls):
         for key, obj in list(_SymbolCache.items()):
             if obj() is None:
                 del _SymbolCache[key]
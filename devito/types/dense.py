@@ -1,6 +1,7 @@
 from collections import namedtuple
 from ctypes import POINTER, Structure, c_void_p, c_int, cast, byref
 from functools import wraps, reduce
+from io import BytesIO
 from math import ceil
 from operator import mul
 
@@ -10,7 +11,7 @@ from psutil import virtual_memory
 from cached_property import cached_property
 from cgen import Struct, Value
 
-from devito.builtins import assign
+from devito.builtins import assign, first_touch
 from devito.data import (DOMAIN, OWNED, HALO, NOPAD, FULL, LEFT, CENTER, RIGHT,
                          Data, default_allocator)
 from devito.exceptions import InvalidArgument
@@ -113,15 +114,19 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
                 debug("Allocating memory for %s%s" % (self.name, self.shape_allocated))
 
                 # Clear up both SymPy and Devito caches to drop unreachable data
-                CacheManager.clear(force=False)
+                nbytes = int(np.prod(self.shape_allocated))*np.dtype(self.dtype).itemsize
+                CacheManager.reclaim(nbytes)
 
                 # Allocate the actual data object
                 self._data = Data(self.shape_allocated, self.dtype,
                                   modulo=self._mask_modulo, allocator=self._allocator,
                                   distributor=self._distributor)
+                CacheManager.track(self)
 
                 # Initialize data
-                if self._first_touch:
+                if self._first_touch == 'numa':
+                    first_touch(self)
+                elif self._first_touch:
                     assign(self, 0)
                 if callable(self._initializer):
                     if self._first_touch:
@@ -132,8 +137,11 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
                     except ValueError:
                         # Perhaps user only wants to initialise the physical domain
                         self._initializer(self.data)
-                else:
+                elif self._first_touch != 'numa' and not self._allocator.zero_filled:
+                    # Unless already zeroed by the 'numa' first touch or the allocator
                     self.data_with_halo.fill(0)
+            else:
+                CacheManager.touch(self)
 
             return func(self)
         return wrapper
@@ -446,6 +454,167 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
         """
         return self.data._gather(start=start, stop=stop, step=step, rank=rank)
 
+    def to_file(self, path):
+        """
+        Write the domain data to a file, in NumPy's ``.npy`` format.
+
+        With MPI, each rank writes its own portion of the data, concurrently with
+        the other ranks, via collective MPI-IO. Thus, unlike ``data_gather``, the
+        global array is never assembled on a single rank.
+
+        Parameters
+        ----------
+        path : str
+            The path to the file.
+
+        Notes
+        -----
+        The file may be read back with ``numpy.load`` or ``from_file``,
+        irrespective of the number of MPI ranks used to write it.
+        """
+        data = np.asarray(self.data_ro_domain._local)
+
+        if self._distributor is None or not self._distributor.is_parallel:
+            with open(path, 'wb') as f:
+                np.lib.format.write_array(f, data, allow_pickle=False)
+            return
+
+        comm = self._distributor.comm
+        shape, start = self._io_slab
+
+        # Replicated portions of the data (e.g., along the Dimensions of a Grid
+        # which `self` isn't defined over) are written by a single rank
+        slabs = comm.allgather((shape, start))
+        if slabs.index((shape, start)) != comm.rank:
+            shape = ()
+
+        header = BytesIO()
+        np.lib.format.write_array_header_1_0(header, {
+            'descr': np.lib.format.dtype_to_descr(np.dtype(self.dtype)),
+            'fortran_order': False,
+            'shape': self.shape_global
+        })
+        header = header.getvalue()
+
+        fh = MPI.File.Open(comm, path, MPI.MODE_WRONLY | MPI.MODE_CREATE)
+        fh.Set_size(0)
+        if comm.rank == 0:
+            fh.Write_at(0, header)
+        etype, filetype = self._io_types(self.dtype, shape, start)
+        fh.Set_view(len(header), etype, filetype)
+        fh.Write_all(np.ascontiguousarray(data) if shape else np.empty(0, self.dtype))
+        fh.Close()
+        if filetype is not etype:
+            filetype.Free()
+
+    @classmethod
+    def from_file(cls, path, halo=False, **kwargs):
+        """
+        Create a new object from a file in NumPy's ``.npy`` format, such as one
+        produced by ``to_file``.
+
+        With MPI, each rank reads its own portion of the data, concurrently with
+        the other ranks, via collective MPI-IO.
+
+        Parameters
+        ----------
+        path : str
+            The path to the file.
+        halo : bool, optional
+            If True, the halo regions are filled with the data of the neighboring
+            ranks right after loading. Defaults to False, in which case this
+            happens lazily, when the halo is first accessed.
+        **kwargs
+            The arguments to construct the new object, such as `name` and `grid`.
+            The global shape of the object must match that of the data in the file.
+
+        Examples
+        --------
+        >>> from devito import Grid, Function
+        >>> grid = Grid(shape=(4, 4))
+        >>> f = Function(name='f', grid=grid)
+        >>> f.data[:] = 1.
+        >>> f.to_file('f.npy')  # doctest: +SKIP
+        >>> g = Function.from_file('f.npy', name='g', grid=grid)  # doctest: +SKIP
+        """
+        obj = cls(**kwargs)
+
+        if obj._distributor is None or not obj._distributor.is_parallel:
+            obj._read_file(path, np.load(path, mmap_mode='r'))
+        else:
+            obj._read_file_mpi(path)
+
+        if halo:
+            obj._halo_exchange()
+
+        return obj
+
+    def _read_file(self, path, array):
+        if array.shape != self.shape_global:
+            raise ValueError("`%s` has shape %s, while `%s` has global shape %s"
+                             % (path, array.shape, self.name, self.shape_global))
+        self.data[:] = array
+
+    def _read_file_mpi(self, path):
+        comm = self._distributor.comm
+
+        # Only one rank reads the header, which is then broadcast to all others
+        if comm.rank == 0:
+            array = np.load(path, mmap_mode='r')
+            info = (array.shape, array.dtype, array.offset,
+                    array.ndim > 1 and np.isfortran(array))
+        else:
+            info = None
+        shape, dtype, offset, fortran_order = comm.bcast(info, root=0)
+
+        if shape != self.shape_global:
+            raise ValueError("`%s` has shape %s, while `%s` has global shape %s"
+                             % (path, shape, self.name, self.shape_global))
+        if fortran_order:
+            raise ValueError("Cannot read `%s`, which is in Fortran order" % path)
+
+        shape, start = self._io_slab
+        buf = np.empty(shape if shape else 0, dtype=dtype)
+
+        fh = MPI.File.Open(comm, path, MPI.MODE_RDONLY)
+        etype, filetype = self._io_types(dtype, shape, start)
+        fh.Set_view(offset, etype, filetype)
+        fh.Read_all(buf)
+        fh.Close()
+        if filetype is not etype:
+            filetype.Free()
+
+        if shape:
+            self.data._local[:] = buf
+
+    @property
+    def _io_slab(self):
+        """
+        The shape and the global position of the domain data of the calling
+        rank, or an empty shape if the calling rank owns no data.
+        """
+        start = []
+        for dec in self._decomposition:
+            if dec is None:
+                start.append(0)
+            elif dec.loc_empty:
+                return (), ()
+            else:
+                start.append(int(dec.loc_abs_min))
+        return self.shape, tuple(start)
+
+    def _io_types(self, dtype, shape, start):
+        """
+        The MPI datatypes to view a `.npy` file as the slab of domain data of
+        shape `shape` at `start`.
+        """
+        etype = MPI._typedict[np.dtype(dtype).char]
+        if not shape or not all(shape):
+            return etype, etype
+        filetype = etype.Create_subarray(self.shape_global, shape, start)
+        filetype.Commit()
+        return etype, filetype
+
     @property
     @_allocate_memory
     def data_domain(self):
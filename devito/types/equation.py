@@ -10,7 +10,7 @@ from devito.logger import warning
 from devito.tools import as_tuple
 from devito.types.lazy import Evaluable
 
-__all__ = ['Eq', 'Inc', 'solve']
+__all__ = ['Eq', 'Inc', 'ReduceMax', 'ReduceMin', 'solve']
 
 
 class Eq(sympy.Eq, Evaluable):
@@ -62,6 +62,9 @@ class Eq(sympy.Eq, Evaluable):
 
     is_Increment = False
 
+    operation = None
+    """The reduction operation, if any, performed by the equation."""
+
     def __new__(cls, lhs, rhs=0, subdomain=None, coefficients=None, implicit_dims=None,
                 **kwargs):
         kwargs['evaluate'] = False
@@ -213,12 +216,59 @@ class Inc(Eq):
 
     is_Increment = True
 
+    operation = sympy.Add
+
     def __str__(self):
-        return "Inc(%s, %s)" % (self.lhs, self.rhs)
+        return "%s(%s, %s)" % (self.__class__.__name__, self.lhs, self.rhs)
 
     __repr__ = __str__
 
 
+class ReduceMax(Inc):
+
+    """
+    A max-reduction relation between two objects, the left-hand side and the
+    right-hand side.
+
+    Like an Inc, a ReduceMax is an associative and commutative reduction, so the
+    Operator is free to parallelize it (e.g., through an OpenMP reduction clause).
+
+    Examples
+    --------
+    >>> from devito import Grid, Function, ReduceMax
+    >>> from devito.types import Scalar
+    >>> grid = Grid(shape=(4, 4))
+    >>> f = Function(name='f', grid=grid)
+    >>> s = Scalar(name='s')
+    >>> ReduceMax(s, f)
+    ReduceMax(s, f(x, y))
+
+    Notes
+    -----
+    A ReduceMax can be thought of as the assignment ``a = max(a, b)``.
+    """
+
+    operation = sympy.Max
+
+
+class ReduceMin(Inc):
+
+    """
+    A min-reduction relation between two objects, the left-hand side and the
+    right-hand side.
+
+    Notes
+    -----
+    A ReduceMin can be thought of as the assignment ``a = min(a, b)``.
+
+    See Also
+    --------
+    ReduceMax
+    """
+
+    operation = sympy.Min
+
+
 def solve(eq, target, **kwargs):
     """
     Algebraically rearrange an Eq w.r.t. a given symbol.
@@ -1,9 +1,13 @@
-from ctypes import c_int, c_double, c_void_p
+from ctypes import POINTER, c_int, c_double, c_long, c_void_p
 
+import numpy as np
+
+from devito.parameters import configuration
+from devito.tools import perf_event_open
 from devito.types import CompositeObject, LocalObject, Symbol
 
-__all__ = ['Timer', 'VoidPointer', 'VolatileInt', 'c_volatile_int',
-           'c_volatile_int_p']
+__all__ = ['Timer', 'Tracer', 'PerfCounters', 'VoidPointer', 'VolatileInt',
+           'c_volatile_int', 'c_volatile_int_p']
 
 
 class Timer(CompositeObject):
@@ -37,6 +41,113 @@ class Timer(CompositeObject):
     _pickle_args = ['name', 'sections']
 
 
+class Tracer(CompositeObject):
+
+    """
+    A ring buffer of timestamped events, each event being an execution of a
+    profiled code section. An event is stored as the triplet `(section index,
+    start time, end time)`; once the buffer is full, the oldest events are
+    overwritten. The buffer size is given by `configuration['profiling-trace-size']`.
+    """
+
+    def __init__(self, name, sections):
+        super().__init__(name, 'tracer', [('events', POINTER(c_double)),
+                                          ('size', c_long),
+                                          ('nevents', c_long)])
+        self._sections = tuple(sections)
+        self._buffer = None
+
+    @property
+    def sections(self):
+        return self._sections
+
+    def _arg_values(self, args=None, **kwargs):
+        values = super()._arg_values(args=args, **kwargs)
+
+        # (Re)allocate the buffer if necessary, and reset it
+        obj = values[self.name]._obj
+        size = configuration['profiling-trace-size']
+        if obj.size != size:
+            self._buffer = np.zeros(3*size, dtype=np.float64)
+            obj.events = self._buffer.ctypes.data_as(POINTER(c_double))
+            obj.size = size
+        obj.nevents = 0
+
+        return values
+
+    @classmethod
+    def read(cls, obj):
+        """
+        The events recorded in the ring buffer `obj`, from the oldest to the
+        most recent one, as an array of shape `(nevents, 3)`, as well as the
+        number of overwritten events.
+        """
+        if obj.size == 0 or obj.nevents == 0:
+            return np.empty((0, 3)), 0
+        events = np.ctypeslib.as_array(obj.events, shape=(obj.size, 3))
+        if obj.nevents <= obj.size:
+            return events[:obj.nevents].copy(), 0
+        else:
+            return np.roll(events, -(obj.nevents % obj.size), axis=0), \
+                obj.nevents - obj.size
+
+    # Pickling support
+    _pickle_args = ['name', 'sections']
+
+
+class PerfCounters(CompositeObject):
+
+    """
+    The events (e.g., cycles, instructions) occurred within each profiled code
+    section, as measured through the hardware performance counters. The counters
+    are read through the Linux `perf_event` interface.
+    """
+
+    def __init__(self, name, sections, events):
+        self._sections = tuple(sections)
+        self._events = tuple(events)
+        pfields = [('fd_%s' % i, c_int) for i in self._events]
+        pfields.extend([('%s_%s' % (s, i), c_double)
+                        for s in self._sections for i in self._events])
+        super().__init__(name, 'counters', pfields)
+
+    @property
+    def sections(self):
+        return self._sections
+
+    @property
+    def events(self):
+        return self._events
+
+    @property
+    def fds(self):
+        """The file descriptors of the counters; -1 if unavailable."""
+        return tuple(perf_event_open(i) for i in self.events)
+
+    def _arg_values(self, args=None, **kwargs):
+        values = super()._arg_values(args=args, **kwargs)
+
+        # Reset counters
+        obj = values[self.name]._obj
+        for i, fd in zip(self.events, self.fds):
+            setattr(obj, 'fd_%s' % i, fd)
+        for s in self.sections:
+            for i in self.events:
+                setattr(obj, '%s_%s' % (s, i), 0.0)
+
+        return values
+
+    def read(self, obj, section):
+        """
+        The events counted within `section`; None for the unavailable counters.
+        """
+        return {i: int(getattr(obj, '%s_%s' % (section, i)))
+                if getattr(obj, 'fd_%s' % i) >= 0 else None for i in self.events}
+
+    # Pickling support
+    _pickle_args = ['name', 'sections', 'events']
+
+
 class VoidPointer(LocalObject):
 
     dtype = type('void*', (c_void_p,), {})
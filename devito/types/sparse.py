@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from hashlib import sha1
 from itertools import product
 
 import sympy
@@ -6,6 +7,7 @@ import numpy as np
 from cached_property import cached_property
 
 from devito.finite_differences import generate_fd_shortcuts
+from devito.parameters import configuration
 from devito.mpi import MPI, SparseDistributor
 from devito.operations import LinearInterpolator, PrecomputedInterpolator
 from devito.symbolics import (INT, FLOOR, cast_mapper, indexify,
@@ -36,6 +38,13 @@ class AbstractSparseFunction(DiscreteFunction):
     _sub_functions = ()
     """SubFunctions encapsulated within this AbstractSparseFunction."""
 
+    _data_version = 0
+    """
+    A counter increased every time a writable view of the data is handed out,
+    e.g. through ``data``. Like the halo flag of the DiscreteFunctions, this
+    relies on a new view being requested to modify the data values.
+    """
+
     def __init_finalize__(self, *args, **kwargs):
         super(AbstractSparseFunction, self).__init_finalize__(*args, **kwargs)
         self._npoint = kwargs['npoint']
@@ -74,6 +83,18 @@ class AbstractSparseFunction(DiscreteFunction):
         # no-op for SparseFunctions
         return
 
+    @property
+    def _is_halo_dirty(self):
+        # SparseFunctions have no halo
+        return False
+
+    @_is_halo_dirty.setter
+    def _is_halo_dirty(self, value):
+        # The flag is raised by all accessors handing out a writable view of
+        # the data, so here it's used to keep track of the writes
+        if value:
+            self._data_version += 1
+
     @property
     def npoint(self):
         return self.shape[self._sparse_position]
@@ -141,6 +162,101 @@ class AbstractSparseFunction(DiscreteFunction):
                 ret.setdefault(r, []).append(i)
         return {k: filter_ordered(v) for k, v in ret.items()}
 
+    @property
+    def _dist_plan_key(self):
+        """
+        A digest of the rank-local data determining the position of the sparse
+        points, hence the validity of the routing plan.
+        """
+        raise NotImplementedError
+
+    @property
+    def _dist_plan(self):
+        """
+        The routing plan of the sparse data values across the MPI ranks.
+
+        Building a plan requires, among other things, the support of all sparse
+        points and an ``MPI_Alltoall``, so it is cached for as long as the sparse
+        points don't move. Checking this only requires a tiny ``MPI_Allreduce``,
+        since each MPI rank owns a different subset of the sparse points.
+        """
+        key = self._dist_plan_key
+        plan = getattr(self, '_dist_plan_cache', None)
+
+        valid = plan is not None and plan.key == key
+        if not self.grid.distributor.comm.allreduce(valid, op=MPI.LAND):
+            plan = self._dist_plan_cache = self._build_dist_plan(key)
+
+        return plan
+
+    def _build_dist_plan(self, key):
+        dmap = self._dist_datamap
+        comm = self.grid.distributor.comm
+        plan = DistPlan(key)
+
+        # A mask to index into `self.data`, which creates a new data array that
+        # logically contains N consecutive groups of sparse data values, where N
+        # is the number of MPI ranks. The i-th group contains the sparse data
+        # values accessible by the i-th MPI rank. Thus, sparse data values along
+        # the boundary of two or more MPI ranks are duplicated
+        mask = np.array(flatten(dmap[i] for i in sorted(dmap)), dtype=int)
+        scatter_mask = [slice(None) for i in range(self.ndim)]
+        scatter_mask[self._sparse_position] = mask
+        plan.scatter_mask = tuple(scatter_mask)
+
+        # A mask to index into the data received upon returning from the
+        # `MPI_Alltoallv`, which discards the duplicate sparse data values. The
+        # resulting data array can thus be used to populate `self.data`. Note
+        # that the sparse data values are gathered in their original order, so
+        # the coordinates don't need to be sent back unless they have changed
+        inds = np.unique(mask, return_index=True)[1]
+        gather_mask = list(scatter_mask)
+        gather_mask[self._sparse_position] = inds.tolist()
+        plan.gather_mask = tuple(gather_mask)
+
+        # How many sparse points is this MPI rank expected to send/receive
+        # to/from each other MPI rank
+        ssparse = np.array([len(dmap.get(i, [])) for i in range(comm.size)], dtype=int)
+        rsparse = np.empty(comm.size, dtype=int)
+        comm.Alltoall(ssparse, rsparse)
+        plan.count = (ssparse, rsparse)
+
+        # Per-rank shape of send/recv data
+        sshape = []
+        rshape = []
+        for s, r in zip(ssparse, rsparse):
+            handle = list(self.shape)
+            handle[self._sparse_position] = s
+            sshape.append(tuple(handle))
+
+            handle = list(self.shape)
+            handle[self._sparse_position] = r
+            rshape.append(tuple(handle))
+
+        # Per-rank count of send/recv data
+        scount = tuple(prod(i) for i in sshape)
+        rcount = tuple(prod(i) for i in rshape)
+
+        # Per-rank displacement of send/recv data (it's actually all contiguous,
+        # but the Alltoallv needs this information anyway)
+        sdisp = np.concatenate([[0], np.cumsum(scount)[:-1]])
+        rdisp = np.concatenate([[0], tuple(np.cumsum(rcount))[:-1]])
+
+        # Total shape of send/recv data
+        sshape = list(self.shape)
+        sshape[self._sparse_position] = sum(ssparse)
+        rshape = list(self.shape)
+        rshape[self._sparse_position] = sum(rsparse)
+
+        # May have to swap axes, as `MPI_Alltoallv` expects contiguous data, and
+        # the sparse dimension may not be the outermost
+        sshape = tuple(sshape[i] for i in self._dist_reorder_mask)
+        rshape = tuple(rshape[i] for i in self._dist_reorder_mask)
+
+        plan.alltoall = (sshape, scount, sdisp, rshape, rcount, rdisp)
+
+        return plan
+
     @property
     def _dist_scatter_mask(self):
         """
@@ -150,11 +266,7 @@ class AbstractSparseFunction(DiscreteFunction):
         values accessible by the i-th MPI rank.  Thus, sparse data values along
         the boundary of two or more MPI ranks are duplicated.
         """
-        dmap = self._dist_datamap
-        mask = np.array(flatten(dmap[i] for i in sorted(dmap)), dtype=int)
-        ret = [slice(None) for i in range(self.ndim)]
-        ret[self._sparse_position] = mask
-        return tuple(ret)
+        return self._dist_plan.scatter_mask
 
     @property
     def _dist_subfunc_scatter_mask(self):
@@ -173,13 +285,7 @@ class AbstractSparseFunction(DiscreteFunction):
         duplicate sparse data values have been discarded. The resulting data
         array can thus be used to populate ``self.data``.
         """
-        ret = list(self._dist_scatter_mask)
-        mask = ret[self._sparse_position]
-        inds = np.unique(mask, return_index=True)[1]
-        inds.sort()
-        ret[self._sparse_position] = inds.tolist()
-
-        return tuple(ret)
+        return self._dist_plan.gather_mask
 
     @property
     def _dist_subfunc_gather_mask(self):
@@ -196,14 +302,7 @@ class AbstractSparseFunction(DiscreteFunction):
         A 2-tuple of comm-sized iterables, which tells how many sparse points
         is this MPI rank expected to send/receive to/from each other MPI rank.
         """
-        dmap = self._dist_datamap
-        comm = self.grid.distributor.comm
-
-        ssparse = np.array([len(dmap.get(i, [])) for i in range(comm.size)], dtype=int)
-        rsparse = np.empty(comm.size, dtype=int)
-        comm.Alltoall(ssparse, rsparse)
-
-        return ssparse, rsparse
+        return self._dist_plan.count
 
     @cached_property
     def _dist_reorder_mask(self):
@@ -220,41 +319,7 @@ class AbstractSparseFunction(DiscreteFunction):
         The metadata necessary to perform an ``MPI_Alltoallv`` distributing the
         sparse data values across the MPI ranks needing them.
         """
-        ssparse, rsparse = self._dist_count
-
-        # Per-rank shape of send/recv data
-        sshape = []
-        rshape = []
-        for s, r in zip(ssparse, rsparse):
-            handle = list(self.shape)
-            handle[self._sparse_position] = s
-            sshape.append(tuple(handle))
-
-            handle = list(self.shape)
-            handle[self._sparse_position] = r
-            rshape.append(tuple(handle))
-
-        # Per-rank count of send/recv data
-        scount = tuple(prod(i) for i in sshape)
-        rcount = tuple(prod(i) for i in rshape)
-
-        # Per-rank displacement of send/recv data (it's actually all contiguous,
-        # but the Alltoallv needs this information anyway)
-        sdisp = np.concatenate([[0], np.cumsum(scount)[:-1]])
-        rdisp = np.concatenate([[0], tuple(np.cumsum(rcount))[:-1]])
-
-        # Total shape of send/recv data
-        sshape = list(self.shape)
-        sshape[self._sparse_position] = sum(ssparse)
-        rshape = list(self.shape)
-        rshape[self._sparse_position] = sum(rsparse)
-
-        # May have to swap axes, as `MPI_Alltoallv` expects contiguous data, and
-        # the sparse dimension may not be the outermost
-        sshape = tuple(sshape[i] for i in self._dist_reorder_mask)
-        rshape = tuple(rshape[i] for i in self._dist_reorder_mask)
-
-        return sshape, scount, sdisp, rshape, rcount, rdisp
+        return self._dist_plan.alltoall
 
     @property
     def _dist_subfunc_alltoall(self):
@@ -279,8 +344,10 @@ class AbstractSparseFunction(DiscreteFunction):
         """
         raise NotImplementedError
 
-    @memoized_meth
     def _arg_defaults(self, alias=None):
+        # Note: not memoized, as the sparse data values (and coordinates) may be
+        # changed by the user in between two Operator applications, and under
+        # MPI they must then be scattered again
         key = alias or self
         mapper = {self: key}
         mapper.update({getattr(self, i): getattr(key, i) for i in self._sub_functions})
@@ -323,9 +390,10 @@ class AbstractSparseFunction(DiscreteFunction):
         key = alias if alias is not None else self
         if isinstance(key, AbstractSparseFunction):
             # Gather into `self.data`
-            # Coords may be None if the coordinates are not used in the Operator
-            if coordsobj is None:
-                pass
+            # Coords may be None, or not even lowered to a C struct, if the
+            # coordinates are not used in the Operator
+            if coordsobj is None or not hasattr(coordsobj, '_obj'):
+                coordsobj = None
             elif np.sum([coordsobj._obj.size[i] for i in range(self.ndim)]) > 0:
                 coordsobj = self.coordinates._C_as_ndarray(coordsobj)
             key._dist_gather(self._C_as_ndarray(dataobj), coordsobj)
@@ -595,6 +663,146 @@ class SparseFunction(AbstractSparseFunction):
                                                   self.grid.dimensions[:self.grid.dim],
                                                   field_offset)])
 
+    @cached_property
+    def _geometry(self):
+        """
+        SubFunctions carrying, for each sparse point, the indices of the reference
+        grid point and the interpolation coefficients of the adjacent grid points.
+
+        Unlike those of a PrecomputedSparseFunction, these values are derived
+        automatically from the coordinates upon each Operator application, so
+        that the time loop doesn't have to recompute them at every iteration.
+        """
+        dimensions = (self.indices[-1], Dimension(name='d_%s' % self.name))
+        gridpoints = DerivedSubFunction(name='%s_gridpoints' % self.name, parent=self,
+                                        dtype=np.int32, dimensions=dimensions,
+                                        shape=(self.npoint, self.grid.dim),
+                                        space_order=0, distributor=self._distributor)
+
+        dimensions = (self.indices[-1], Dimension(name='i_%s' % self.name))
+        coeffs = DerivedSubFunction(name='%s_interpolation_coeffs' % self.name,
+                                    parent=self, dtype=self.dtype,
+                                    dimensions=dimensions,
+                                    shape=(self.npoint, len(self._point_increments)),
+                                    space_order=0, distributor=self._distributor)
+
+        return gridpoints, coeffs
+
+    @cached_property
+    def _coloring(self):
+        """
+        SubFunctions describing a partition of the sparse points into classes,
+        or "colors", such that the supports of any two sparse points with the
+        same color are disjoint. The sparse points of the i-th color are
+        ``perm[colptr[i]:colptr[i+1]]``, with ``colptr, perm = self._coloring``.
+
+        Like ``self._geometry``, these values are derived automatically from the
+        coordinates upon each Operator application.
+        """
+        dimensions = (Dimension(name='c_%s' % self.name),)
+        colptr = DerivedSubFunction(name='%s_colptr' % self.name, parent=self,
+                                    dtype=np.int32, dimensions=dimensions,
+                                    shape=(1,), space_order=0)
+
+        dimensions = (Dimension(name='k_%s' % self.name),)
+        perm = DerivedSubFunction(name='%s_perm' % self.name, parent=self,
+                                  dtype=np.int32, dimensions=dimensions,
+                                  shape=(self.npoint,), space_order=0,
+                                  distributor=self._distributor)
+
+        return colptr, perm
+
+    def _arg_position(self, coords, **kwargs):
+        """
+        The reference grid points of the sparse points with (rank-local)
+        coordinates ``coords``, as well as the position of the sparse points
+        relative to the reference grid points, in units of grid spacing.
+        """
+        coords = np.asarray(coords)
+        origin = [kwargs.get(o.name, v)
+                  for o, v in zip(self.grid.origin_symbols, self.grid.origin)]
+        spacing = [kwargs.get(d.spacing.name, h)
+                   for d, h in zip(self.grid.dimensions, self.grid.spacing)]
+        origin = np.array(origin, dtype=self.dtype)
+        spacing = np.array(spacing, dtype=self.dtype)
+
+        # Same as `_coordinate_indices` and `_coordinate_bases`
+        gridpoints = np.floor((coords - origin) / spacing).astype(np.int32)
+        bases = (coords - origin - gridpoints * spacing) / spacing
+
+        return gridpoints, bases
+
+    def _arg_geometry(self, gridpoints, bases):
+        """
+        The runtime values of the SubFunctions in ``self._geometry``.
+        """
+        coeffs = np.ones((len(bases), len(self._point_increments)), dtype=self.dtype)
+        for n, inc in enumerate(self._point_increments):
+            for i, v in enumerate(inc):
+                coeffs[:, n] *= bases[:, i] if v == 1 else 1 - bases[:, i]
+
+        return self._arg_subfuncs(self._geometry, [gridpoints, coeffs])
+
+    def _arg_coloring(self, gridpoints):
+        """
+        The runtime values of the SubFunctions in ``self._coloring``.
+
+        The support of a sparse point spans the reference grid point and the
+        next one along each Dimension. Thus, two sparse points whose reference
+        grid points have the same parity along each Dimension have disjoint
+        supports, unless they share the reference grid point. So the sparse
+        points sharing the same reference grid point are first given distinct
+        "layers", and then the color is the pair (layer, parity).
+        """
+        npoint, ndim = gridpoints.shape
+
+        # Group the sparse points by reference grid point, preserving the order
+        order = np.lexsort(gridpoints.T[::-1])
+        cells = gridpoints[order]
+        first = np.ones(npoint, dtype=bool)
+        first[1:] = np.any(cells[1:] != cells[:-1], axis=1)
+        groups = np.cumsum(first) - 1
+        starts = np.flatnonzero(first)
+        layers = np.empty(npoint, dtype=np.int32)
+        layers[order] = np.arange(npoint) - starts[groups]
+
+        parity = np.sum((gridpoints % 2) << np.arange(ndim), axis=1)
+        colors = layers * 2**ndim + parity
+
+        perm = np.argsort(colors, kind='stable').astype(np.int32)
+        colptr = np.cumsum(np.bincount(colors)) if npoint else []
+        colptr = np.unique(np.concatenate([[0], colptr])).astype(np.int32)
+
+        return self._arg_subfuncs(self._coloring, [colptr, perm])
+
+    def _arg_subfuncs(self, subfuncs, data):
+        values = {}
+        for f, v in zip(subfuncs, data):
+            values[f.name] = v
+            for i, s in zip(f.indices, v.shape):
+                values.update(i._arg_defaults(_min=0, size=s))
+        return values
+
+    def _arg_derived(self, subfunc, **kwargs):
+        """
+        The runtime values of the DerivedSubFunction ``subfunc``, along with
+        those of its siblings, in either ``self._geometry`` or ``self._coloring``.
+
+        These are only computed if ``subfunc`` is an input of the Operator, that is
+        if the Operator is using the precomputed geometry in place of the
+        coordinates, see `configuration['sparse-precompute']`, and/or iterating
+        over the sparse points by color, see the `par-inject` option.
+        """
+        new = kwargs.get(self.name)
+        sfunc = new if isinstance(new, AbstractSparseFunction) else self
+
+        gridpoints, bases = self._arg_position(sfunc._dist_coords(), **kwargs)
+
+        if subfunc in self.__dict__.get('_coloring', ()):
+            return self._arg_coloring(gridpoints)
+        else:
+            return self._arg_geometry(gridpoints, bases)
+
     @memoized_meth
     def _index_matrix(self, offset):
         # Note about the use of *memoization*
@@ -675,8 +883,14 @@ class SparseFunction(AbstractSparseFunction):
         return tuple(mapper.get(d) for d in self.dimensions)
 
     @property
-    def _dist_subfunc_alltoall(self):
-        ssparse, rsparse = self._dist_count
+    def _dist_plan_key(self):
+        coords = self.coordinates.data._local
+        return digest(coords)
+
+    def _build_dist_plan(self, key):
+        plan = super()._build_dist_plan(key)
+
+        ssparse, rsparse = plan.count
 
         # Per-rank shape of send/recv `coordinates`
         sshape = [(i, self.grid.dim) for i in ssparse]
@@ -697,76 +911,139 @@ class SparseFunction(AbstractSparseFunction):
         rshape = list(self.coordinates.shape)
         rshape[0] = sum(rsparse)
 
-        return sshape, scount, sdisp, rshape, rcount, rdisp
+        plan.subfunc_alltoall = (sshape, scount, sdisp, rshape, rcount, rdisp)
+
+        return plan
+
+    @property
+    def _dist_subfunc_alltoall(self):
+        return self._dist_plan.subfunc_alltoall
 
     def _dist_scatter(self, data=None):
-        data = data if data is not None else self.data._local
+        if data is None:
+            data = self.data_ro_domain._local
+            version = self._data_version
+        else:
+            # User-provided data, whose writes can't be tracked
+            version = None
         distributor = self.grid.distributor
 
         # If not using MPI, don't waste time
         if distributor.nprocs == 1:
-            return {self: data, self.coordinates: self.coordinates.data}
+            return {self: data, self.coordinates: self._dist_coords()}
 
         comm = distributor.comm
         mpitype = MPI._typedict[np.dtype(self.dtype).char]
 
-        # Pack sparse data values so that they can be sent out via an Alltoallv
-        data = data[self._dist_scatter_mask]
-        data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
-        # Send out the sparse point values
-        _, scount, sdisp, rshape, rcount, rdisp = self._dist_alltoall
-        scattered = np.empty(shape=rshape, dtype=self.dtype)
-        comm.Alltoallv([data, scount, sdisp, mpitype],
-                       [scattered, rcount, rdisp, mpitype])
-        data = scattered
-        # Unpack data values so that they follow the expected storage layout
-        data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
-
-        # Pack (reordered) coordinates so that they can be sent out via an Alltoallv
-        coords = self.coordinates.data._local[self._dist_subfunc_scatter_mask]
-        # Send out the sparse point coordinates
-        _, scount, sdisp, rshape, rcount, rdisp = self._dist_subfunc_alltoall
-        scattered = np.empty(shape=rshape, dtype=self.coordinates.dtype)
-        comm.Alltoallv([coords, scount, sdisp, mpitype],
-                       [scattered, rcount, rdisp, mpitype])
-        coords = scattered
-
-        # Translate global coordinates into local coordinates
-        coords = coords - np.array(self.grid.origin_offset, dtype=self.dtype)
-
-        return {self: data, self.coordinates: coords}
+        plan = self._dist_plan
 
-    def _dist_gather(self, data, coords):
+        # With resident sparse data, the Alltoallv is skipped if no MPI rank
+        # has written to its sparse data values since the last scatter
+        resident = configuration['sparse-resident']
+        if resident:
+            cached = (version is not None and plan.resident is not None and
+                      plan.resident[0] == version)
+        if resident and comm.allreduce(cached, op=MPI.LAND):
+            data = np.copy(plan.resident[1])
+        else:
+            # Pack sparse data values so that they can be sent out via an Alltoallv
+            data = data[plan.scatter_mask]
+            data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
+            # Send out the sparse point values
+            _, scount, sdisp, rshape, rcount, rdisp = plan.alltoall
+            scattered = np.empty(shape=rshape, dtype=self.dtype)
+            comm.Alltoallv([data, scount, sdisp, mpitype],
+                           [scattered, rcount, rdisp, mpitype])
+            data = scattered
+            # Unpack data values so that they follow the expected storage layout
+            data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
+            if resident and version is not None:
+                plan.resident = (version, np.copy(data))
+
+        return {self: data, self.coordinates: self._dist_coords()}
+
+    def _dist_coords(self):
+        """
+        The rank-local coordinates of the sparse points owned by this MPI rank.
+        """
         distributor = self.grid.distributor
 
         # If not using MPI, don't waste time
         if distributor.nprocs == 1:
-            return
+            return self.coordinates.data
 
         comm = distributor.comm
+        mpitype = MPI._typedict[np.dtype(self.coordinates.dtype).char]
 
-        # Pack sparse data values so that they can be sent out via an Alltoallv
-        data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
-        # Send back the sparse point values
-        sshape, scount, sdisp, _, rcount, rdisp = self._dist_alltoall
-        gathered = np.empty(shape=sshape, dtype=self.dtype)
-        mpitype = MPI._typedict[np.dtype(self.dtype).char]
-        comm.Alltoallv([data, rcount, rdisp, mpitype],
-                       [gathered, scount, sdisp, mpitype])
-        # Unpack data values so that they follow the expected storage layout
-        gathered = np.ascontiguousarray(np.transpose(gathered, self._dist_reorder_mask))
-        self._data[:] = gathered[self._dist_gather_mask]
+        plan = self._dist_plan
 
-        if coords is not None:
-            # Pack (reordered) coordinates so that they can be sent out via an Alltoallv
-            coords = coords + np.array(self.grid.origin_offset, dtype=self.dtype)
+        # The coordinates are only sent out if they have changed since the
+        # last scatter, i.e. if the plan has just been (re)built
+        if plan.coords is None:
+            # Pack (reordered) coordinates so that they can be sent out via
+            # an Alltoallv
+            coords = self.coordinates.data._local[self._dist_subfunc_scatter_mask]
             # Send out the sparse point coordinates
-            sshape, scount, sdisp, _, rcount, rdisp = self._dist_subfunc_alltoall
-            gathered = np.empty(shape=sshape, dtype=self.coordinates.dtype)
-            mpitype = MPI._typedict[np.dtype(self.coordinates.dtype).char]
-            comm.Alltoallv([coords, rcount, rdisp, mpitype],
+            _, scount, sdisp, rshape, rcount, rdisp = plan.subfunc_alltoall
+            scattered = np.empty(shape=rshape, dtype=self.coordinates.dtype)
+            comm.Alltoallv([coords, scount, sdisp, mpitype],
+                           [scattered, rcount, rdisp, mpitype])
+            coords = scattered
+
+            # Translate global coordinates into local coordinates
+            plan.coords = coords - np.array(self.grid.origin_offset, dtype=self.dtype)
+
+        return np.copy(plan.coords)
+
+    def _dist_gather(self, data, coords):
+        distributor = self.grid.distributor
+
+        # If not using MPI, don't waste time
+        if distributor.nprocs == 1:
+            return
+
+        comm = distributor.comm
+
+        plan = self._dist_plan
+
+        # With resident sparse data, sparse data values that the Operator has
+        # left untouched (e.g., a source) don't need to be sent back
+        resident = configuration['sparse-resident'] and plan.resident is not None
+        if resident:
+            unchanged = np.array_equal(data, plan.resident[1])
+        if not (resident and comm.allreduce(unchanged, op=MPI.LAND)):
+            # Pack sparse data values so that they can be sent out via an Alltoallv
+            data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
+            # Send back the sparse point values
+            sshape, scount, sdisp, _, rcount, rdisp = plan.alltoall
+            gathered = np.empty(shape=sshape, dtype=self.dtype)
+            mpitype = MPI._typedict[np.dtype(self.dtype).char]
+            comm.Alltoallv([data, rcount, rdisp, mpitype],
                            [gathered, scount, sdisp, mpitype])
-            self._coordinates.data._local[:] = gathered[self._dist_subfunc_gather_mask]
+            # Unpack data values so that they follow the expected storage layout
+            gathered = np.ascontiguousarray(np.transpose(gathered,
+                                                         self._dist_reorder_mask))
+            self._data[:] = gathered[plan.gather_mask]
+            # The owned sparse data values have changed, so the next scatter
+            # can't reuse the resident ones
+            plan.resident = None
+
+        # Likewise, the coordinates are only sent back if the Operator has
+        # moved at least one sparse point
+        if coords is not None:
+            moved = plan.coords is None or not np.array_equal(coords, plan.coords)
+            if comm.allreduce(moved, op=MPI.LOR):
+                # Pack (reordered) coordinates so that they can be sent out via
+                # an Alltoallv
+                coords = coords + np.array(self.grid.origin_offset, dtype=self.dtype)
+                # Send out the sparse point coordinates
+                sshape, scount, sdisp, _, rcount, rdisp = plan.subfunc_alltoall
+                gathered = np.empty(shape=sshape, dtype=self.coordinates.dtype)
+                mpitype = MPI._typedict[np.dtype(self.coordinates.dtype).char]
+                comm.Alltoallv([coords, rcount, rdisp, mpitype],
+                               [gathered, scount, sdisp, mpitype])
+                gathered = gathered[self._dist_subfunc_gather_mask]
+                self._coordinates.data._local[:] = gathered
 
         # Note: this method "mirrors" `_dist_scatter`: a sparse point that is sent
         # in `_dist_scatter` is here received; a sparse point that is received in
@@ -1886,3 +2163,58 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
     # because we want to get rid of 'npoint'
     _pickle_kwargs = DiscreteFunction._pickle_kwargs + (
         ['dimensions', 'r', 'matrix', 'nt', 'grid'])
+
+
+class DerivedSubFunction(SubFunction):
+
+    """
+    A SubFunction whose runtime values are derived by the parent from its
+    coordinates upon each Operator application, rather than stored.
+    """
+
+    def _arg_values(self, **kwargs):
+        if self.name in kwargs:
+            raise RuntimeError("`%s` is a SubFunction, so it can't be assigned "
+                               "a value dynamically" % self.name)
+        else:
+            return self.parent._arg_derived(self, **kwargs)
+
+
+class DistPlan(object):
+
+    """
+    The routing plan of the sparse data values of an AbstractSparseFunction
+    across the MPI ranks, that is the masks and the ``MPI_Alltoallv`` metadata
+    to scatter and gather them. A DistPlan is valid as long as the sparse
+    points, identified by ``key``, don't move.
+
+    A DistPlan also keeps track of the sparse values received upon the last
+    scatter, so that these may be reused if the sender-side values haven't
+    changed in the meantime.
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+        self.scatter_mask = None
+        self.gather_mask = None
+        self.count = None
+        self.alltoall = None
+        self.subfunc_alltoall = None
+
+        # The rank-local, translated coordinates received upon the last scatter
+        self.coords = None
+        # The version of the sparse data values sent out upon the last scatter
+        # (see `AbstractSparseFunction._data_version`), along with the sparse
+        # data values received
+        self.resident = None
+
+
+def digest(array):
+    """
+    A digest of the content, shape and type of ``array``.
+    """
+    array = np.ascontiguousarray(array)
+    ret = sha1(('%s%s' % (array.shape, array.dtype)).encode())
+    ret.update(array.data)
+    return ret.hexdigest()
@@ -34,7 +34,7 @@ def run(shape=(50, 50, 50), spacing=(20.0, 20.0, 20.0), tn=1000.0,
     info("Applying Forward")
     # Whether or not we save the whole time history. We only need the full wavefield
     # with 'save=True' if we compute the gradient without checkpointing, if we use
-    # checkpointing, PyRevolve will take care of the time history
+    # checkpointing, the Checkpointer will take care of the time history
     save = full_run and not checkpointing
     # Define receiver geometry (spread across x, just below surface)
     rec, u, summary = solver.forward(save=save, autotune=autotune)
@@ -1,10 +1,8 @@
-from devito import Function, TimeFunction
+from devito import Checkpointer, Function, TimeFunction
 from devito.tools import memoized_meth
 from examples.seismic.acoustic.operators import (
     ForwardOperator, AdjointOperator, GradientOperator, BornOperator
 )
-from examples.checkpointing.checkpoint import DevitoCheckpoint, CheckpointOperator
-from pyrevolve import Revolver
 
 
 class AcousticWaveSolver(object):
@@ -188,17 +186,14 @@ class AcousticWaveSolver(object):
         if checkpointing:
             u = TimeFunction(name='u', grid=self.model.grid,
                              time_order=2, space_order=self.space_order)
-            cp = DevitoCheckpoint([u])
-            n_checkpoints = None
-            wrap_fw = CheckpointOperator(self.op_fwd(save=False), src=self.geometry.src,
-                                         u=u, vp=vp, dt=dt)
-            wrap_rev = CheckpointOperator(self.op_grad(save=False), u=u, v=v,
-                                          vp=vp, rec=rec, dt=dt, grad=grad)
+            cp = Checkpointer(self.op_fwd(save=False), self.op_grad(save=False), [u],
+                              rec.data.shape[0]-2,
+                              fwd_args=dict(src=self.geometry.src, u=u, vp=vp, dt=dt),
+                              rev_args=dict(u=u, v=v, vp=vp, rec=rec, dt=dt, grad=grad))
 
             # Run forward
-            wrp = Revolver(cp, wrap_fw, wrap_rev, n_checkpoints, rec.data.shape[0]-2)
-            wrp.apply_forward()
-            summary = wrp.apply_reverse()
+            cp.apply_forward()
+            summary = cp.apply_reverse()
         else:
             summary = self.op_grad().apply(rec=rec, grad=grad, v=v, u=u, vp=vp,
                                            dt=dt, **kwargs)
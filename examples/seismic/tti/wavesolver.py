@@ -1,11 +1,9 @@
 # coding: utf-8
-from devito import Function, TimeFunction, warning
+from devito import Checkpointer, Function, TimeFunction, warning
 from devito.tools import memoized_meth
 from examples.seismic.tti.operators import ForwardOperator, AdjointOperator
 from examples.seismic.tti.operators import JacobianOperator, JacobianAdjOperator
 from examples.seismic.tti.operators import particle_velocity_fields
-from examples.checkpointing.checkpoint import DevitoCheckpoint, CheckpointOperator
-from pyrevolve import Revolver
 
 
 class AnisotropicWaveSolver(object):
@@ -340,17 +338,16 @@ class AnisotropicWaveSolver(object):
                               time_order=2, space_order=self.space_order)
             v0 = TimeFunction(name='v0', grid=self.model.grid,
                               time_order=2, space_order=self.space_order)
-            cp = DevitoCheckpoint([u0, v0])
-            n_checkpoints = None
-            wrap_fw = CheckpointOperator(self.op_fwd(save=False), src=self.geometry.src,
-                                         u=u0, v=v0, dt=dt, **kwargs)
-            wrap_rev = CheckpointOperator(self.op_jacadj(save=False), u0=u0, v0=v0,
-                                          du=du, dv=dv, rec=rec, dm=dm, dt=dt, **kwargs)
+            cp = Checkpointer(self.op_fwd(save=False), self.op_jacadj(save=False),
+                              [u0, v0], rec.data.shape[0]-2,
+                              fwd_args=dict(src=self.geometry.src, u=u0, v=v0, dt=dt,
+                                            **kwargs),
+                              rev_args=dict(u0=u0, v0=v0, du=du, dv=dv, rec=rec, dm=dm,
+                                            dt=dt, **kwargs))
 
             # Run forward
-            wrp = Revolver(cp, wrap_fw, wrap_rev, n_checkpoints, rec.data.shape[0]-2)
-            wrp.apply_forward()
-            summary = wrp.apply_reverse()
+            cp.apply_forward()
+            summary = cp.apply_reverse()
         else:
             summary = self.op_jacadj().apply(rec=rec, dm=dm, u0=u0, v0=v0, du=du, dv=dv,
                                              dt=dt, **kwargs)
@@ -1,10 +1,14 @@
 import pytest
 import numpy as np
+from sympy import cos, sin
 
 from conftest import skipif
-from devito import Grid, TimeFunction, Eq, Operator, configuration, switchconfig
+from devito import (Grid, Function, TimeFunction, Eq, Operator, configuration,
+                    switchconfig)
 from devito.data import LEFT
-from devito.core.autotuning import options  # noqa
+from devito.core.autotuning import (AutotuningDB, cire_selections, options,  # noqa
+                                    rank_candidates)
+from devito.ir.iet import retrieve_iteration_tree
 
 
 @switchconfig(log_level='DEBUG')
@@ -315,3 +319,210 @@ def test_few_timesteps():
     op.apply(autotune=True)
     assert op._state['autotuning'][0]['runs'] == 2
     assert op._state['autotuning'][0]['tpr'] == 2  # Induced by `save`
+
+
+def test_time_tiling():
+    grid = Grid(shape=(32, 32, 32))
+
+    u = TimeFunction(name='u', grid=grid, space_order=2)
+
+    op = Operator(Eq(u.forward, u + 1), opt=('advanced', {'openmp': False,
+                                                          'blockinner': True,
+                                                          'time-tiling': True}))
+
+    # Each run spans at least as many timesteps as the largest time tile
+    op.apply(time_M=19, autotune='basic')
+    assert op._state['autotuning'][0]['runs'] == 8
+    assert op._state['autotuning'][0]['tpr'] == max(options['blocksize-time']) + 1
+    assert len(op._state['autotuning'][0]['tuned']) == 4
+    assert 'time0_blk0_size' in op._state['autotuning'][0]['tuned']
+
+    # The time tiles don't alter the computed values
+    assert np.all(u.data[0] == 20.)
+
+
+@switchconfig(autotuning_db='on')
+def test_autotuning_db(tmpdir):
+    grid = Grid(shape=(32, 32, 32))
+
+    f = TimeFunction(name='f', grid=grid)
+
+    op = Operator(Eq(f.forward, f + 1.), opt=('blocking', {'openmp': False}))
+
+    options['db-path'] = str(tmpdir.join('autotuning.json'))
+    try:
+        db = AutotuningDB()
+        assert len(db.entries) == 0
+
+        # First time: the AT sweep is performed, and its outcome recorded
+        op.apply(time_M=0, autotune='basic')
+        assert op._state['autotuning'][0]['runs'] == 4
+        assert len(db.entries) == 1
+        key = AutotuningDB.make_key(op, op.arguments(time_M=0))
+        assert db.lookup(key)['tuned'] == op._state['autotuning'][0]['tuned']
+
+        # Second time: the tuned values are retrieved from the database
+        op.apply(time_M=0, autotune='basic')
+        assert op._state['autotuning'][1]['runs'] == 0
+        assert op._state['autotuning'][1]['tuned'] ==\
+            op._state['autotuning'][0]['tuned']
+
+        # A more aggressive autotuning ignores the entry ...
+        op.apply(time_M=0, autotune='aggressive')
+        assert op._state['autotuning'][2]['runs'] > 4
+        assert db.lookup(key)['level'] == 'aggressive'
+
+        # ... which is instead reused by less aggressive autotuning
+        op.apply(time_M=0, autotune='basic')
+        assert op._state['autotuning'][3]['runs'] == 0
+
+        # A different grid shape implies a different entry
+        f1 = TimeFunction(name='f', grid=Grid(shape=(24, 24, 24)))
+        op.apply(time_M=0, f=f1, autotune='basic')
+        assert op._state['autotuning'][4]['runs'] > 0
+        assert len(db.entries) == 2
+
+        # Refinement always performs the AT sweep, starting from the tuned
+        # values in the database
+        configuration['autotuning-db'] = 'refine'
+        op.apply(time_M=0, autotune='basic')
+        assert op._state['autotuning'][5]['runs'] > 0
+
+        # Export
+        db.export(str(tmpdir.join('exported.json')))
+        assert AutotuningDB(str(tmpdir.join('exported.json'))).entries == db.entries
+
+        # Invalidation
+        db.invalidate(key)
+        assert db.lookup(key) is None
+        assert len(db.entries) == 1
+        db.invalidate()
+        assert len(db.entries) == 0
+    finally:
+        options['db-path'] = None
+
+
+@skipif('nompi')
+@pytest.mark.parallel(mode=2)
+@switchconfig(autotuning_db='on')
+def test_autotuning_db_w_mpi(tmpdir):
+    """
+    Test that, with MPI, the autotuning database is accessed by rank 0 on behalf
+    of all ranks, so that all ranks agree on the database entry even though
+    their local shapes, and thus their keys, differ.
+    """
+    # 64 and 63 points along `x` are split as 32|32 and 32|31, respectively
+    grid0 = Grid(shape=(64, 32))
+    grid1 = Grid(shape=(63, 32))
+    comm = grid0.distributor.comm
+
+    f0 = TimeFunction(name='f', grid=grid0)
+    f1 = TimeFunction(name='f', grid=grid1)
+
+    opt = ('blocking', {'openmp': False, 'blockinner': True})
+    op0 = Operator(Eq(f0.forward, f0 + 1.), opt=opt)
+    op1 = Operator(Eq(f1.forward, f1 + 1.), opt=opt)
+    assert op0._soname == op1._soname
+
+    options['db-path'] = comm.bcast(str(tmpdir.join('autotuning.json')), root=0)
+    try:
+        op0.apply(time_M=0, autotune='basic')
+        assert op0._state['autotuning'][0]['runs'] > 0
+        assert len(AutotuningDB().entries) == 1
+
+        # Only rank 0's key is in the database, yet no rank performs the sweep,
+        # and all ranks use the values tuned by rank 0
+        op1.apply(time_M=0, autotune='basic')
+        assert op1._state['autotuning'][0]['runs'] == 0
+        assert op1._state['autotuning'][0]['tuned'] ==\
+            comm.bcast(op0._state['autotuning'][0]['tuned'], root=0)
+    finally:
+        options['db-path'] = None
+
+
+@switchconfig(platform='cpu64-dummy')  # To fix the cache sizes
+def test_model_guided():
+    grid = Grid(shape=(64, 64, 64))
+
+    u = TimeFunction(name='u', grid=grid, space_order=4)
+
+    op = Operator(Eq(u.forward, u + 1), opt=('blocking', {'openmp': False}))
+
+    # Only the top-k candidates are run, and then half of them once again
+    op.apply(time_M=0, autotune='model')
+    topk = options['model-topk']
+    assert op._state['autotuning'][0]['runs'] == topk + topk // 2
+    assert op._state['autotuning'][0]['tpr'] == options['squeezer'] + 1
+    assert len(op._state['autotuning'][0]['tuned']) == 2
+
+    # The aggressive mode attempts many more candidates
+    op.apply(time_M=0, autotune='aggressive')
+    assert op._state['autotuning'][1]['runs'] > 2*topk
+
+
+@switchconfig(platform='cpu64-dummy')  # To fix the cache sizes
+def test_model_ranking():
+    grid = Grid(shape=(256, 256, 256))
+
+    u = TimeFunction(name='u', grid=grid, space_order=4)
+
+    op = Operator(Eq(u.forward, u + 1), opt=('blocking', {'openmp': False}))
+    args = op.arguments(time_M=0)
+
+    tree = retrieve_iteration_tree(op._func_table['bf0'].root)[0]
+    blockable = [i.dim for i in tree if i.dim.is_Incr and i.dim.parent is i.dim.root]
+    candidates = [((('x0_blk0_size', i), ('y0_blk0_size', i)), ((None, 1),))
+                  for i in [4, 32, 256]]
+
+    # Tiny blocks suffer from the redundant halo loads, while large blocks
+    # overflow the caches
+    ranked = rank_candidates(op, tree, blockable, candidates, args)
+    assert ranked[0] == candidates[1]
+    assert ranked[-1] == candidates[0]
+
+
+def test_cire_select(tmpdir):
+    grid = Grid(shape=(16, 16, 16))
+
+    f = Function(name='f', grid=grid)
+    u = TimeFunction(name='u', grid=grid, space_order=4)
+    u1 = TimeFunction(name='u', grid=grid, space_order=4)
+    f.data[:] = 0.3
+
+    eqn = Eq(u.forward, (u.dx*sin(f)).dx + (u.dy*cos(f)).dy + 1.)
+
+    options['db-path'] = str(tmpdir.join('autotuning.json'))
+    cire_selections.clear()
+    try:
+        # First time: all variants are run
+        op0 = Operator(eqn, opt=('advanced', {'cire-select': 'empirical'}))
+        assert op0._state['cire-select']['runs'] > 1
+        assert len(cire_selections) == 1
+
+        # The variants run on shadow copies of the output Functions
+        assert np.all(u.data == 0.)
+
+        # Second time: the selected variant is reused
+        op1 = Operator(eqn, opt=('advanced', {'cire-select': 'empirical'}))
+        assert op1._state['cire-select']['runs'] == 0
+        assert op1._state['cire-select']['tuned'] == op0._state['cire-select']['tuned']
+        assert op1._soname == op0._soname
+
+        # Also across sessions, through the autotuning database
+        cire_selections.clear()
+        configuration['autotuning-db'] = 'on'
+        op2 = Operator(eqn, opt=('advanced', {'cire-select': 'empirical'}))
+        assert op2._state['cire-select']['runs'] > 1
+        assert len(AutotuningDB().entries) == 1
+        cire_selections.clear()
+        op3 = Operator(eqn, opt=('advanced', {'cire-select': 'empirical'}))
+        assert op3._state['cire-select']['runs'] == 0
+
+        # Check numerical output
+        op0.apply(time_M=2)
+        Operator(eqn).apply(time_M=2, u=u1)
+        assert np.allclose(u.data, u1.data, rtol=1e-5)
+    finally:
+        options['db-path'] = None
+        configuration['autotuning-db'] = 'off'
+        cire_selections.clear()
@@ -4,9 +4,10 @@ from scipy.ndimage import gaussian_filter
 from scipy import misc
 
 from conftest import skipif
-from devito import Grid, Function, TimeFunction, switchconfig
+from devito import Grid, Function, TimeFunction, clear_cache, switchconfig
 from devito.builtins import (assign, norm, gaussian_smooth, initialize_function,
-                             inner, mmin, mmax)
+                             inner, mmin, mmax, stats, sumall)
+from devito.builtins.utils import reductions
 from devito.data import LEFT, RIGHT
 from devito.tools import as_tuple
 from devito.types import SubDomain, SparseTimeFunction
@@ -369,3 +370,122 @@ class TestBuiltinsResult(object):
         term1 = np.max(rec0.data)
         term2 = mmax(rec0)
         assert np.isclose(term1/term2 - 1, 0.0, rtol=0.0, atol=1e-5)
+
+    def test_reductions_reuse(self):
+        """
+        Test that reductions over Functions of the same type and layout reuse
+        the same Operator
+        """
+        grid = Grid((11, 11))
+
+        recs = [SparseTimeFunction(name='rec%d' % i, grid=grid, nt=10, npoint=5)
+                for i in range(3)]
+        for rec in recs:
+            rec.data[:] = np.random.rand(*rec.shape).astype(grid.dtype)
+
+        reductions.clear()
+        for rec in recs:
+            assert np.isclose(norm(rec), np.linalg.norm(rec.data), rtol=1e-5)
+            assert np.isclose(inner(rec, recs[0]),
+                              np.sum(rec.data*recs[0].data), rtol=1e-5)
+        assert len(reductions._mapper) == 2
+
+        # The cached Operators mustn't keep their Functions alive forever
+        clear_cache()
+        assert len(reductions._mapper) == 0
+
+    def test_reductions_serial(self):
+        """
+        Test the NumPy-based reductions, used in absence of MPI
+        """
+        grid = Grid((11, 11))
+
+        u = TimeFunction(name='u', grid=grid, space_order=4)
+        v = TimeFunction(name='v', grid=grid, space_order=4)
+        u.data_with_halo[:] = 2.
+        u.data[:] = np.random.rand(*u.shape).astype(grid.dtype)
+        v.data[:] = 1.
+
+        reductions.clear()
+        assert np.isclose(norm(u), np.linalg.norm(u.data), rtol=1e-5)
+        assert np.isclose(norm(u, order=1), np.sum(u.data), rtol=1e-5)
+        assert np.isclose(inner(u, v), np.sum(u.data), rtol=1e-5)
+        assert np.isclose(sumall(u), np.sum(u.data), rtol=1e-5)
+        assert mmax(u) == np.max(u.data)
+        assert mmin(u) == np.min(u.data)
+        assert len(reductions._mapper) == 0
+
+    @pytest.mark.parallel(mode=4)
+    def test_reductions_mpi(self):
+        """
+        Test that MPI-aware reductions over distinct Functions on the same Grid
+        reuse the same Operator
+        """
+        grid = Grid((12, 12))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        v = TimeFunction(name='v', grid=grid, space_order=2)
+        u.data[:] = 2.
+        v.data[:] = 3.
+
+        reductions.clear()
+        assert np.isclose(norm(u), np.sqrt(2*144*4.))
+        assert np.isclose(norm(v), np.sqrt(2*144*9.))
+        assert np.isclose(inner(u, v), 2*144*6.)
+        assert np.isclose(sumall(v), 2*144*3.)
+        assert mmax(v) == 3.
+        assert len(reductions._mapper) == 3
+
+    def test_stats(self):
+        """
+        Test that the fused `stats` reduction matches NumPy
+        """
+        grid = Grid((11, 11))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        v = TimeFunction(name='v', grid=grid, space_order=2)
+        u.data_with_halo[:] = 10.
+        u.data[:] = np.random.randn(*u.shape).astype(grid.dtype)
+        v.data[:] = np.random.randn(*v.shape).astype(grid.dtype)
+
+        data = u.data
+        ret = stats(u, v)
+        assert np.isclose(ret['l1'], np.sum(np.abs(data)), rtol=1e-5)
+        assert np.isclose(ret['l2'], np.linalg.norm(data), rtol=1e-5)
+        assert np.isclose(ret['sum'], np.sum(data), rtol=1e-4)
+        assert ret['min'] == np.min(data)
+        assert ret['max'] == np.max(data)
+        assert ret['linf'] == np.max(np.abs(data))
+        assert len(ret['inner']) == 1
+        assert np.isclose(ret['inner'][0], np.sum(data*v.data), rtol=1e-4)
+
+    def test_stats_sparse(self):
+        grid = Grid((11, 11))
+
+        rec = SparseTimeFunction(name='rec', grid=grid, nt=10, npoint=5)
+        rec.data[:] = np.random.randn(*rec.shape).astype(grid.dtype)
+
+        ret = stats(rec)
+        assert np.isclose(ret['l2'], np.linalg.norm(rec.data), rtol=1e-5)
+        assert ret['min'] == np.min(rec.data)
+        assert ret['max'] == np.max(rec.data)
+        assert 'inner' not in ret
+
+    @pytest.mark.parallel(mode=4)
+    def test_stats_mpi(self):
+        grid = Grid((12, 12))
+
+        u = Function(name='u', grid=grid, space_order=2)
+        v = Function(name='v', grid=grid, space_order=2)
+        u.data[:] = np.arange(144, dtype=grid.dtype).reshape(12, 12) - 100.
+        v.data[:] = 2.
+
+        ret = stats(u, v)
+        data = np.arange(144) - 100.
+        assert np.isclose(ret['l1'], np.sum(np.abs(data)))
+        assert np.isclose(ret['l2'], np.linalg.norm(data))
+        assert np.isclose(ret['sum'], np.sum(data))
+        assert ret['min'] == -100.
+        assert ret['max'] == 43.
+        assert ret['linf'] == 100.
+        assert np.isclose(ret['inner'][0], 2*np.sum(data))
@@ -5,8 +5,9 @@ import pytest
 
 from devito import (Grid, Function, TimeFunction, SparseFunction, SparseTimeFunction,
                     ConditionalDimension, SubDimension, Constant, Operator, Eq, Dimension,
-                    DefaultDimension, _SymbolCache, clear_cache, solve, VectorFunction,
-                    TensorFunction, TensorTimeFunction, VectorTimeFunction)
+                    DefaultDimension, _SymbolCache, CacheManager, clear_cache, solve,
+                    VectorFunction, TensorFunction, TensorTimeFunction,
+                    VectorTimeFunction, configuration)
 from devito.types.basic import Scalar, Symbol
 
 
@@ -519,6 +520,44 @@ class TestCaching(object):
         clear_cache()
         assert len(_SymbolCache) == cache_size - 1
 
+    def test_cache_budget(self, operate_on_empty_cache):
+        """
+        Test that the data of the unreferenced objects is evicted as soon as the
+        cache budget would be exceeded, while the referenced objects are retained.
+        """
+        grid = Grid(shape=(100, 100), dtype=np.float64)
+        nbytes = 100*100*8
+
+        # The objects still referenced elsewhere (e.g., by earlier tests) are
+        # unaffected by this test, so only the difference is checked
+        nbytes_live0 = CacheManager.nbytes_live()
+        functions0 = CacheManager.stats()['functions']
+
+        f = Function(name='f', grid=grid, space_order=0)
+        f.data[:] = 1.
+
+        configuration['cache-budget'] = nbytes_live0 + 4*nbytes
+        try:
+            for i in range(10):
+                g = TimeFunction(name='g%d' % i, grid=grid, space_order=0)
+                g.data[:] = 1.
+                # A reference cycle, so `g` can only be freed by garbage collection
+                g._cycle = g
+                del g
+
+                assert CacheManager.nbytes_live() <= nbytes_live0 + 4*nbytes
+        finally:
+            configuration['cache-budget'] = 0
+
+        assert np.all(f.data == 1.)
+
+        stats = CacheManager.stats()
+        functions = {k: v - functions0.get(k, 0) for k, v in stats['functions'].items()}
+        assert functions['Function'] == nbytes
+        assert functions['TimeFunction'] >= 2*nbytes
+        assert sum(stats['allocators'].values()) >= CacheManager.nbytes_live()
+        assert stats['budget'] is None
+
     def test_sparse_function(self, operate_on_empty_cache):
         """Test caching of SparseFunctions and children objects."""
         grid = Grid(shape=(3, 3))
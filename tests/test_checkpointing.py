@@ -4,7 +4,9 @@ import pytest
 from pyrevolve import Revolver
 import numpy as np
 
-from devito import Grid, TimeFunction, Operator, Function, Eq, switchconfig, Constant
+from devito import (Grid, TimeFunction, Operator, Function, Eq, switchconfig, Constant,
+                    Checkpointer)
+from devito.operator.checkpointing import binomial_cost, revolve
 from examples.checkpointing.checkpoint import DevitoCheckpoint, CheckpointOperator
 from examples.seismic.acoustic.acoustic_example import acoustic_setup
 
@@ -242,3 +244,102 @@ def test_index_alignment():
     wrp.apply_reverse()
     assert(np.allclose(v.data[0, :, :], 0))
     assert(np.allclose(prod.data, final_value))
+
+
+@pytest.mark.parametrize('nt', [1, 2, 7, 30, 101])
+@pytest.mark.parametrize('ncheckpoints', [1, 2, 3, 10])
+def test_revolve_schedule(nt, ncheckpoints):
+    """
+    Simulate the Revolve schedule, checking that each timestep is reversed
+    exactly once, in reverse order, from the correct forward state, and that
+    the number of forward timesteps (other than those of the plain forward
+    sweep) is optimal.
+    """
+    fwd, rev = revolve(nt, ncheckpoints)
+
+    state = 0
+    slots = {}
+    reversed_steps = []
+    nsteps = 0
+    for action in fwd + rev:
+        if action.type in ('advance', 'lastfw'):
+            assert state == action.capo
+            state = action.end
+            if action.type == 'advance':
+                nsteps += action.end - action.capo
+        elif action.type == 'takeshot':
+            assert state == action.capo
+            assert action.slot < ncheckpoints
+            slots[action.slot] = state
+        elif action.type == 'restore':
+            assert slots[action.slot] == action.capo
+            state = action.capo
+        elif action.type == 'revstart':
+            assert state == nt
+            reversed_steps.append(action.capo)
+        elif action.type == 'reverse':
+            assert state == action.capo
+            state += 1
+            nsteps += 1
+            reversed_steps.append(action.capo)
+    assert fwd[-1].type == 'lastfw'
+    assert reversed_steps == list(range(nt - 1, -1, -1))
+    assert nsteps == binomial_cost(nt - 1, min(ncheckpoints, nt) - 1)
+
+
+@pytest.mark.parametrize('ncheckpoints,memory,disk', [
+    (2, None, None),
+    (None, None, None),
+    (None, 3, None),
+    (None, 2, 2),
+    (None, None, 3),
+])
+def test_checkpointer(ncheckpoints, memory, disk, tmpdir):
+    """
+    Test that the built-in Checkpointer computes the same result as a run
+    storing the entire forward wavefield.
+    """
+    grid = Grid(shape=(6, 6))
+    nt = 21
+
+    const = Constant(name="constant")
+    u = TimeFunction(name='u', grid=grid, save=nt+1)
+    v = TimeFunction(name='v', grid=grid)
+    prod = Function(name="prod", grid=grid)
+
+    Operator(Eq(u.forward, u + 1.*const))(time_M=nt-1, constant=1)
+    v.data[nt % 2] = u.data[nt]
+    adj_eqns = [Eq(v, v.forward - 1.*const), Eq(prod, prod + u*v)]
+    Operator(adj_eqns)(time_M=nt-1, constant=1)
+    assert np.allclose(prod.data, sum(n**2 for n in range(nt)))
+
+    u1 = TimeFunction(name='u', grid=grid)
+    v1 = TimeFunction(name='v', grid=grid)
+    prod1 = Function(name="prod", grid=grid)
+    fwd_op = Operator(Eq(u1.forward, u1 + 1.*const))
+    rev_op = Operator([Eq(v1, v1.forward - 1.*const), Eq(prod1, prod1 + u1*v1)])
+
+    nbytes = u1._data_buffer.nbytes
+    memory = memory and memory*nbytes
+    disk = disk and disk*nbytes
+    cp = Checkpointer(fwd_op, rev_op, [u1], nt, fwd_args={'constant': 1},
+                      rev_args={'constant': 1}, ncheckpoints=ncheckpoints,
+                      memory=memory, disk=disk, disk_dir=str(tmpdir))
+
+    cp.apply_forward()
+    assert np.allclose(u1.data[nt % 2], nt)
+
+    v1.data[nt % 2] = u1.data[nt % 2]
+    cp.apply_reverse()
+    assert np.allclose(v1.data[0], 0)
+    assert np.allclose(prod1.data, prod.data)
+
+
+def test_checkpointer_budget():
+    grid = Grid(shape=(6, 6))
+
+    u = TimeFunction(name='u', grid=grid)
+    fwd_op = Operator(Eq(u.forward, u + 1))
+
+    with pytest.raises(ValueError):
+        Checkpointer(fwd_op, fwd_op, [u], 10, memory=u._data_buffer.nbytes - 1)
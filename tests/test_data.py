@@ -2,11 +2,12 @@ import pytest
 import numpy as np
 
 from devito import (Grid, Function, TimeFunction, SparseTimeFunction, Dimension, # noqa
-                    Eq, Operator, ALLOC_GUARD, ALLOC_FLAT, configuration, switchconfig)
+                    Eq, Operator, ALLOC_GUARD, ALLOC_FLAT, configuration, switchconfig,
+                    clear_cache)
 from devito.data import LEFT, RIGHT, Decomposition, loc_data_idx, convert_index
 from devito.tools import as_tuple
 from devito.types import Scalar
-from devito.data.allocators import ExternalAllocator
+from devito.data.allocators import ExternalAllocator, HugePageAllocator
 
 
 class TestDataBasic(object):
@@ -1129,6 +1130,41 @@ class TestDataDistributed(object):
             assert np.all(view2[:] == myrank)
             assert view2.size == 0
 
+    @pytest.mark.parallel(mode=4)
+    def test_redistribution(self):
+        """
+        Test insertion of distributed Data into distributed Data with a
+        different decomposition.
+        """
+        grid0 = Grid(shape=(8, 8), topology=(2, 2))
+        grid1 = Grid(shape=(8, 8), topology=(4, 1))
+        grid2 = Grid(shape=(20, 12), topology=(1, 4))
+
+        f = Function(name='f', grid=grid0, space_order=0, dtype=np.int32)
+        g = Function(name='g', grid=grid1, space_order=0, dtype=np.int32)
+        h = Function(name='h', grid=grid2, space_order=0, dtype=np.int32)
+        a = np.arange(64, dtype=np.int32).reshape(8, 8)
+        f.data[:] = a
+
+        g.data[:] = f.data
+        x, y = grid1.distributor.glb_slices.values()
+        assert np.all(g.data == a[x, y])
+
+        b = np.zeros((20, 12), dtype=np.int32)
+        x, y = grid2.distributor.glb_slices.values()
+
+        b[2:18:2, 1:9] = a
+        h.data[2:18:2, 1:9] = f.data
+        assert np.all(h.data == b[x, y])
+
+        b[3, 2:10] = a[7]
+        h.data[3, 2:10] = f.data[7]
+        assert np.all(h.data == b[x, y])
+
+        b[-1, 4:] = a[-1]
+        h.data[-1, 4:] = f.data[-1]
+        assert np.all(h.data == b[x, y])
+
     @pytest.mark.parallel(mode=4)
     def test_from_replicated_to_distributed(self):
         shape = (4, 4)
@@ -1345,6 +1381,54 @@ class TestDataGather(object):
             assert ans.shape == (0, )*len(grid.shape)
 
 
+class TestDataIO(object):
+
+    def test_to_from_file(self, tmpdir):
+        grid = Grid(shape=(4, 5))
+        path = str(tmpdir.join('f.npy'))
+
+        f = TimeFunction(name='f', grid=grid, space_order=2)
+        a = np.arange(40, dtype=np.float32).reshape(f.shape_global)
+        f.data[:] = a
+        f.to_file(path)
+        assert np.all(np.load(path) == a)
+
+        g = TimeFunction.from_file(path, name='g', grid=grid, space_order=2)
+        assert np.all(g.data == a)
+
+        with pytest.raises(ValueError):
+            Function.from_file(path, name='h', grid=grid)
+
+    @pytest.mark.parallel(mode=4)
+    def test_to_from_file_mpi(self, tmpdir):
+        grid = Grid(shape=(8, 6, 5))
+        x, y, z = grid.dimensions
+        comm = grid.distributor.comm
+        path = comm.bcast(str(tmpdir.join('f.npy')), root=0)
+
+        f = TimeFunction(name='f', grid=grid, space_order=2)
+        a = np.arange(f.size_global, dtype=np.float32).reshape(f.shape_global)
+        f.data[:] = a
+        f.to_file(path)
+        comm.barrier()
+        assert np.all(np.load(path) == a)
+
+        # Reading back with a different decomposition, and filling the halo
+        grid1 = Grid(shape=(8, 6, 5), topology=(1, 1, 4))
+        g = TimeFunction.from_file(path, halo=True, name='g', grid=grid1,
+                                   space_order=2)
+        assert not g._is_halo_dirty
+        glb_slices = tuple(grid1.distributor.glb_slices.values())
+        assert np.all(g.data == a[(slice(None),) + glb_slices])
+
+        # Data replicated along some Dimensions of the Grid
+        h = Function(name='h', grid=grid, dimensions=(x,), shape=(8,))
+        h.data[:] = np.arange(8)
+        h.to_file(path)
+        comm.barrier()
+        assert np.all(np.load(path) == np.arange(8))
+
+
 def test_scalar_arg_substitution():
     """
     Tests the relaxed (compared to other devito sympy subclasses)
@@ -1416,6 +1500,68 @@ def test_external_allocator():
     assert(np.array_equal(f.data, numpy_array))
 
 
+def test_hugepage_allocator():
+    """
+    Test that the HugePageAllocator recycles the memory freed by a Function
+    to allocate an equally-shaped Function.
+    """
+    allocator = HugePageAllocator(pool_size=2**30)
+    if not allocator.available():
+        pytest.skip("mmap not available")
+
+    grid = Grid(shape=(64, 64, 64))
+
+    u = TimeFunction(name='u', grid=grid, space_order=4, allocator=allocator)
+    u.data[:] = 1.
+    address = u._data_allocated.ctypes.data
+    del u
+    clear_cache()
+
+    assert allocator.pool_nbytes > 0
+
+    # The recycled block is correctly (re-)initialized
+    v = TimeFunction(name='v', grid=grid, space_order=4, allocator=allocator)
+    assert v._data_allocated.ctypes.data == address
+    assert np.all(v.data_with_halo == 0.)
+    assert allocator.pool_nbytes == 0
+
+    op = Operator(Eq(v.forward, v + 1))
+    op.apply(time_M=1)
+    assert np.all(v.data[0] == 2.)
+
+    del op
+    del v
+    clear_cache()
+    allocator.release()
+    assert allocator.pool_nbytes == 0
+
+
+@pytest.mark.parametrize('save', [None, 4])
+def test_numa_first_touch(save):
+    """
+    Test that with `first_touch='numa'` the whole allocated data, including
+    halo and padding, is zero-initialized by the first-touch Operator.
+    """
+    allocator = HugePageAllocator()
+    if not allocator.available():
+        pytest.skip("mmap not available")
+
+    grid = Grid(shape=(16, 16, 16))
+
+    # A recycled, hence dirty, block
+    u = TimeFunction(name='u', grid=grid, space_order=4, save=save,
+                     allocator=allocator)
+    u._data_allocated[:] = 1.
+    del u
+    clear_cache()
+
+    v = TimeFunction(name='v', grid=grid, space_order=4, save=save,
+                     allocator=allocator, first_touch='numa')
+    assert np.all(v._data_allocated == 0.)
+
+    allocator.release()
+
+
 if __name__ == "__main__":
     configuration['mpi'] = True
     TestDataDistributed().test_misc_data()
@@ -5,7 +5,8 @@ import numpy as np
 import pytest
 
 from devito import (Grid, Function, TimeFunction, SparseTimeFunction, SpaceDimension,
-                    Dimension, SubDimension, Eq, Inc, Operator, info)
+                    Dimension, SubDimension, Eq, Inc, ReduceMax, ReduceMin, Operator,
+                    info)
 from devito.exceptions import InvalidArgument
 from devito.ir.iet import Call, Iteration, Conditional, FindNodes, retrieve_iteration_tree
 from devito.passes.iet.languages.openmp import OmpRegion
@@ -358,6 +359,112 @@ def test_cache_blocking_imperfect_nest_v2(blockinner):
     assert np.allclose(u.data, u2.data, rtol=1e-07)
 
 
+class TestTimeTiling(object):
+
+    @staticmethod
+    def _run_diffusion(shape, so, tiling, save=None, **kwargs):
+        grid = Grid(shape=shape)
+
+        u = TimeFunction(name='u', grid=grid, space_order=so, save=save)
+        u.data[0, :] = np.random.RandomState(0).rand(*shape)
+        u.data[1, :] = u.data[0, :]
+
+        op = Operator(Eq(u.forward, u + 1e-4*u.laplace),
+                      opt=('advanced', {'blockinner': True, 'time-tiling': tiling}))
+        op.apply(time_M=(save or 22) - 2, **kwargs)
+
+        return u.data, op
+
+    def test_structure(self):
+        grid = Grid(shape=(16, 16, 16))
+        x, y, z = grid.dimensions
+        time = grid.time_dim
+
+        u = TimeFunction(name='u', grid=grid, space_order=4)
+
+        op = Operator(Eq(u.forward, u + u.laplace),
+                      opt=('advanced', {'openmp': False, 'blockinner': True,
+                                        'time-tiling': True}))
+
+        trees = retrieve_iteration_tree(op)
+        assert len(trees) == 1
+        tree = trees[0]
+        assert len(tree) == 8
+        assert tree[0].dim.is_Incr and tree[0].dim.root is time
+        assert all(i.dim.is_Incr for i in tree[1:4])
+        assert [i.dim.root for i in tree[1:4]] == [x, y, z]
+        assert tree[4].dim is time
+        assert [i.dim.parent for i in tree[5:]] == [i.dim for i in tree[1:4]]
+
+        # No ElementalFunctions for the remainder regions are expected, as the
+        # skewed blocks get clipped to the iteration space
+        assert len(op._func_table) == 0
+        assert 'time0_blk0_size' in op._known_arguments
+
+    @pytest.mark.parametrize('shape,so,save,blockshape', [
+        ((30, 30), 2, None, {}),
+        ((30, 30), 2, 15, {}),
+        ((30, 31), 8, None, {'time0_blk0_size': 3, 'x0_blk0_size': 5,
+                             'y0_blk0_size': 4}),
+        ((17, 18, 19), 4, None, {'time0_blk0_size': 3, 'x0_blk0_size': 5,
+                                 'y0_blk0_size': 4, 'z0_blk0_size': 6}),
+        ((17, 18, 19), 4, None, {'time0_blk0_size': 20, 'x0_blk0_size': 17,
+                                 'y0_blk0_size': 18, 'z0_blk0_size': 19}),
+    ])
+    def test_numerics(self, shape, so, save, blockshape):
+        wo_tiling, _ = self._run_diffusion(shape, so, False, save)
+        w_tiling, op = self._run_diffusion(shape, so, True, save, **blockshape)
+
+        assert 'time0_blk0_size' in op._known_arguments
+        assert np.allclose(wo_tiling, w_tiling, rtol=1e-6)
+
+    @pytest.mark.parametrize('openmp', [False, True])
+    def test_w_sparse(self, openmp):
+        grid = Grid(shape=(20, 21, 22), extent=(190., 200., 210.))
+
+        src_coords = np.array([(95., 100., 5.)])
+        rec_coords = np.array([(i, 100., 20.) for i in np.linspace(0., 190., 7)])
+
+        res = []
+        for tiling in [False, True]:
+            u = TimeFunction(name='u', grid=grid, time_order=2, space_order=4)
+            m = Function(name='m', grid=grid)
+            m.data[:] = 1/1.5**2
+            src = SparseTimeFunction(name='src', grid=grid, npoint=1, nt=30,
+                                     coordinates=src_coords)
+            src.data[:] = np.sin(np.linspace(0, 2*np.pi, 30)).reshape((30, 1))
+            rec = SparseTimeFunction(name='rec', grid=grid, npoint=7, nt=30,
+                                     coordinates=rec_coords)
+
+            dt = grid.time_dim.spacing
+            eqns = [Eq(u.forward, 2*u - u.backward + dt**2/m*u.laplace)]
+            eqns += src.inject(field=u.forward, expr=src*dt**2/m)
+            eqns += rec.interpolate(expr=u)
+
+            op = Operator(eqns, opt=('advanced', {'openmp': openmp,
+                                                  'time-tiling': tiling}))
+            kwargs = {'time0_blk0_size': 4, 'x0_blk0_size': 8,
+                      'y0_blk0_size': 8} if tiling else {}
+            op.apply(time_M=28, dt=2., **kwargs)
+
+            res.append((u.data.copy(), rec.data.copy()))
+
+        assert 'time0_blk0_size' in op._known_arguments
+        assert np.allclose(res[0][0], res[1][0], rtol=1e-5, atol=1e-6)
+        assert np.allclose(res[0][1], res[1][1], rtol=1e-5, atol=1e-6)
+
+    def test_unsupported(self):
+        grid = Grid(shape=(16, 16, 16))
+
+        u = TimeFunction(name='u', grid=grid, space_order=4)
+
+        # Backward propagation isn't time-tiled
+        op = Operator(Eq(u.backward, u + u.laplace),
+                      opt=('advanced', {'blockinner': True, 'time-tiling': True}))
+        assert 'time0_blk0_size' not in op._known_arguments
+        assert len(op._func_table) == 1
+
+
 class TestNodeParallelism(object):
 
     @pytest.mark.parametrize('exprs,expected', [
@@ -579,6 +686,33 @@ class TestNodeParallelism(object):
 
         assert np.allclose(f.data, 18)
 
+    def test_minmax_reduction(self):
+        """
+        Test generation of OpenMP min/max reduction clauses.
+        """
+        grid = Grid(shape=(8, 8))
+
+        f = Function(name='f', grid=grid)
+        f.data[:] = np.arange(64).reshape(8, 8) - 20.
+        s0 = Scalar(name='s0', dtype=grid.dtype)
+        s1 = Scalar(name='s1', dtype=grid.dtype)
+        s2 = Scalar(name='s2', dtype=grid.dtype)
+        n = Function(name='n', shape=(3,), dimensions=(Dimension(name='i'),))
+
+        eqns = [Eq(s0, -1000.), Eq(s1, 1000.), Eq(s2, 0.),
+                ReduceMax(s0, f), ReduceMin(s1, f), Inc(s2, f),
+                Eq(n[0], s0), Eq(n[1], s1), Eq(n[2], s2)]
+        op = Operator(eqns, opt=('openmp', {'par-collapse-ncores': 1}))
+
+        iterations = FindNodes(Iteration).visit(op)
+        pragma = iterations[0].pragmas[0].value
+        assert 'reduction(max:s0)' in pragma
+        assert 'reduction(min:s1)' in pragma
+        assert 'reduction(+:s2)' in pragma
+
+        op.apply()
+        assert np.all(n.data == [43., -20., np.sum(f.data)])
+
     def test_incs_no_atomic(self):
         """
         Test that `Inc`'s don't get a `#pragma omp atomic` if performing
@@ -608,6 +742,48 @@ class TestNodeParallelism(object):
         assert 'collapse(1)' in str(op1)
         assert 'atomic' not in str(op1)
 
+    def test_inject_no_atomic(self):
+        """
+        Test that, with `par-inject=color`, the sparse points are injected in
+        parallel without a `#pragma omp atomic`, and that the result matches
+        that obtained with atomics.
+        """
+        grid = Grid(shape=(11, 11), extent=(10., 10.))
+        npoint = 30
+
+        rng = np.random.RandomState(0)
+        coords = rng.uniform(0, 10, size=(npoint, 2))
+        # Some sparse points share the same cell
+        coords[5:10] = coords[0]
+        data = rng.uniform(size=(5, npoint))
+
+        u0 = TimeFunction(name='u', grid=grid)
+        u1 = TimeFunction(name='u', grid=grid)
+        sf = SparseTimeFunction(name='s', grid=grid, npoint=npoint, nt=5)
+        sf.coordinates.data[:] = coords
+        sf.data[:] = data
+
+        op0 = Operator(sf.inject(u0.forward, expr=sf),
+                       opt=('advanced', {'openmp': True}))
+        op1 = Operator(sf.inject(u1.forward, expr=sf),
+                       opt=('advanced', {'openmp': True, 'par-inject': 'color'}))
+        assert 'atomic' in str(op0)
+        assert 'atomic' not in str(op1)
+
+        # The colored injection indexes the grid through the same precomputed
+        # reference grid points used to color the sparse points
+        assert 'floor' not in str(op1)
+        assert sf._geometry[0].name in str(op1)
+
+        # A single parallel region is opened around the Iteration over the colors
+        regions = FindNodes(OmpRegion).visit(op1)
+        assert len(regions) == 1
+        assert regions[0].root.dim is sf._coloring[0].dimensions[0]
+
+        op0(time_M=3)
+        op1(time_M=3)
+        assert np.allclose(u0.data, u1.data, rtol=1e-5)
+
 
 class TestNestedParallelism(object):
 
@@ -1316,6 +1316,44 @@ class TestAliases(object):
         op1(time_M=1, u=u1, v=v1)
         assert np.allclose(u.data, u1.data, rtol=10e-7)
 
+    @pytest.mark.parametrize('variant,expected', [
+        (None, 2), ('inv-compound', 2), ('inv-basic', 4)
+    ])
+    def test_cire_variant(self, variant, expected):
+        """
+        Check that a specific CIRE variant may be requested, overriding the
+        heuristics.
+        """
+        grid = Grid(shape=(3, 3))
+        x, y = grid.dimensions
+        t = grid.stepping_dim
+
+        f = Function(name='f', grid=grid)
+        g = Function(name='g', grid=grid)
+        u = TimeFunction(name='u', grid=grid)
+        u1 = TimeFunction(name='u', grid=grid)
+        v = TimeFunction(name='v', grid=grid)
+
+        f.data[:] = 1.4
+        g.data[:] = 2.1
+        u.data[:] = 1.3
+        u1.data[:] = 1.3
+        v.data[:] = 1.7
+
+        eqn = Eq(u.forward, (cos(f)*sin(g)*u +
+                             cos(g)*sin(f)*v +
+                             cos(f[x+1, y+1])*sin(g[x+1, y+1])*u[t, x+1, y+1]))
+
+        op0 = Operator(eqn, opt='noop')
+        op1 = Operator(eqn, opt=('advanced', {'cire-variant': variant}))
+
+        arrays = [i for i in FindSymbols().visit(op1) if i.is_Array]
+        assert len(arrays) == expected
+
+        op0(time_M=1)
+        op1(time_M=1, u=u1)
+        assert np.allclose(u.data, u1.data, rtol=10e-7)
+
     def test_space_invariant(self):
         """
         Unlike most cases, here a sub-expression is invariant w.r.t. space, but
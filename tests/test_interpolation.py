@@ -6,7 +6,7 @@ import pytest
 from devito import (Grid, Operator, Dimension, SparseFunction, SparseTimeFunction,
                     Function, TimeFunction,
                     PrecomputedSparseFunction, PrecomputedSparseTimeFunction,
-                    MatrixSparseTimeFunction)
+                    MatrixSparseTimeFunction, Eq, configuration)
 from devito.symbolics import FLOAT
 from examples.seismic import (demo_model, TimeAxis, RickerSource, Receiver,
                               AcquisitionGeometry)
@@ -427,6 +427,47 @@ def test_inject_from_field(shape, coords, result, npoints=19):
     assert np.allclose(a.data[indices], result, rtol=1.e-5)
 
 
+@pytest.mark.parametrize('shape, coords', [
+    ((11, 11), [(.05, .9), (.01, .8)]),
+    ((11, 11, 11), [(.05, .9), (.01, .8), (0.07, 0.84)])
+])
+def test_precomputed_geometry(shape, coords, npoints=19):
+    """Test that precomputing the interpolation geometry once per Operator
+    application yields the same result as computing it at each time step."""
+    grid = Grid(shape=shape)
+    u = TimeFunction(name='u', grid=grid, space_order=2)
+    src = time_points(grid, coords, npoints, name='src')
+    rec = time_points(grid, coords[::-1], npoints, name='rec')
+    src.data[:] = np.random.rand(*src.shape)
+
+    eqns = ([Eq(u.forward, u + .002*u.laplace)] + src.inject(u.forward, expr=src) +
+            rec.interpolate(u))
+
+    ops = []
+    results = []
+    for precompute in [False, True]:
+        try:
+            configuration['sparse-precompute'] = precompute
+            op = Operator(eqns)
+        finally:
+            configuration['sparse-precompute'] = 0
+
+        u.data[:] = 0.
+        op(time_M=8)
+        ops.append(op)
+        results.append((np.array(u.data), np.array(rec.data)))
+
+    # The geometry isn't recomputed inside the time loop anymore
+    assert 'floor' not in str(op)
+    assert all(np.allclose(i, j, rtol=1e-5) for i, j in zip(*results))
+
+    # The geometry is only computed for the Operators using it
+    gridpoints, coeffs = src._geometry
+    assert gridpoints.name in ops[1].arguments(time_M=8)
+    assert gridpoints.name not in ops[0].arguments(time_M=8)
+    assert coeffs.name not in ops[0].arguments(time_M=8)
+
+
 @pytest.mark.parametrize('shape', [(50, 50, 50)])
 def test_position(shape):
     t0 = 0.0  # Start time
@@ -703,6 +703,31 @@ class TestDependenceAnalysis(object):
         # Sanity check: we did find all of the expected dependences
         assert len(expected) == 0
 
+    def test_concatenate(self, ti0, ti1, ti3, fa):
+        """
+        Tests that the concatenation of Scopes detects the same dependences as
+        a Scope built from scratch over the same sequence of equations.
+        """
+        exprs = ['Eq(ti0[x,y,z], ti1[x,y,z])',
+                 'Eq(ti3[x,y,z], ti0[x+1,y-1,z])',
+                 'Eq(ti1[x,y,z], ti3[x,y,z+2])',
+                 'Eq(ti0[x,y,z], ti0[fa[x],y,z])']
+        exprs = [LoweredEq(i) for i in EVAL(exprs, ti0.base, ti1.base, ti3.base, fa)]
+
+        def summary(scope):
+            return sorted((type(d).__name__, d.function.name, d.source.timestamp,
+                           d.sink.timestamp, str(d.distance)) for d in scope.d_all)
+
+        scope = Scope(exprs)
+        scopes = [Scope(exprs[:1]), Scope(exprs[1:3]), Scope(exprs[3:])]
+        concatenated = Scope.concatenate(scopes)
+
+        assert concatenated.exprs == scope.exprs
+        assert summary(concatenated) == summary(scope)
+        for i in scope.d_all:
+            touched = scope.d_from_access((i.source,))
+            assert i in touched
+
 
 class TestAnalysis(object):
 
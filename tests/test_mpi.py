@@ -430,6 +430,57 @@ class TestSparseFunction(object):
         assert len(sf.data) == 1
         assert np.all(sf.data == data[sf.local_indices]*2)
 
+    @pytest.mark.parallel(mode=4)
+    @pytest.mark.parametrize('resident', [False, True])
+    def test_routing_plan(self, resident):
+        """
+        Test that the routing plan of the sparse data values is reused across
+        Operator applications until the sparse points move, while the sparse data
+        values are always up-to-date.
+        """
+        grid = Grid(shape=(4, 4), extent=(3.0, 3.0))
+
+        # Each MPI rank gets exactly one sparse point, on a grid point
+        coords = np.array([(3., 3.), (3., 0.), (0., 3.), (0., 0.)])
+        sf = SparseTimeFunction(name='sf', grid=grid, npoint=len(coords), nt=3,
+                                coordinates=coords)
+        u = TimeFunction(name='u', grid=grid)
+
+        op = Operator(sf.inject(field=u.forward, expr=sf))
+
+        try:
+            configuration['sparse-resident'] = resident
+
+            sf.data[:] = 1.
+            op.apply(time_M=0)
+            plan = sf._dist_plan
+            assert u.data.sum() == 1.
+
+            # Same sparse points, new sparse data values
+            u.data[:] = 0.
+            sf.data[:] = 2.
+            op.apply(time_M=0)
+            assert sf._dist_plan is plan
+            assert u.data.sum() == 2.
+            assert np.all(sf.data_ro_domain == 2.)
+
+            # No writes to the sparse data values in between, so with resident
+            # sparse data these aren't scattered again
+            resident0 = plan.resident
+            op.apply(time_M=0)
+            assert sf._dist_plan is plan
+            if resident:
+                assert plan.resident is resident0
+
+            # The sparse points move, so the plan must be rebuilt
+            u.data[:] = 0.
+            sf.coordinates.data[:] = coords[::-1]
+            op.apply(time_M=0)
+            assert sf._dist_plan is not plan
+            assert u.data.sum() == 2.
+        finally:
+            configuration['sparse-resident'] = 0
+
     @pytest.mark.parallel(mode=4)
     def test_sparse_coords(self):
         grid = Grid(shape=(21, 31, 21), extent=(20, 30, 20))
@@ -478,6 +529,25 @@ class TestOperatorSimple(object):
         else:
             assert np.all(f.data_ro_domain[0] == 7.)
 
+    @pytest.mark.parallel(mode=[2])
+    @switchconfig(jit_cache='broadcast')
+    def test_jit_cache_broadcast(self):
+        grid = Grid(shape=(32,))
+
+        f = TimeFunction(name='f', grid=grid)
+
+        # Make the code unique across runs, so that nothing is cached yet
+        value = float(grid.comm.bcast(np.random.randint(1e6), root=0))
+        op = Operator(Eq(f.forward, f + value))
+        assert op._jit_comm is grid.comm
+
+        op.apply(time_M=1)
+
+        assert np.all(f.data_ro_domain[0] == 2*value)
+        # The shared object compiled by rank 0 is available on all ranks
+        sofile = op._compiler.get_jit_dir().joinpath(op._soname).with_suffix('.so')
+        assert sofile.is_file()
+
     @pytest.mark.parallel(mode=[2])
     def test_trivial_eq_1d_asymmetric(self):
         grid = Grid(shape=(32,))
@@ -2093,6 +2163,27 @@ class TestOperatorAdvanced(object):
         op.apply(time_M=0, u=u3)
         assert np.all(u3.data[0, 3:-3, 3:-3] == 1.)
 
+    @pytest.mark.parallel(mode=2)
+    @switchconfig(profiling='trace')
+    def test_trace(self):
+        grid = Grid(shape=(10, 10))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        op = Operator(Eq(u.forward, u.dx + 1))
+
+        summary = op.apply(time_M=4)
+
+        # Each rank records one event per timestep for each section
+        events = summary.trace.to_numpy()
+        assert len(events) == 2*5*len(summary.trace.sections)
+        assert set(events['rank']) == {0, 1}
+        names = {summary.trace.sections[i] for i in events['section']}
+        assert any(i.startswith('haloupdate') for i in names)
+        assert 'section0' in names
+
+        trace = summary.trace.to_chrome()
+        assert {i['pid'] for i in trace['traceEvents']} == {0, 1}
+
 
 def gen_serial_norms(shape, so):
     """
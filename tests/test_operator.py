@@ -1,19 +1,23 @@
+import json
 import numpy as np
 import pytest
 from itertools import permutations
 
 from conftest import skipif
+import devito
 from devito import (Grid, Eq, Operator, Constant, Function, TimeFunction,
                     SparseFunction, SparseTimeFunction, Dimension, error, SpaceDimension,
                     NODE, CELL, dimensions, configuration, TensorFunction,
-                    TensorTimeFunction, VectorFunction, VectorTimeFunction, switchconfig)
+                    TensorTimeFunction, VectorFunction, VectorTimeFunction, switchconfig,
+                    compile_all)
 from devito import  Le, Lt, Ge, Gt  # noqa
-from devito.exceptions import InvalidOperator
+from devito.exceptions import InvalidArgument, InvalidOperator
 from devito.finite_differences.differentiable import diff2sympy
 from devito.ir.equations import ClusterizedEq
 from devito.ir.equations.algorithms import lower_exprs
 from devito.ir.iet import (Callable, Conditional, Expression, Iteration, TimedList,
                            FindNodes, IsPerfectIteration, retrieve_iteration_tree)
+from devito.operator.profiling import PerformanceSummary
 from devito.ir.support import Any, Backward, Forward
 from devito.passes.iet import DataManager
 from devito.symbolics import ListInitializer, indexify, retrieve_indexed
@@ -1875,3 +1879,410 @@ class TestLoopScheduling(object):
         assert tree[0].dim is time
         assert tree[1].dim is x
         assert tree[2].dim is y
+
+
+class TestAsyncCompilation(object):
+
+    def test_compile_async(self):
+        grid = Grid(shape=(4, 4))
+        u = TimeFunction(name='u', grid=grid)
+
+        op = Operator(Eq(u.forward, u + 1))
+
+        future = op.compile_async()
+        assert op.compile_async() is future
+        assert future.result() is op
+
+        op.apply(time_M=1)
+        assert np.all(u.data[0] == 2.)
+
+    def test_compile_all(self):
+        grid = Grid(shape=(4, 4))
+        u = TimeFunction(name='u', grid=grid)
+        v = TimeFunction(name='v', grid=grid)
+
+        ops = [Operator(Eq(u.forward, u + 1)),
+               Operator(Eq(v.forward, v + 2)),
+               Operator(Eq(u.forward, u + v))]
+
+        futures = compile_all(ops)
+        assert len(futures) == 3
+
+        # The application doesn't need to wait for the futures explicitly
+        ops[0].apply(time_M=0)
+        ops[1].apply(time_M=0)
+        assert [f.result() for f in futures] == ops
+        ops[2].apply(time_m=1, time_M=1)
+        assert np.all(u.data[0] == 3.)
+        assert np.all(v.data[1] == 2.)
+
+
+class TestSplitCompilation(object):
+
+    def test_split_vs_monolithic(self):
+        grid = Grid(shape=(16, 16, 16))
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        u1 = TimeFunction(name='u', grid=grid, space_order=2)
+        eq = Eq(u.forward, u.laplace + 1.)
+
+        op0 = Operator(eq, opt='advanced')
+        op1 = Operator(eq, opt='advanced', name='KernelSplit')
+
+        assert isinstance(op0._jit_code, str)
+        units = switchconfig(jit_split=True)(lambda: op1._jit_code)()
+        assert list(units) == [k for k, v in op1._func_table.items()
+                               if v.local] + [op1.name]
+        assert all(' %s(' % k in v for k, v in units.items())
+
+        op0.apply(time_M=2)
+        switchconfig(jit_split=True)(op1.apply)(time_M=2, u=u1)
+        assert np.all(u.data == u1.data)
+
+    @switchconfig(jit_split=True)
+    def test_split_cached_objects(self):
+        grid = Grid(shape=(16, 16, 16))
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        # Make the code unique across runs, so that nothing is cached yet
+        eq = Eq(u.forward, u.laplace + np.random.rand())
+
+        op0 = Operator(eq, opt='advanced')
+        objdir = op0._compiler.get_jit_dir().joinpath('objects')
+
+        op0.cfunction
+        nobjs = len(list(objdir.glob('*.o')))
+
+        # Only the kernel differs, so the efuncs' object files are reused
+        op1 = Operator(eq, opt='advanced', name='Kernel%d' % np.random.randint(1e9))
+        units = op1._jit_code
+        assert len(units) > 1
+        assert units['bf0'] == op0._jit_code['bf0']
+
+        op1.cfunction
+        assert len(list(objdir.glob('*.o'))) == nobjs + 1
+
+
+class TestJITCache(object):
+
+    def test_jit_cache_dir(self, tmpdir):
+        grid = Grid(shape=(4, 4))
+        u = TimeFunction(name='u', grid=grid)
+        # Make the code unique across runs, so that nothing is cached yet
+        eq = Eq(u.forward, u + np.random.rand())
+
+        op0 = switchconfig(jit_cache_dir=str(tmpdir))(Operator)(eq)
+        switchconfig(jit_cache_dir=str(tmpdir))(op0.apply)(time_M=0)
+        assert len(tmpdir.listdir()) == 1
+
+        # Shared objects are fetched from the cache directory, if available
+        sofile = op0._compiler.get_jit_dir().joinpath(op0._soname).with_suffix('.so')
+        sofile.unlink()
+        assert switchconfig(jit_cache_dir=str(tmpdir))(op0._compiler.jit_fetch)(
+            op0._soname
+        )
+        assert sofile.is_file()
+        assert not switchconfig(jit_cache_dir=str(tmpdir))(op0._compiler.jit_fetch)(
+            'dummy'
+        )
+
+
+class TestLoweringCache(object):
+
+    def test_lowering_cache(self, tmpdir):
+        def build(space_order):
+            grid = Grid(shape=(8, 8))
+            u = TimeFunction(name='u', grid=grid, space_order=space_order)
+            src = SparseTimeFunction(name='src', grid=grid, npoint=1, nt=5)
+            src.coordinates.data[:] = 0.5
+            src.data[:] = 1.
+            eqns = [Eq(u.forward, u.laplace + 1)] + src.inject(field=u.forward, expr=src)
+            return u, switchconfig(lowering_cache=True,
+                                   lowering_cache_dir=str(tmpdir))(Operator)(eqns)
+
+        u0, op0 = build(2)
+        assert not op0.build_summary.cached
+        assert ('lowering.Clusters', 'specializing.Clusters', 'cire') in op0.build_summary
+        assert len(tmpdir.listdir()) == 1
+
+        # Identical Operators, albeit over different objects, bypass lowering
+        u1, op1 = build(2)
+        assert op1.build_summary.cached
+        assert list(op1.build_summary) == [('lowering-cache',)]
+        assert str(op0) == str(op1)
+
+        op0.apply(time_M=3)
+        op1.apply(time_M=3)
+        assert np.any(u1.data != 0.)
+        assert np.all(u0.data == u1.data)
+
+        _, op2 = build(4)
+        assert not op2.build_summary.cached
+        assert len(tmpdir.listdir()) == 2
+
+    def test_lowering_cache_version(self, tmpdir):
+        """
+        Test that Operators stored by a different Devito version aren't retrieved.
+        """
+        grid = Grid(shape=(8, 8))
+        u = TimeFunction(name='u', grid=grid)
+        eqn = Eq(u.forward, u + 1)
+
+        build = switchconfig(lowering_cache=True, lowering_cache_dir=str(tmpdir))
+        assert not build(Operator)(eqn).build_summary.cached
+        assert build(Operator)(eqn).build_summary.cached
+
+        version = devito.__version__
+        try:
+            devito.__version__ = '0.0.0'
+            assert not build(Operator)(eqn).build_summary.cached
+        finally:
+            devito.__version__ = version
+        assert len(tmpdir.listdir()) == 2
+
+    def test_lowering_cache_profiling(self, tmpdir):
+        """
+        Test that Operators built under different profiling modes aren't
+        retrieved from one another's cache entry, since the profiler
+        instruments the IET.
+        """
+        grid = Grid(shape=(8, 8))
+        u = TimeFunction(name='u', grid=grid)
+        eqn = Eq(u.forward, u + 1)
+
+        def build(**kwargs):
+            return switchconfig(lowering_cache=True, lowering_cache_dir=str(tmpdir),
+                                **kwargs)(Operator)(eqn)
+
+        op0 = build(profiling='basic')
+        assert not op0.build_summary.cached
+
+        op1 = build(profiling='trace')
+        assert not op1.build_summary.cached
+        assert 'START_TRACE' in str(op1)
+        summary = op1.apply(time_M=1)
+        assert summary.trace is not None
+
+        op2 = build(profiling='trace')
+        assert op2.build_summary.cached
+        assert len(tmpdir.listdir()) == 2
+
+        op3 = build(profiling='trace', profiling_trace_size=8)
+        assert not op3.build_summary.cached
+        assert len(tmpdir.listdir()) == 3
+
+    def test_build_summary(self):
+        grid = Grid(shape=(4, 4))
+        u = TimeFunction(name='u', grid=grid)
+        op = Operator(Eq(u.forward, u.dx + 1))
+
+        summary = op.build_summary
+        assert not summary.cached
+        assert all(v >= 0. for v in summary.values())
+        assert summary.total >= summary[('lowering.Clusters',)]
+        assert summary.by_name['cire'] == \
+            summary[('lowering.Clusters', 'specializing.Clusters', 'cire')]
+
+
+class TestApplyBatch(object):
+
+    @pytest.mark.parametrize('nworkers', [1, 2, 4])
+    def test_apply_batch(self, nworkers):
+        grid = Grid(shape=(11, 11))
+        x, y = grid.dimensions
+
+        m = Function(name='m', grid=grid)
+        m.data[:] = 1.
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        src = SparseTimeFunction(name='src', grid=grid, npoint=1, nt=5)
+
+        eqns = [Eq(u.forward, u + m*u.laplace)]
+        eqns += src.inject(field=u.forward, expr=src)
+        op = Operator(eqns, opt=('advanced', {'openmp': True}))
+
+        batch = []
+        for i in range(4):
+            ui = TimeFunction(name='u', grid=grid, space_order=2)
+            srci = SparseTimeFunction(name='src', grid=grid, npoint=1, nt=5)
+            srci.coordinates.data[:] = 0.2 + 0.1*i
+            srci.data[:] = 1. + i
+            batch.append({'u': ui, 'src': srci, 'time_M': 3})
+
+        summaries = op.apply_batch(batch, nworkers=nworkers)
+        assert len(summaries) == 4
+
+        # Check against individual runs
+        for kwargs in batch:
+            u1 = TimeFunction(name='u', grid=grid, space_order=2)
+            op.apply(u=u1, src=kwargs['src'], time_M=3)
+            assert np.all(u1.data == kwargs['u'].data)
+            assert np.any(u1.data != 0.)
+
+    def test_apply_batch_shared_output(self):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid)
+        op = Operator(Eq(u.forward, u + 1))
+
+        with pytest.raises(ValueError):
+            op.apply_batch([{'time_M': 2}, {'time_M': 2}], nworkers=2)
+
+        # Sequential runs may write to the same object
+        op.apply_batch([{'time_M': 2}, {'time_M': 2}], nworkers=1)
+
+        v = TimeFunction(name='u', grid=grid)
+        op.apply(u=v, time_M=2)
+        op.apply(u=v, time_M=2)
+        assert np.all(u.data == v.data)
+
+
+class TestPreparedCall(object):
+
+    def test_segments(self):
+        grid = Grid(shape=(11, 11))
+
+        c = Constant(name='c')
+        u = TimeFunction(name='u', grid=grid, save=10, space_order=2)
+        src = SparseTimeFunction(name='src', grid=grid, npoint=1, nt=10)
+        src.coordinates.data[:] = 0.5
+        src.data[:] = 1.
+
+        eqns = [Eq(u.forward, u + c*u.laplace)]
+        eqns += src.inject(field=u.forward, expr=src)
+        op = Operator(eqns)
+
+        op.apply(c=0.1)
+        ref = np.array(u.data)
+
+        u.data[:] = 0.
+        call = op.prepare(c=0.1)
+        for i in range(3):
+            call.run(time_m=3*i, time_M=3*i+2)
+        call.finalize()
+        assert np.all(u.data == ref)
+
+        # Scalars can be changed on-the-fly
+        u.data[:] = 0.
+        call = op.prepare(c=0.)
+        call.run(c=0.1, time_M=8)
+        assert np.all(u.data == ref)
+
+    def test_replace_function(self):
+        grid = Grid(shape=(4, 4))
+
+        f = Function(name='f', grid=grid)
+        g = Function(name='g', grid=grid)
+        op = Operator(Eq(g, f + 1))
+
+        f1 = Function(name='f1', grid=grid)
+        f1.data[:] = 2.
+        call = op.prepare()
+        values = list(call._values)
+        call.run(f=f1)
+        assert np.all(g.data == 3.)
+        # Only the pointer to `f` has changed
+        assert [i is j for i, j in zip(values, call._values)].count(False) == 1
+
+        call.run(f=np.full(f._data_buffer.shape, 4., dtype=f.dtype))
+        assert np.all(g.data == 5.)
+
+        # A Function of different shape requires reprocessing all arguments
+        f2 = Function(name='f2', grid=grid, space_order=2)
+        f2.data[:] = 6.
+        call.run(f=f2)
+        v = np.array(g.data)
+        g.data[:] = 0.
+        op.apply(f=f2)
+        assert np.all(g.data == v)
+        assert np.all(g.data[1:, 1:] == 7.)
+
+    def test_oob(self):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid, save=5)
+        op = Operator(Eq(u.forward, u + 1))
+
+        call = op.prepare()
+        with pytest.raises(InvalidArgument):
+            call.run(time_M=10)
+
+
+class TestTraceProfiler(object):
+
+    @switchconfig(profiling='trace')
+    def test_trace(self, tmpdir):
+        grid = Grid(shape=(16, 16))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        op = Operator(Eq(u.forward, u.laplace + 1))
+        assert 'START_TRACE(section0)' in str(op)
+
+        summary = op.apply(time_M=9)
+
+        # One event per timestep
+        trace = summary.trace
+        assert trace.dropped == 0
+        events = trace.to_numpy()
+        assert len(events) == 10
+        assert all(trace.sections[i] == 'section0' for i in events['section'])
+        assert np.all(events['end'] >= events['start'])
+        assert np.all(np.diff(events['start']) > 0)
+        assert np.isclose(np.sum(events['end'] - events['start']),
+                          summary[('section0', None)].time, rtol=0.1, atol=1e-4)
+
+        # Chrome trace
+        filename = tmpdir.join('trace.json')
+        trace.to_chrome(str(filename))
+        with open(str(filename)) as f:
+            data = json.load(f)
+        events = [i for i in data['traceEvents'] if i['ph'] == 'X']
+        assert len(events) == 10
+        assert all(i['name'] == 'section0' for i in events)
+
+    @switchconfig(profiling='trace', profiling_trace_size=4)
+    def test_ring_buffer(self):
+        grid = Grid(shape=(16, 16))
+
+        u = TimeFunction(name='u', grid=grid)
+        op = Operator(Eq(u.forward, u + 1))
+
+        summary = op.apply(time_M=9)
+
+        # Only the most recent events are kept
+        trace = summary.trace
+        assert trace.dropped == 6
+        assert len(trace.to_numpy()) == 4
+        assert np.all(np.diff(trace.to_numpy()['start']) > 0)
+
+
+class TestCountersProfiler(object):
+
+    @switchconfig(profiling='counters', profiling_counters='task_clock,cycles')
+    def test_counters(self):
+        grid = Grid(shape=(16, 16))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        op = Operator(Eq(u.forward, u.laplace + 1))
+        assert 'START_COUNTER(section0,task_clock,counters)' in str(op)
+        assert 'STOP_COUNTER(section0,cycles,counters)' in str(op)
+
+        summary = op.apply(time_M=9)
+
+        # Unavailable counters (e.g., within virtual machines) are reported as None
+        counters = summary.counters[('section0', None)]
+        for i, fd in zip(['task_clock', 'cycles'], op._profiler.counters.fds):
+            if fd < 0:
+                assert counters[i] is None
+            else:
+                assert counters[i] > 0
+        assert set(counters) >= {'ipc', 'traffic', 'oi', 'gflopss'}
+
+    def test_derived_metrics(self):
+        summary = PerformanceSummary()
+        summary.add('section0', None, 2., 10**10, 10**6, 10**9, 10, [(10,)])
+        summary.add_counters('section0', None, {'cycles': 100, 'instructions': 250,
+                                                'llc_misses': 10**6, 'fp_ops': 8*10**9})
+
+        counters = summary.counters[('section0', None)]
+        assert counters['ipc'] == 2.5
+        assert counters['traffic'] == 64*10**6
+        assert np.isclose(counters['oi'], 10**10/(64*10**6))
+        assert counters['gflopss'] == 4.
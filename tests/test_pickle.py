@@ -353,6 +353,23 @@ def test_unjitted_operator():
     assert str(op) == str(new_op)
 
 
+def test_async_compiled_operator():
+    grid = Grid(shape=(3, 3, 3))
+    f = Function(name='f', grid=grid)
+
+    op = Operator(Eq(f, f + 1))
+    op.compile_async()
+
+    pkl_op = pickle.dumps(op)
+    new_op = pickle.loads(pkl_op)
+
+    assert str(op) == str(new_op)
+    assert new_op._jit_future is None
+
+    new_op.apply()
+    assert np.all(new_op.input[0].data == 1)
+
+
 def test_operator_function():
     grid = Grid(shape=(3, 3, 3))
     f = Function(name='f', grid=grid)
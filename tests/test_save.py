@@ -1,6 +1,8 @@
 import numpy as np
+import pytest
 
-from devito import Buffer, Grid, Eq, Operator, TimeFunction, solve
+from devito import Buffer, Grid, Eq, Operator, TimeFunction, configuration, solve
+from devito.data import MmapAllocator
 
 
 def initial(nt, nx, ny):
@@ -17,14 +19,16 @@ def initializer(data):
     data[:] = initial(*data.shape)
 
 
-def run_simulation(save=False, dx=0.01, dy=0.01, a=0.5, timesteps=100):
+def run_simulation(save=False, dx=0.01, dy=0.01, a=0.5, timesteps=100,
+                   allocator=None):
     nx, ny = int(1 / dx), int(1 / dy)
     dx2, dy2 = dx**2, dy**2
     dt = dx2 * dy2 / (2 * a * (dx2 + dy2))
 
     grid = Grid(shape=(nx, ny))
     u = TimeFunction(name='u', grid=grid, save=timesteps if save else None,
-                     initializer=initializer, time_order=1, space_order=2)
+                     initializer=initializer, time_order=1, space_order=2,
+                     allocator=allocator)
 
     eqn = Eq(u.dt, a * (u.dx2 + u.dy2))
     stencil = solve(eqn, u.forward)
@@ -38,6 +42,54 @@ def test_save():
     assert(np.array_equal(run_simulation(True), run_simulation()))
 
 
+def test_save_out_of_core():
+    allocator = MmapAllocator()
+    if not allocator.available():
+        pytest.skip("mmap not available")
+
+    assert np.array_equal(run_simulation(True, allocator=allocator),
+                          run_simulation())
+
+    # Apply piecewise, streaming through time windows
+    grid = Grid(shape=(40, 40), extent=(39., 39.))
+    u0 = TimeFunction(name='u0', grid=grid, save=40, space_order=2)
+    u1 = TimeFunction(name='u1', grid=grid, save=40, space_order=2,
+                      allocator=allocator)
+    for u in [u0, u1]:
+        u.data[0, 15:25, 15:25] = 1.
+
+    op0 = Operator(Eq(u0.forward, u0 + 0.1*u0.laplace))
+    op0.apply(time_M=38, dt=0.1)
+
+    op1 = Operator(Eq(u1.forward, u1 + 0.1*u1.laplace))
+    window = 8
+    for t in range(0, 39, window):
+        allocator.prefetch(u1, t + window, t + 2*window + 1)
+        op1.apply(time_m=t, time_M=min(t + window, 39) - 1, dt=0.1)
+        allocator.evict(u1, t - window, t)
+
+    assert np.all(u1.data == u0.data)
+
+
+def test_save_out_of_core_dir(tmpdir):
+    """Tests that the files backing out-of-core data go to `ooc-dir`."""
+    allocator = MmapAllocator()
+    if not allocator.available():
+        pytest.skip("mmap not available")
+
+    path = tmpdir.join('ooc')
+    grid = Grid(shape=(4, 4))
+    u = TimeFunction(name='u', grid=grid, save=3, allocator=allocator)
+    try:
+        configuration['ooc-dir'] = str(path)
+        u.data[:] = 1.
+    finally:
+        configuration['ooc-dir'] = None
+
+    assert path.check(dir=True)
+    assert np.all(u.data == 1.)
+
+
 def test_buffer_api():
     """Tests memory allocation with different values of ``save``."""
     grid = Grid(shape=(3, 3))